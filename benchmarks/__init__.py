@@ -0,0 +1,7 @@
+"""
+Benchmarks of pyARB, run from the repository root against the sources in `src`:
+
+    PYTHONPATH=src python -m benchmarks.startup --keys 5000 --locales 4 --output startup.json
+
+Every benchmark writes its results as JSON so they can be compared across releases.
+"""
@@ -0,0 +1,213 @@
+"""
+Render microbenchmarks: the time and peak memory of one render of every shape of message, through the
+runtime `Translator._localize` and through `inject_placeholders`, optionally compared against a baseline.
+
+    PYTHONPATH=src python -m benchmarks.render --output render.json
+    PYTHONPATH=src python -m benchmarks.render --baseline render.json --threshold 0.1
+"""
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import re
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from datetime import datetime
+
+from pyARB.localization_generator import ArbKey, generate_localizations
+from pyARB.localize import NumFormat, inject_placeholders
+
+from benchmarks.report import environment, write_results
+
+# key: (message, placeholder metadata, values by placeholder name)
+CASES = {
+    "plain": ("Cancel", {}, {}),
+    "interpolation": ("Joined {date}", {"date": {"type": "String"}}, {"date": "01/01/2023"}),
+    "interpolations": (
+        "{first} and {second} invited {third} to {group}",
+        {name: {"type": "String"} for name in ("first", "second", "third", "group")},
+        {"first": "Ann", "second": "Bob", "third": "Cid", "group": "Hikers"},
+    ),
+    "select": (
+        "{gender, select, male{He} female{She} other{They}} liked your post",
+        {"gender": {"type": "String"}},
+        {"gender": "female"},
+    ),
+    "pluralExact": (
+        "{count, plural, =0{No messages} =1{One message} other{# messages}}",
+        {"count": {"type": "int"}},
+        {"count": 1},
+    ),
+    "pluralCategory": (
+        "{count, plural, =0{No messages} one{# message} other{# messages}}",
+        {"count": {"type": "int"}},
+        {"count": 42},
+    ),
+    "pluralOffset": (
+        "{user} {count, plural, offset:1 =1{follows you} one{and # other follow you} other{and # others follow you}}",
+        {"user": {"type": "String"}, "count": {"type": "int"}},
+        {"user": "Ann", "count": 5},
+    ),
+    "selectInPlural": (
+        "{count, plural, one{{gender, select, male{his item} female{her item} other{their item}}} "
+        "other{{gender, select, male{his # items} female{her # items} other{their # items}}}}",
+        {"count": {"type": "int"}, "gender": {"type": "String"}},
+        {"count": 3, "gender": "male"},
+    ),
+    "escapedShorthand": (
+        "{count, plural, one{Ticket \\# # of one} other{Ticket \\# # of many}}",
+        {"count": {"type": "int"}},
+        {"count": 7},
+    ),
+    "dateTime": (
+        "Opened {date}",
+        {"date": {"type": "DateTime", "format": "yMMMd+jm"}},
+        {"date": datetime(2023, 1, 1, 16, 30)},
+    ),
+}
+# One message per number format
+CASES.update(
+    {
+        "format" + f.name[0].upper() + f.name[1:]: (
+            "{value}",
+            {"value": {"type": "double", "format": f.value}},
+            {"value": 1234567.891},
+        )
+        for f in NumFormat
+    }
+)
+
+# Compared metrics and the absolute change below which they are never a regression,
+# as the first render after tracing starts may allocate a few bytes more
+METRICS = {"ns_per_op": 1, "peak_bytes_per_op": 16}
+
+
+def _load_translator(directory: str):
+    arbs = os.path.join(directory, "arbs")
+    os.makedirs(arbs)
+    arb = {}
+    for key, (text, placeholders, _) in CASES.items():
+        arb[key] = text
+        arb["@" + key] = {"placeholders": placeholders}
+    with open(os.path.join(arbs, "en_US.arb"), "w", encoding="utf-8") as f:
+        json.dump(arb, f)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        generate_localizations(arbs, ["en_US"], directory)
+
+    path = os.path.join(directory, "generated_components.py")
+    spec = importlib.util.spec_from_file_location("generated_components", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def operations(module):
+    """
+    A render of every case through `Translator._localize` and through `inject_placeholders`, by case name.
+    """
+    lang = module.Lang.en_US
+    localize = module.Translator._localize
+    ops = {}
+    for key, (text, metadata, values) in CASES.items():
+        ops["localize/" + key] = lambda key=key, values=tuple(values.values()): localize(lang, key, values, None)
+        arb_key = ArbKey(key, text)
+        arb_key.process_metadata({"placeholders": metadata})
+        placeholders = [p.set(values[p.name]) for p in arb_key.placeholders or []]
+        ops["inject/" + key] = lambda text=text, placeholders=placeholders: inject_placeholders(text, *placeholders)
+    return ops
+
+
+def ns_per_op(op, repeat: int):
+    timer = timeit.Timer(op)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def peak_bytes_per_op(op, number: int = 200):
+    """
+    The traced peak a single render reaches above the memory held before it, averaged over `number` renders.
+    CPython does not count allocations, so this is not the total a render allocates: memory freed before the
+    peak is not counted.
+    """
+    op()
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(number):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            op()
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total / number
+
+
+def run(patterns: list, repeat: int):
+    results = {"benchmark": "render", "environment": environment(), "config": {"repeat": repeat}, "cases": {}}
+    with tempfile.TemporaryDirectory() as directory:
+        ops = operations(_load_translator(directory))
+        for name, op in ops.items():
+            if patterns and not any(re.search(p, name) for p in patterns):
+                continue
+            results["cases"][name] = {
+                "result": op(),
+                "ns_per_op": ns_per_op(op, repeat),
+                "peak_bytes_per_op": peak_bytes_per_op(op),
+            }
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float):
+    """
+    Prints every case next to its baseline and returns the regressions beyond `threshold`, a fraction.
+    """
+    regressions = []
+    print(f"{'case':<40} {'ns/op':>10} {'baseline':>10} {'change':>8} {'peak B':>8} {'baseline':>8}", file=sys.stderr)
+    for name, current in results["cases"].items():
+        if (base := baseline["cases"].get(name)) is None:
+            print(f"{name:<40} {current['ns_per_op']:>10.0f} {'new':>10}", file=sys.stderr)
+            continue
+        change = current["ns_per_op"] / base["ns_per_op"] - 1
+        print(
+            f"{name:<40} {current['ns_per_op']:>10.0f} {base['ns_per_op']:>10.0f} {change:>+8.1%} "
+            f"{current['peak_bytes_per_op']:>8.0f} {base['peak_bytes_per_op']:>8.0f}",
+            file=sys.stderr,
+        )
+        for metric, slack in METRICS.items():
+            if current[metric] > base[metric] * (1 + threshold) and current[metric] - base[metric] > slack:
+                regressions.append(f"{name}: {metric} {base[metric]:.0f} -> {current[metric]:.0f}")
+        if current["result"] != base["result"]:
+            regressions.append(f"{name}: renders {current['result']!r} instead of {base['result']!r}")
+    return regressions
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description=" ".join(__doc__.strip().split("\n\n")[0].split()))
+    parser.add_argument("--case", action="append", help="Only run cases matching this regex. Can be repeated.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per case; the fastest is reported.")
+    parser.add_argument("--baseline", help="JSON written by an earlier run to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Fail when a case is this much slower or peaks this much higher than the baseline (0.1 = 10%%).",
+    )
+    parser.add_argument("--output", help="JSON file to write. Defaults to stdout.")
+    args = parser.parse_args(argv)
+
+    results = run(args.case, args.repeat)
+    write_results(results, args.output)
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.loads(f.read()), args.threshold)
+        if regressions:
+            print("\nRegressions:", *regressions, sep="\n  ", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
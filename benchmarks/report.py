@@ -0,0 +1,34 @@
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+
+
+def environment():
+    """
+    What a result was measured with, so results from different releases and machines can be told apart.
+    """
+    try:
+        pyarb = version("pyARB")
+    except PackageNotFoundError:
+        pyarb = "unknown"
+    return {
+        "pyarb": pyarb,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def write_results(results: dict, output: str = None):
+    """
+    Writes `results` as JSON to `output`, or to stdout if no file is given.
+    """
+    text = json.dumps(results, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
@@ -0,0 +1,175 @@
+"""
+Startup and memory benchmark of the whole localization pipeline on a synthetic catalog:
+generating the module (from scratch and again with nothing changed), importing it in a fresh
+interpreter (without and with its `.pyc`), and reading and compiling every locale's arb file.
+
+    PYTHONPATH=src python -m benchmarks.startup --keys 5000 --locales 4 --mode runtime --mode lazy
+"""
+import argparse
+import contextlib
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from enum import Enum
+
+import pyARB
+from pyARB.localization_generator import generate_localizations
+from pyARB.localize import Translations, log
+
+from benchmarks.report import environment, write_results
+from benchmarks.synthetic import DEFAULT_MIX, SyntheticCatalog, parse_mix
+
+# Options of `generate_localizations` measured by each mode
+MODES = {
+    "runtime": {},
+    "specialize": {"specialize": True},
+    "catalog": {"binary_catalog": True},
+    "lazy": {"lazy_methods": True},
+}
+
+_IMPORT = (
+    "import sys, time\n"
+    "sys.path.insert(0, sys.argv[1])\n"
+    "start = time.perf_counter()\n"
+    "import generated_components\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def _quiet(function, *args, **kwargs):
+    # The generator reports its progress on stdout and stderr
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        return function(*args, **kwargs)
+
+
+def time_generation(arbs: str, locales: list[str], target: str, options: dict, repeat: int):
+    fresh, unchanged = [], []
+    for _ in range(repeat):
+        for name in os.listdir(target):
+            if name.startswith("generated_components"):
+                os.remove(os.path.join(target, name))
+        start = time.perf_counter()
+        _quiet(generate_localizations, arbs, locales, target, **options)
+        fresh.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        _quiet(generate_localizations, arbs, locales, target, **options)
+        unchanged.append(time.perf_counter() - start)
+    return {"generate_s": statistics.median(fresh), "regenerate_unchanged_s": statistics.median(unchanged)}
+
+
+def time_import(target: str, repeat: int):
+    """
+    Import time of the generated module in a fresh interpreter, first without its `.pyc` and then with it.
+    """
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(os.path.abspath(pyARB.__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    # The cold import has to leave its .pyc behind for the warm one
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    cold, warm = [], []
+    for _ in range(repeat):
+        shutil.rmtree(os.path.join(target, "__pycache__"), ignore_errors=True)
+        for samples in (cold, warm):
+            result = subprocess.run(
+                [sys.executable, "-c", _IMPORT, target], env=env, capture_output=True, text=True, check=True
+            )
+            samples.append(float(result.stdout.strip().splitlines()[-1]))
+    return {"import_cold_s": statistics.median(cold), "import_warm_s": statistics.median(warm)}
+
+
+def measure_translations(arbs: str, locales: list[str], repeat: int):
+    """
+    Time to read and compile each locale, and the memory its table keeps, with the primary locale loaded first.
+    Memory is traced in a separate pass so tracing does not slow down the timed one.
+    """
+    languages = Enum("Lang", {l: l for l in locales})
+    times = {l: [] for l in locales}
+    for _ in range(repeat):
+        translations = Translations(arbs, languages)
+        for lang in languages:
+            start = time.perf_counter()
+            translations.preload(lang)
+            times[lang.name].append(time.perf_counter() - start)
+
+    results = {}
+    translations = Translations(arbs, languages)
+    tracemalloc.start()
+    try:
+        for lang in languages:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            translations.preload(lang)
+            current, peak = tracemalloc.get_traced_memory()
+            results[lang.name] = {
+                "load_s": statistics.median(times[lang.name]),
+                "memory_bytes": current - before,
+                "peak_bytes": peak - before,
+            }
+    finally:
+        tracemalloc.stop()
+    return {"read_translations_s": sum(r["load_s"] for r in results.values()), "locales": results}
+
+
+def run(catalog: SyntheticCatalog, modes: list[str], repeat: int):
+    # Synthetic locales with partial coverage would report their missing keys on every run
+    log.disabled = True
+    results = {"benchmark": "startup", "environment": environment(), "config": catalog.config(), "modes": {}}
+    with tempfile.TemporaryDirectory() as target:
+        arbs = os.path.join(target, "arbs")
+        locales = catalog.write(arbs)
+        results["arb_bytes"] = sum(os.path.getsize(os.path.join(arbs, l + ".arb")) for l in locales)
+        results["translations"] = measure_translations(arbs, locales, repeat)
+        for mode in modes:
+            measured = time_generation(arbs, locales, target, MODES[mode], repeat)
+            measured.update(time_import(target, repeat))
+            measured["module_bytes"] = os.path.getsize(os.path.join(target, "generated_components.py"))
+            results["modes"][mode] = measured
+    return results
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description=" ".join(__doc__.strip().split("\n\n")[0].split()))
+    parser.add_argument("--keys", type=int, default=1000, help="Number of keys in the catalog.")
+    parser.add_argument("--locales", type=int, default=3, help="Number of locales.")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="Weights of the placeholder kinds, e.g. string=3,int=1,compact=1. "
+        "Kinds: string, int, double, compact, currency, percent.",
+    )
+    parser.add_argument("--max-placeholders", type=int, default=3, help="Most placeholders per key.")
+    parser.add_argument("--branching", type=float, default=0.25, help="Share of keys with selects and plurals.")
+    parser.add_argument("--depth", type=int, default=1, help="Nesting depth of the selects and plurals.")
+    parser.add_argument("--coverage", type=float, default=1.0, help="Share of keys the other locales translate.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--mode",
+        action="append",
+        choices=list(MODES),
+        help="Kind of generated module to measure. Can be repeated. Defaults to runtime.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the median is reported.")
+    parser.add_argument("--output", help="JSON file to write. Defaults to stdout.")
+    args = parser.parse_args(argv)
+
+    catalog = SyntheticCatalog(
+        keys=args.keys,
+        locales=args.locales,
+        mix=args.mix,
+        max_placeholders=args.max_placeholders,
+        branching=args.branching,
+        depth=args.depth,
+        coverage=args.coverage,
+        seed=args.seed,
+    )
+    write_results(run(catalog, args.mode or ["runtime"], args.repeat), args.output)
+
+
+if __name__ == "__main__":
+    main()
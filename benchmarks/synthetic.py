@@ -0,0 +1,146 @@
+import json
+import os
+import random
+
+LOCALES = [
+    "en_US",
+    "es_ES",
+    "pt_BR",
+    "fr_FR",
+    "de_DE",
+    "it_IT",
+    "nl_NL",
+    "sv_SE",
+    "pl_PL",
+    "tr_TR",
+    "ru_RU",
+    "ja_JP",
+    "ko_KR",
+    "zh_CN",
+    "ar_SA",
+    "hi_IN",
+]
+
+# Metadata every kind of placeholder is declared with
+PLACEHOLDER_KINDS = {
+    "string": {"type": "String"},
+    "int": {"type": "int"},
+    "double": {"type": "double", "format": "decimalPattern"},
+    "compact": {"type": "int", "format": "compact"},
+    "currency": {"type": "double", "format": "simpleCurrency"},
+    "percent": {"type": "double", "format": "decimalPercentPattern"},
+}
+
+DEFAULT_MIX = {"string": 3, "int": 1, "double": 1, "compact": 1, "currency": 1, "percent": 1}
+
+
+def locale_names(count: int):
+    """
+    `count` locale names, real ones first.
+    """
+    return LOCALES[:count] + [f"x{i}_XX" for i in range(count - len(LOCALES))]
+
+
+def parse_mix(text: str):
+    """
+    Placeholder mix from the command line, e.g. `string=3,int=1,compact=2`.
+    """
+    mix = {}
+    for item in text.split(","):
+        kind, _, weight = item.partition("=")
+        if kind.strip() not in PLACEHOLDER_KINDS:
+            raise ValueError(f"Unknown placeholder kind `{kind}`, expected one of {', '.join(PLACEHOLDER_KINDS)}")
+        mix[kind.strip()] = float(weight or 1)
+    return mix
+
+
+class SyntheticCatalog:
+    """
+    A reproducible set of arb files.
+
+    Every key gets up to `max_placeholders` placeholders drawn from `mix`, and a share `branching` of the
+    keys also gets selects and plurals nested `depth` deep (alternating plural, select, plural...), each
+    level inside the `other` case of the one above. Locales after the primary one translate a share
+    `coverage` of the keys, so the rest exercises the fallback.
+    """
+
+    def __init__(
+        self,
+        keys: int = 1000,
+        locales: int = 3,
+        mix: dict[str, float] = None,
+        max_placeholders: int = 3,
+        branching: float = 0.25,
+        depth: int = 1,
+        coverage: float = 1.0,
+        seed: int = 0,
+    ):
+        self.keys = keys
+        self.locales = locale_names(locales)
+        self.mix = mix or DEFAULT_MIX
+        self.max_placeholders = max_placeholders
+        self.branching = branching
+        self.depth = depth
+        self.coverage = coverage
+        self.seed = seed
+
+    def config(self):
+        return {
+            "keys": self.keys,
+            "locales": len(self.locales),
+            "mix": self.mix,
+            "max_placeholders": self.max_placeholders,
+            "branching": self.branching,
+            "depth": self.depth,
+            "coverage": self.coverage,
+            "seed": self.seed,
+        }
+
+    def _branch(self, level: int, placeholders: dict):
+        if level == self.depth:
+            return ""
+        inner = self._branch(level + 1, placeholders)
+        if level % 2 == 0:
+            name = f"count{level}"
+            placeholders[name] = {"type": "int"}
+            return f"{{{name}, plural, =0{{none}} =1{{one}} few{{# few}} other{{# many{inner}}}}}"
+        name = f"kind{level}"
+        placeholders[name] = {"type": "String"}
+        return f"{{{name}, select, first{{First}} second{{Second}} other{{Other{inner}}}}}"
+
+    def entries(self):
+        """
+        The entries of the primary arb file, metadata included.
+        """
+        rng = random.Random(self.seed)
+        kinds, weights = list(self.mix), list(self.mix.values())
+        arb = {"@@locale": self.locales[0]}
+        for i in range(self.keys):
+            placeholders = {}
+            for j, kind in enumerate(rng.choices(kinds, weights, k=rng.randint(0, self.max_placeholders))):
+                placeholders[f"{kind}{j}"] = dict(PLACEHOLDER_KINDS[kind])
+            text = f"Entry {i}" + "".join(f" {{{name}}}" for name in placeholders)
+            if rng.random() < self.branching:
+                text += " " + self._branch(0, placeholders)
+            arb[f"key{i}"] = text
+            arb[f"@key{i}"] = {"description": f"Synthetic entry {i}", "placeholders": placeholders}
+        return arb
+
+    def write(self, directory: str):
+        """
+        Writes one arb file per locale into `directory` and returns the locale names, primary first.
+        """
+        os.makedirs(directory, exist_ok=True)
+        primary = self.entries()
+        rng = random.Random(self.seed + 1)
+        for n, locale in enumerate(self.locales):
+            if n == 0:
+                arb = primary
+            else:
+                arb = {"@@locale": locale}
+                for k, v in primary.items():
+                    if not k.startswith("@") and rng.random() < self.coverage:
+                        arb[k] = f"[{locale}] {v}"
+            with open(os.path.join(directory, locale + ".arb"), "w", encoding="utf-8") as f:
+                json.dump(arb, f, ensure_ascii=False, indent=2)
+        return list(self.locales)
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pyARB.localization_generator import generate_localizations
 
 if __name__ == "__main__":
@@ -5,9 +7,10 @@ if __name__ == "__main__":
 
     from pyARB.localization.generated_components import Translator, Lang
 
+    opened = datetime(2023, 1, 1, 16, 30)
     t = Translator(Lang.en_US)
     print(t.no())
-    print(t.investment_created_at("01/01/2023", "4:30 PM"))
+    print(t.investment_created_at(opened, opened))
     print(t.followers_count(1000))
     print(t.followers_count(999))
     print(t.followers_count(6513443))
@@ -27,7 +30,7 @@ if __name__ == "__main__":
     t = Translator("es_ES")
     print(t.france())
     print(t.no())
-    print(t.investment_created_at("01/01/2023", "4:30 PM"))
+    print(t.investment_created_at(opened, opened))
     print(t.followers_count(1550))
     print(t.followers_count(9989))
     print(t.followers_count(651443))
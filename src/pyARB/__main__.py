@@ -1,7 +1,9 @@
 import argparse
 import os
+import sys
 
-from pyARB.localization_generator import generate_localizations
+from pyARB.check import check_localizations
+from pyARB.localization_generator import generate_localizations, watch_localizations
 
 
 def main():
@@ -27,6 +29,68 @@ def main():
         "--use-existing",
         help="Use existing arb files as locale list. You must specify the primary arb here",
     )
+    arb_parser.add_argument(
+        "-s",
+        "--specialize",
+        action="store_true",
+        help="Generate a dedicated render function for every locale and key "
+        "instead of reading the arb files at runtime.",
+    )
+    arb_parser.add_argument(
+        "-b",
+        "--binary-catalog",
+        action="store_true",
+        help="Write the compiled translations to a binary catalog that the generated file maps into memory.",
+    )
+    arb_parser.add_argument(
+        "-f",
+        "--fallback",
+        action="append",
+        default=[],
+        metavar="LOCALE:FALLBACK[,FALLBACK...]",
+        help="Locales to try, in order, when LOCALE lacks a key, e.g. es_MX:es_ES. "
+        "Can be given once per locale. The primary locale is always tried last. "
+        "LOCALE may also be a tag without an arb file, e.g. ca:es_ES, to have `negotiate` resolve it.",
+    )
+    arb_parser.add_argument(
+        "-l",
+        "--lazy-methods",
+        action="store_true",
+        help="Create the methods of every key on first use instead of writing them into the generated file.",
+    )
+    arb_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes parsing the arb files of the locales. 0 uses one per core.",
+    )
+    arb_parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate whenever an arb file changes.",
+    )
+
+    check_parser = subparsers.add_parser(
+        "check", help="Compile every translation and compare its placeholders with the primary arb file"
+    )
+    check_parser.add_argument("arb_location", help="The directory containing the arb files.")
+    check_parser.add_argument(
+        "primary", help="The primary locale, e.g. en_US. Every other arb file is checked against it."
+    )
+    check_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes checking the arb files of the locales. 0 uses one per core.",
+    )
+    check_parser.add_argument(
+        "--cache",
+        help="File keeping the results of unchanged arb files. Defaults to pyarb.check.json above arb_location.",
+    )
+    check_parser.add_argument("--no-cache", action="store_true", help="Check every arb file again.")
 
     args = parser.parse_args()
 
@@ -69,7 +133,47 @@ def main():
 
         print("\u001b[32mLocales:", *locales, "\u001b[0m\n")
 
-        generate_localizations(args.arb_location, locales, target_directory=args.target_directory)
+        fallbacks = {}
+        for chain in args.fallback:
+            locale, _, rest = chain.partition(":")
+            fallbacks[locale.strip()] = [l.strip() for l in rest.split(",") if l.strip()]
+
+        options = dict(
+            target_directory=args.target_directory,
+            specialize=args.specialize,
+            binary_catalog=args.binary_catalog,
+            fallbacks=fallbacks,
+            lazy_methods=args.lazy_methods,
+            workers=args.jobs or None,
+        )
+        if args.watch:
+            watch_localizations(args.arb_location, locales, **options)
+        else:
+            generate_localizations(args.arb_location, locales, **options)
+
+    if args.command == "check":
+        locales = sorted(f[: f.find(".")] for f in os.listdir(args.arb_location) if ".arb" in f)
+        locales.remove(args.primary)
+        locales.insert(0, args.primary)
+        results = check_localizations(
+            args.arb_location,
+            locales,
+            cache=not args.no_cache,
+            cache_path=args.cache,
+            workers=args.jobs or None,
+        )
+        checked = len(results["checked"])
+        print(f"Checked {checked} locales, {len(results['problems']) - checked} unchanged")
+        errors = 0
+        for locale, problems in results["problems"].items():
+            for problem in problems:
+                color = "31" if problem["level"] == "error" else "33"
+                where = f"{locale} -> {problem['key']}" if problem["key"] else locale
+                print(f"\u001b[{color}m{problem['level']}: {where}: {problem['message']}\u001b[0m")
+                errors += problem["level"] == "error"
+        if errors:
+            print(f"\u001b[31m{errors} errors\u001b[0m")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
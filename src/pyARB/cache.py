@@ -0,0 +1,89 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+_MISSING = object()
+
+
+class RenderCache:
+    """
+    Bounded LRU cache of rendered strings keyed on the lang, the arb key and the placeholder values
+    (including any overridden optional parameters).
+
+    Keys in `exclude` are never cached, which is meant for messages whose values rarely repeat.
+    Hit, miss and eviction counters are kept so the cache can be sized from `stats()`.
+    """
+
+    def __init__(self, maxsize: int = 4096, exclude: Iterable[str] = ()):
+        self.maxsize = maxsize
+        self.exclude = set(exclude)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by `invalidate` so renders that started before it do not store stale strings
+        self._generation = 0
+
+    def render(self, lang, key: str, values: tuple, options: Optional[dict], render: Callable[..., str]):
+        """
+        Returns the cached string for these values and options,
+        or renders and stores it with `render(lang, key, values, options)`.
+        """
+        try:
+            # Values are keyed with their type, as 1, 1.0 and True are equal but render differently
+            cache_key = (lang, key, *[(v.__class__, v) for v in values])
+            if options:
+                cache_key += tuple(
+                    (name, *[(k, v.__class__, v) for k, v in overrides.items()]) for name, overrides in options.items()
+                )
+            hash(cache_key)
+        except TypeError:
+            # Unhashable placeholder values cannot be cached
+            return render(lang, key, values, options)
+
+        with self._lock:
+            rendered = self._entries.get(cache_key, _MISSING)
+            if rendered is not _MISSING:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return rendered
+            self.misses += 1
+            generation = self._generation
+
+        rendered = render(lang, key, values, options)
+        with self._lock:
+            if generation == self._generation:
+                self._entries[cache_key] = rendered
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return rendered
+
+    def stats(self):
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / requests if requests else 0.0,
+            }
+
+    def invalidate(self):
+        """
+        Drops every cached string, keeping the counters. Used when the translations change.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
@@ -0,0 +1,421 @@
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from enum import Enum
+from typing import Callable, Optional, Type, Union
+
+from pyARB.exceptions import InvalidFormat
+from pyARB.localize import log, fallback_chains, lang_fallbacks, Message, Argument, Shorthand, Select, Plural
+
+# Layout of a catalog. Everything but the string data is little-endian uint32 words.
+#
+#   header           magic, version and the word offsets of the sections below
+#   string offsets   n_strings + 1 byte offsets into the string data
+#   keys             n_keys string ids, sorted by their utf-8 bytes
+#   locales          n_locales pairs of (name string id, word offset of the locale's index)
+#   indexes          one per locale: n_keys word offsets into the ops, MISSING if the locale lacks the key
+#   ops              the compiled messages
+#   string data      every distinct string, utf-8 encoded
+#
+# A message is encoded as `text_id, part count, parts...` where each part is one of
+#   LITERAL string_id
+#   ARGUMENT name_id locale_id
+#   SHORTHAND
+#   SELECT name_id source_id case_count (key_id part_count parts...)...
+#   PLURAL name_id source_id locale_id offset case_count (key_id part_count parts...)...
+#
+# where locale_id is the locale whose number formats and plural rules the part uses, or the empty string.
+
+MAGIC = b"PYARBCAT"
+VERSION = 3
+MISSING = 0xFFFFFFFF
+
+LITERAL = 0
+ARGUMENT = 1
+SHORTHAND_OP = 2
+SELECT = 3
+PLURAL = 4
+
+_HEADER = struct.Struct("<8s8I")
+
+
+class _CatalogWriter:
+    def __init__(self):
+        self.strings: dict[str, int] = {}
+        self.ops = array("I")
+
+    def string(self, text: str):
+        if (i := self.strings.get(text)) is None:
+            i = self.strings[text] = len(self.strings)
+        return i
+
+    def write_parts(self, parts: tuple):
+        ops = self.ops
+        ops.append(len(parts))
+        for part in parts:
+            if isinstance(part, str):
+                ops.extend((LITERAL, self.string(part)))
+            elif isinstance(part, Argument):
+                ops.extend((ARGUMENT, self.string(part.name), self.string(part.locale or "")))
+            elif isinstance(part, Shorthand):
+                ops.append(SHORTHAND_OP)
+            elif isinstance(part, Select):
+                ops.extend((SELECT, self.string(part.name), self.string(part.source), len(part.cases)))
+                for key, case in part.cases.items():
+                    ops.append(self.string(key))
+                    self.write_parts(case)
+            else:
+                cases = {"=" + str(k): v for k, v in part.exact.items()}
+                cases.update(part.cases)
+                offset = part.offset & MISSING
+                locale = self.string(part.locale or "")
+                ops.extend((PLURAL, self.string(part.name), self.string(part.source), locale, offset, len(cases)))
+                for key, case in cases.items():
+                    ops.append(self.string(key))
+                    self.write_parts(case)
+
+    def write_message(self, message: Message):
+        offset = len(self.ops)
+        self.ops.append(self.string(message.text))
+        self.write_parts(message.parts)
+        return offset
+
+
+def write_catalog(path: str, tables: dict[str, dict[str, Message]]):
+    """
+    Writes the compiled messages of every locale into a single binary catalog
+    that `load_catalog` can map into memory.
+    """
+    with open(path, "wb") as f:
+        f.write(catalog_bytes(tables))
+
+
+def catalog_bytes(tables: dict[str, dict[str, Message]]):
+    """
+    The contents of the catalog `write_catalog` would write for these tables.
+    """
+    writer = _CatalogWriter()
+    keys = sorted({k for table in tables.values() for k in table}, key=lambda k: k.encode("utf-8"))
+    key_ids = array("I", (writer.string(k) for k in keys))
+    locale_ids = [writer.string(name) for name in tables]
+
+    indexes = []
+    for table in tables.values():
+        index = array("I", (writer.write_message(table[k]) if k in table else MISSING for k in keys))
+        indexes.append(index)
+
+    blob = bytearray()
+    string_offsets = array("I", [0])
+    for text in writer.strings:
+        blob += text.encode("utf-8")
+        string_offsets.append(len(blob))
+
+    # Word offsets of every section
+    strings_at = _HEADER.size // 4
+    keys_at = strings_at + len(string_offsets)
+    locales_at = keys_at + len(key_ids)
+    indexes_at = locales_at + 2 * len(locale_ids)
+    ops_at = indexes_at + len(keys) * len(indexes)
+    blob_at = (ops_at + len(writer.ops)) * 4
+
+    locales = array("I")
+    for i, name_id in enumerate(locale_ids):
+        locales.extend((name_id, indexes_at + i * len(keys)))
+    index_words = array("I")
+    for index in indexes:
+        for offset in index:
+            index_words.append(offset if offset == MISSING else ops_at + offset)
+
+    header = _HEADER.pack(
+        MAGIC, VERSION, len(writer.strings), len(keys), len(locale_ids), strings_at, keys_at, locales_at, blob_at
+    )
+    data = bytearray(header)
+    for words in (string_offsets, key_ids, locales, index_words, writer.ops):
+        if sys.byteorder == "big":
+            words.byteswap()
+        data += words.tobytes()
+    data += blob
+    return bytes(data)
+
+
+class MappedLocale:
+    """
+    The messages of one locale in a mapped catalog, merged with its fallback chain. Messages are decoded
+    from the shared pages the first time they are used and kept for this process afterwards.
+    """
+
+    def __init__(self, catalog: "MappedCatalog", name: str, index: array):
+        self.catalog = catalog
+        self.name = name
+        self.index = index
+        self._messages: dict[str, Message] = {}
+
+    def _offset(self, key: str):
+        if (i := self.catalog.key_index(key)) is None:
+            return MISSING
+        return self.index[i]
+
+    def __contains__(self, key: str):
+        return key in self._messages or self._offset(key) != MISSING
+
+    def __getitem__(self, key: str):
+        try:
+            return self._messages[key]
+        except KeyError:
+            pass
+        if (offset := self._offset(key)) == MISSING:
+            raise KeyError(key)
+        message = self._messages[key] = self.catalog.decode_message(offset)
+        return message
+
+    def get(self, key: str, default=None):
+        if (message := self._messages.get(key)) is not None:
+            return message
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [k for i, k in enumerate(self.catalog.keys()) if self.index[i] != MISSING]
+
+
+class MappedCatalog:
+    """
+    A catalog written by `write_catalog`, mapped read-only so every process
+    that opens the same file shares its physical pages. Messages are decoded into python objects of the
+    process the first time they are rendered, see `decode_message`.
+
+    Exposes the same lookups as `Translations`: `lang in catalog` and `catalog[lang][key]`.
+    Opening it only maps the file and reads its header and locale table. The index of a locale is merged with
+    its fallback chain the first time the locale is used; a locale with every key reads the file's index as is.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        languages: Type[Enum],
+        default: Optional[Enum] = None,
+        fallbacks: Optional[dict] = None,
+    ):
+        if sys.byteorder == "big":
+            raise InvalidFormat("Mapped catalogs are only supported on little-endian machines")
+        self.path = path
+        self.languages = languages
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_strings, n_keys, n_locales, strings_at, keys_at, locales_at, blob_at = _HEADER.unpack_from(
+            self._mmap
+        )
+        if magic != MAGIC or version != VERSION:
+            raise InvalidFormat(f"{path} is not a version {VERSION} pyARB catalog")
+        self.words = memoryview(self._mmap)[:blob_at].cast("I")
+        self.n_keys = n_keys
+        self.strings_at = strings_at
+        self.keys_at = keys_at
+        self.blob_at = blob_at
+        self._key_indexes: dict[str, int] = {}
+        self._decoded: dict[int, Message] = {}
+
+        # Word offset of the index of every locale the catalog has
+        self._indexes: dict[Enum, int] = {}
+        names = {lang.name: lang for lang in languages}
+        for i in range(n_locales):
+            name = self.string(self.words[locales_at + 2 * i])
+            if name in names:
+                self._indexes[names[name]] = self.words[locales_at + 2 * i + 1]
+
+        self.default = default if default is not None else next(iter(languages))
+        self.chains: dict[Enum, tuple[Enum, ...]] = fallback_chains(
+            languages, self.default, lang_fallbacks(languages, fallbacks)
+        )
+        self._locales: dict[Enum, Optional[MappedLocale]] = {}
+        self._locks = {lang: threading.Lock() for lang in languages}
+        # Positions in the key table of the keys each locale takes from its fallback chain
+        self._fallback_keys: dict[Enum, set[int]] = {}
+        self._unresolved: set[str] = set()
+        # Called with the lang, the key, the select and its value when a select falls through to `other`
+        self.select_fallthrough_hook: Optional[Callable] = None
+
+    def _merge(self, lang: Enum):
+        chain_at = [self._indexes[l] for l in self.chains[lang] if l in self._indexes]
+        if not chain_at:
+            return None
+        index = self.words[chain_at[0] : chain_at[0] + self.n_keys]
+        holes = [i for i, offset in enumerate(index) if offset == MISSING]
+        if holes and len(chain_at) > 1:
+            # Only a locale missing keys gets a private copy of its index; the others read the file's pages
+            index = array("I", index)
+            for i in holes:
+                for at in chain_at[1:]:
+                    if (offset := self.words[at + i]) != MISSING:
+                        index[i] = offset
+                        break
+        if lang in self._indexes:
+            missing = [i for i in holes if index[i] != MISSING]
+        else:
+            missing = [i for i, offset in enumerate(index) if offset != MISSING]
+        self._fallback_keys[lang] = set(missing)
+        if missing and lang in self._indexes:
+            log.warn(
+                f"{lang.name} is missing {len(missing)} keys, "
+                f"using {' -> '.join(l.name for l in self.chains[lang][1:])}: "
+                + ", ".join(self.string(self.words[self.keys_at + i]) for i in missing)
+            )
+        return MappedLocale(self, lang.name, index)
+
+    def _load(self, lang: Enum):
+        try:
+            return self._locales[lang]
+        except KeyError:
+            pass
+        with self._locks[lang]:
+            if lang not in self._locales:
+                self._locales[lang] = self._merge(lang)
+        return self._locales[lang]
+
+    def _lang(self, lang: Union[Enum, str]):
+        return self.languages(lang) if isinstance(lang, str) else lang
+
+    def string(self, i: int):
+        return self._string_bytes(i).decode("utf-8")
+
+    def _string_bytes(self, i: int):
+        start = self.blob_at + self.words[self.strings_at + i]
+        return self._mmap[start : self.blob_at + self.words[self.strings_at + i + 1]]
+
+    def keys(self):
+        return [self.string(self.words[self.keys_at + i]) for i in range(self.n_keys)]
+
+    def key_index(self, key: str):
+        """
+        Binary search of the sorted key table. Found positions are remembered.
+        """
+        if (i := self._key_indexes.get(key)) is not None:
+            return i
+        target = key.encode("utf-8")
+        lo, hi = 0, self.n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._string_bytes(self.words[self.keys_at + mid]) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.n_keys and self._string_bytes(self.words[self.keys_at + lo]) == target:
+            self._key_indexes[key] = lo
+            return lo
+        return None
+
+    def _decode_parts(self, at: int):
+        words = self.words
+        parts = []
+        count = words[at]
+        at += 1
+        for _ in range(count):
+            op = words[at]
+            if op == LITERAL:
+                parts.append(self.string(words[at + 1]))
+                at += 2
+            elif op == ARGUMENT:
+                parts.append(Argument(self.string(words[at + 1]), self.string(words[at + 2]) or None))
+                at += 3
+            elif op == SHORTHAND_OP:
+                parts.append(Shorthand())
+                at += 1
+            elif op == SELECT or op == PLURAL:
+                name = self.string(words[at + 1])
+                source = self.string(words[at + 2])
+                offset = 0
+                locale = None
+                at += 3
+                if op == PLURAL:
+                    locale = self.string(words[at]) or None
+                    offset = words[at + 1] - (1 << 32) if words[at + 1] >> 31 else words[at + 1]
+                    at += 2
+                cases = {}
+                n_cases = words[at]
+                at += 1
+                for _ in range(n_cases):
+                    key = self.string(words[at])
+                    cases[key], at = self._decode_parts(at + 1)
+                if op == SELECT:
+                    parts.append(Select(name, cases, source))
+                else:
+                    parts.append(Plural(name, offset, cases, source, locale))
+            else:
+                raise InvalidFormat(f"Unknown op {op} in {self.path}")
+        return tuple(parts), at
+
+    def decode_message(self, at: int):
+        """
+        The message at word offset `at`. Locales sharing a message through their fallbacks share its decoding.
+        """
+        if (message := self._decoded.get(at)) is None:
+            text = self.string(self.words[at])
+            parts, _ = self._decode_parts(at + 1)
+            message = self._decoded[at] = Message(text, parts)
+        return message
+
+    def __contains__(self, lang: Enum):
+        return self._load(lang) is not None
+
+    def __getitem__(self, lang: Enum):
+        # Read without `_load` once merged, as this runs on every render
+        if (locale := self._locales.get(lang)) is not None:
+            return locale
+        if (locale := self._load(lang)) is None:
+            raise KeyError(lang)
+        return locale
+
+    def get(self, lang: Enum, default=None):
+        if (locale := self._load(lang)) is None:
+            return default
+        return locale
+
+    def preload(self, *langs: Union[Enum, str], workers: Optional[int] = 1):
+        """
+        Merges the indexes of the given languages with their fallback chains now instead of on first use.
+        Merges all of them if none are given. Kept for parity with `Translations`; there is nothing to parse
+        in `workers`.
+        """
+        for lang in langs or self.languages:
+            self._load(self._lang(lang))
+
+    def missing_keys(self, *langs: Union[Enum, str]):
+        """
+        The keys each language takes from its fallback chain, merging the languages if needed.
+        Reports every language if none are given.
+        """
+        report = {}
+        for lang in langs or self.languages:
+            self._load(lang := self._lang(lang))
+            missing = sorted(self._fallback_keys.get(lang, ()))
+            report[lang] = [self.string(self.words[self.keys_at + i]) for i in missing]
+        return report
+
+    def falls_back(self, lang: Enum, key: str):
+        """
+        Whether `lang` takes `key` from its fallback chain.
+        """
+        return bool(keys := self._fallback_keys.get(lang)) and self.key_index(key) in keys
+
+    def report_unresolved(self, lang: Enum, key: str):
+        """
+        Logs a key that neither `lang` nor its fallbacks translate, once per key.
+        Returns the key to render in its place.
+        """
+        if key not in self._unresolved:
+            self._unresolved.add(key)
+            log.error(f"Key `{key}` not found in {lang.name} or its fallbacks")
+        return key
+
+
+def load_catalog(
+    path: str,
+    languages: Type[Enum],
+    default: Optional[Enum] = None,
+    fallbacks: Optional[dict] = None,
+):
+    return MappedCatalog(path, languages, default, fallbacks)
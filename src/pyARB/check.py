@@ -0,0 +1,137 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from pyARB.localize import Argument, Select, Plural, iter_arb, purify, compile_message
+from pyARB.localization_generator import digest, file_digest, generator_digest
+from pyARB.exceptions import InvalidFormat, DuplicateKey
+
+CHECK_CACHE_NAME = "pyarb.check.json"
+
+
+def message_placeholders(parts: tuple, names: set = None):
+    """
+    Names of the placeholders a compiled message uses, including those of its selects and plurals.
+    """
+    names = set() if names is None else names
+    for p in parts:
+        if p.__class__ is Argument:
+            names.add(p.name)
+        elif p.__class__ is Select:
+            names.add(p.name)
+            for case in p.cases.values():
+                message_placeholders(case, names)
+        elif p.__class__ is Plural:
+            names.add(p.name)
+            for case in (*p.exact.values(), *p.cases.values()):
+                message_placeholders(case, names)
+    return names
+
+
+def _problem(level: str, key: Optional[str], message: str):
+    return {"level": level, "key": key, "message": message}
+
+
+def check_arb(arb_file: str, placeholders: dict[str, list[str]], primary: bool = False):
+    """
+    Compiles every message of an arb file and compares the placeholders it uses with `placeholders`, which maps
+    every key of the primary arb file to the placeholders its `@key` metadata declares.
+
+    Returns the problems found as dicts with a `level` (`error` or `warning`), the `key` (None for the whole
+    file) and a `message`. Errors are messages that do not compile and placeholders that are not declared;
+    warnings are declared placeholders a translation leaves out and keys the primary arb file does not have.
+    """
+    problems = []
+    try:
+        for k, v in iter_arb(arb_file):
+            if k.startswith("@"):
+                if primary and not k.startswith("@@") and k[1:] not in placeholders:
+                    problems.append(_problem("error", k, f"Metadata without a `{k[1:]}` entry"))
+                continue
+            if k not in placeholders:
+                problems.append(_problem("warning", k, "Not in the primary arb file"))
+                continue
+            if not isinstance(v, str):
+                problems.append(_problem("error", k, "Is not a string"))
+                continue
+            try:
+                used = message_placeholders(compile_message(purify(v)).parts)
+            except InvalidFormat as e:
+                problems.append(_problem("error", k, str(e)))
+                continue
+            declared = placeholders[k]
+            for name in sorted(used.difference(declared)):
+                problems.append(_problem("error", k, f"Uses `{name}`, which `@{k}` does not declare"))
+            if not primary:
+                for name in [n for n in declared if n not in used]:
+                    problems.append(_problem("warning", k, f"Leaves out `{name}`"))
+    except (InvalidFormat, DuplicateKey, ValueError) as e:
+        problems.append(_problem("error", None, f"{type(e).__name__}: {e}"))
+    return problems
+
+
+def _check_arb_job(job: tuple):
+    return check_arb(*job)
+
+
+def check_localizations(
+    arb_location: str,
+    locales: list[str],
+    cache: bool = True,
+    cache_path: Optional[str] = None,
+    workers: Optional[int] = 1,
+):
+    """
+    Checks the arb files of `locales` in `arb_location` with `check_arb`, the first locale being the primary one.
+    Locales without an arb file are skipped. Returns `problems`, the problems of every locale, and `checked`, the
+    locales checked in this run rather than taken from the cache.
+
+    With `cache` the results are kept by the contents of each file in `cache_path`, by default `pyarb.check.json`
+    in the directory above `arb_location`, so only the locales that changed since the last run are checked again.
+    Changing the primary arb file's metadata checks every locale again. With `workers` other than 1 the locales
+    are checked in a pool of that many processes, or one per core if None.
+    """
+    arb_location = arb_location.replace("\\", "/").rstrip("/")
+    if not cache_path:
+        cache_path = os.path.join(os.path.dirname(arb_location), CHECK_CACHE_NAME)
+    files = {l: os.path.join(arb_location, l + ".arb") for l in locales}
+    if not os.path.exists(files[locales[0]]):
+        raise FileNotFoundError(files[locales[0]] + " does not exist")
+    files = {l: f for l, f in files.items() if os.path.exists(f)}
+
+    try:
+        primary = dict(iter_arb(files[locales[0]]))
+    except (InvalidFormat, DuplicateKey, ValueError) as e:
+        problems = [_problem("error", None, f"{type(e).__name__}: {e}")]
+        return {"checked": [locales[0]], "problems": {locales[0]: problems}}
+    placeholders = {
+        k: list((primary.get("@" + k) or {}).get("placeholders") or {}) for k in primary if not k.startswith("@")
+    }
+
+    version = digest(generator_digest(), placeholders)
+    cached = {}
+    if cache:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                previous = json.loads(f.read())
+            if previous.get("version") == version:
+                cached = previous["locales"]
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+
+    digests = {l: file_digest(arb_file) for l, arb_file in files.items()}
+    results = {l: cached[l]["problems"] for l in files if l in cached and cached[l]["digest"] == digests[l]}
+    jobs = {l: (arb_file, placeholders, l == locales[0]) for l, arb_file in files.items() if l not in results}
+    if workers == 1 or len(jobs) < 2:
+        checked = [check_arb(*job) for job in jobs.values()]
+    else:
+        with ProcessPoolExecutor(min(workers or os.cpu_count() or 1, len(jobs))) as pool:
+            checked = list(pool.map(_check_arb_job, jobs.values()))
+    results.update(zip(jobs, checked))
+
+    if cache:
+        checks = {l: {"digest": digests[l], "problems": results[l]} for l in files}
+        with open(cache_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"version": version, "locales": checks}, ensure_ascii=False, indent=1))
+    return {"checked": list(jobs), "problems": {l: results[l] for l in files}}
@@ -0,0 +1,329 @@
+import json
+
+from pyARB.localize import (
+    Placeholder,
+    PlaceholderNum,
+    PlaceholderDateTime,
+    NumFormat,
+    NumType,
+    Message,
+    Argument,
+    Shorthand,
+    Select,
+    plural_rule,
+    IMPLICIT_PLURAL_CASES,
+    snake_case,
+)
+from pyARB.exceptions import InvalidFormat, UnsupportedFormat
+
+
+def tab(n: int):
+    return " " * n * 4
+
+
+def quote(text: str):
+    return json.dumps(text, ensure_ascii=False)
+
+
+class RenderFunctionWriter:
+    """
+    Turns a compiled message into the statements and return expression of a python function.
+    Selects and plurals become if/elif chains assigning to local variables
+    so the returned expression is a plain concatenation.
+
+    Number and date formatters are bound once at module level, named after `prefix`, the same way plural rules
+    are; `formatters` maps each name to the expression it is bound to.
+    """
+
+    def __init__(self, placeholders: dict[str, Placeholder], prefix: str):
+        self.placeholders = placeholders
+        self.prefix = prefix
+        self.lines: list[str] = []
+        self.formatters: dict[str, str] = {}
+        self.count = 0
+
+    def write(self, parts: tuple, depth: int, shorthand: str = None) -> str:
+        pieces = [self.write_part(p, depth, shorthand) for p in parts]
+        return " + ".join(pieces) if pieces else '""'
+
+    def write_part(self, part, depth: int, shorthand: str):
+        if isinstance(part, str):
+            return quote(part)
+        if isinstance(part, Shorthand):
+            return shorthand
+        var = self.placeholders.get(part.name)
+        if isinstance(part, Argument):
+            return self.format(var, var.snake_name, part.locale) if var else quote("{" + part.name + "}")
+        if not var:
+            return quote(part.source)
+
+        n = self.count
+        self.count += 1
+        if isinstance(part, Select):
+            result = f"_s{n}"
+            branches = [(f"{var.snake_name} == {quote(k)}", v) for k, v in part.cases.items() if k != "other"]
+            self.write_branches(result, branches, part.other, depth, shorthand)
+            return result
+
+        result = f"_p{n}"
+        branches = [(f"{var.snake_name} == {quote(k)}", v) for k, v in part.exact.items()]
+        exact_shorthand = self.format(var, var.snake_name, part.locale)
+        if branches:
+            for i, (condition, parts) in enumerate(branches):
+                self.lines.append(tab(depth) + ("if " if i == 0 else "elif ") + condition + ":")
+                self.assign(result, parts, depth + 1, exact_shorthand)
+            self.lines.append(tab(depth) + "else:")
+            depth += 1
+        value = f"_n{n}"
+        if part.offset:
+            self.lines.append(tab(depth) + f"{value} = abs({var.snake_name} - {part.offset})")
+        else:
+            self.lines.append(tab(depth) + f"{value} = abs({var.snake_name})")
+        categories = [(k, v) for k, v in part.cases.items() if k != "other"]
+        if categories:
+            # Plural rules are bound once per locale at the top of the module, see `generate_localizations`
+            rule = f"_plural_{part.locale}" if plural_rule(part.locale) else "plural_category"
+            implicit = "".join(
+                f"{quote(c)} if {value} == {i} else " for i, c in IMPLICIT_PLURAL_CASES.items() if c in part.cases
+            )
+            self.lines.append(tab(depth) + f"_c{n} = {implicit}{rule}({value})")
+        branches = [(f"_c{n} == {quote(k)}", v) for k, v in categories]
+        self.write_branches(result, branches, part.other, depth, self.format(var, value, part.locale))
+        return result
+
+    def format(self, var: Placeholder, value: str, locale: str) -> str:
+        if (formatter := var.get_formatter_expression(locale)) is None:
+            return var.get_expression(value, locale)
+        name = f"{self.prefix}__{var.snake_name}"
+        self.formatters[name] = formatter
+        return var.get_expression(value, locale, name)
+
+    def write_branches(self, result: str, branches: list, other: tuple, depth: int, shorthand: str):
+        for i, (condition, parts) in enumerate(branches):
+            self.lines.append(tab(depth) + ("if " if i == 0 else "elif ") + condition + ":")
+            self.assign(result, parts, depth + 1, shorthand)
+        if branches:
+            self.lines.append(tab(depth) + "else:")
+            depth += 1
+        self.assign(result, other, depth, shorthand)
+
+    def assign(self, result: str, parts: tuple, depth: int, shorthand: str):
+        expression = self.write(parts, depth, shorthand)
+        self.lines.append(tab(depth) + f"{result} = {expression}")
+
+
+class ArbKey:
+    def __init__(self, key: str, native_value: str):
+        self.key = key
+        self.snake_key = snake_case(key)
+        self.native_value = native_value
+        self.description: str = None
+        self.placeholders: list[Placeholder] = None
+        self.constant = False
+
+    def method_signature(self, static=False):
+        signature = tab(1)
+        if static:
+            signature += "@staticmethod\n" + tab(1)
+        signature += "def " + self.snake_key
+        if static:
+            signature += "_static(lang: Union[Lang, str]"
+        else:
+            signature += "(self"
+        if self.placeholders:
+            signature += ", " + ", ".join(self.parameters())
+        signature += "):\n"
+        return signature
+
+    def parameters(self):
+        params = [p.get_parameter() for p in self.placeholders or []]
+        params.extend(
+            _
+            for p in self.placeholders or []
+            if isinstance(p, PlaceholderNum) and p.optional_parameters
+            for _ in p.format_params()
+        )
+        return params
+
+    def arguments(self):
+        args = [p.snake_name for p in self.placeholders or []]
+        args.extend(
+            p.snake_name + "_" + snake_case(k)
+            for p in self.placeholders or []
+            if isinstance(p, PlaceholderNum) and p.optional_parameters
+            for k in p.optional_parameters.keys()
+        )
+        return args
+
+    def docstring(self):
+        doc = tab(2) + f'"""\n{tab(2)}`{self.native_value}`\n'
+
+        if self.description:
+            doc += f"\n{tab(2)}Description: {self.description}\n"
+
+        if self.placeholders:
+            doc += f"\n{tab(2)}Placeholders:\n"
+            for p in self.placeholders:
+                doc += tab(3) + p.name + ": "
+                if type(p) is Placeholder:
+                    doc += "String\n"
+                elif type(p) is PlaceholderNum:
+                    if not p.format:
+                        doc += p.get_type_string() + "\n"
+                    else:
+                        doc += "{\n" + tab(4) + "type: " + p.get_type_string() + "\n"
+                        doc += tab(4) + "format: " + p.format.name + "\n"
+                        if p.example:
+                            doc += tab(4) + "example: " + p.example + "\n"
+                        if p.description:
+                            doc += tab(4) + "description: " + p.description + "\n"
+                        if p.optional_parameters:
+                            doc += tab(4) + "bakedParameters: {\n"
+                            for k, v in p.optional_parameters.items():
+                                doc += tab(5) + f"{k}: {v}\n"
+                            doc += tab(4) + "}\n"
+                        doc += tab(3) + "}\n"
+                elif type(p) is PlaceholderDateTime:
+                    doc += "{\n" + tab(4) + "type: DateTime\n" + tab(4) + "format: " + p.format + "\n"
+                    if p.custom:
+                        doc += tab(4) + "isCustomDateFormat: true\n"
+                    doc += tab(3) + "}\n"
+
+        doc += tab(2) + '"""\n'
+        return doc
+
+    def method_return(self, static=False, specialized=False):
+        ret = tab(2) + "return "
+        if static and specialized:
+            ret = tab(2) + "if isinstance(lang, str):\n" + tab(3) + "lang = Lang(lang)\n" + ret
+            ret += self.table_name() + "[lang]"
+            if not self.constant:
+                ret += "(" + ", ".join(self.arguments()) + ")"
+            ret += "\n"
+        elif static:
+            ret = tab(2) + "if isinstance(lang, str):\n" + tab(3) + "lang = Lang(lang)\n" + ret
+            ret += "Translator._localize("
+            if self.placeholders:
+                ret += "\n" + tab(3) + "lang,\n" + tab(3) + f'"{self.key}",\n'
+                values = ", ".join(p.snake_name for p in self.placeholders)
+                ret += tab(3) + "(" + values + ("," if len(self.placeholders) == 1 else "") + "),\n"
+                if options := self.options_code():
+                    ret += tab(3) + options + ",\n"
+                ret += tab(2) + ")\n"
+            else:
+                ret += f'lang, "{self.key}", ())\n'
+        else:
+            ret += f"self.{self.snake_key}_static(self.lang"
+            if self.placeholders:
+                params = [p.snake_name for p in self.placeholders]
+                params.extend(
+                    (a := p.snake_name + "_" + snake_case(k)) + "=" + a
+                    for p in self.placeholders
+                    if isinstance(p, PlaceholderNum) and p.optional_parameters
+                    for k in p.optional_parameters.keys()
+                )
+                ret += ", " + ", ".join(params)
+            ret += ")\n"
+        return ret
+
+    def options_code(self):
+        """
+        Expression passing the overridden optional parameters to `_localize`, or None when
+        every value is still the baked default so nothing has to be allocated.
+        """
+        optional = [
+            (p, k, v)
+            for p in self.placeholders or []
+            if isinstance(p, PlaceholderNum)
+            for k, v in p.optional_parameters.items()
+        ]
+        if not optional:
+            return None
+        unchanged = " and ".join(
+            f"{p.snake_name}_{snake_case(k)} == {quote(v) if isinstance(v, str) else v}" for p, k, v in optional
+        )
+        options = {}
+        for p, k, _ in optional:
+            options.setdefault(p.name, []).append(f'"{k}": {p.snake_name}_{snake_case(k)}')
+        overrides = ", ".join(f'"{name}": {{' + ", ".join(values) + "}" for name, values in options.items())
+        return f"None if {unchanged} else {{{overrides}}}"
+
+    def print_methods(self, specialized=False, docstrings=True):
+        docstring = self.docstring() if docstrings else ""
+        methods = "\n" + self.method_signature() + docstring + self.method_return()
+        methods += (
+            "\n"
+            + self.method_signature(static=True)
+            + docstring
+            + self.method_return(static=True, specialized=specialized)
+        )
+        return methods
+
+    def print_definitions(self):
+        if not self.placeholders:
+            return tab(1) + f'"{self.key}": {{}},\n'
+        definitions = "".join(tab(2) + f'"{p.name}": {p.get_definition()},\n' for p in self.placeholders)
+        return tab(1) + f'"{self.key}": {{\n' + definitions + tab(1) + "},\n"
+
+    def table_name(self):
+        return "_" + self.snake_key.upper()
+
+    def print_render_functions(self, messages: dict[str, Message], chains: dict[str, tuple[str, ...]]):
+        """
+        Writes a dedicated render function for each locale of this key, then a table mapping every `Lang`
+        to its function. Locales missing the key use the function of the first locale in their fallback chain.
+        If the key is plain text in every locale the table holds the strings instead.
+        """
+        placeholders = {p.name: p for p in self.placeholders or []}
+        self.constant = all(m.literal is not None for m in messages.values())
+        code = ""
+        table = {}
+        for locale, message in messages.items():
+            if self.constant:
+                table[locale] = quote(message.literal)
+                continue
+            name = table[locale] = f"_{locale}_{self.snake_key}"
+            writer = RenderFunctionWriter(placeholders, name)
+            result = writer.write(message.parts, 1)
+            if writer.formatters:
+                code += "\n\n" + "".join(f"{k} = {v}\n" for k, v in writer.formatters.items())
+            code += "\n\ndef " + name + "(" + ", ".join(self.parameters()) + "):\n"
+            code += "".join(line + "\n" for line in writer.lines)
+            code += tab(1) + "return " + result + "\n"
+
+        code += "\n\n" + self.table_name() + " = {\n"
+        for locale, chain in chains.items():
+            code += tab(1) + f"Lang.{locale}: {next(table[l] for l in chain if l in table)},\n"
+        code += "}\n"
+        return code
+
+    def process_metadata(self, data: dict):
+        if "description" in data:
+            self.description = data["description"]
+        if "placeholders" in data:
+            self.placeholders = []
+            for k, v in data["placeholders"].items():
+                if (t := v.get("type")) == "String" or not t:
+                    self.placeholders.append(Placeholder(k))
+                elif t in {"int", "double", "num"}:
+                    p = PlaceholderNum(
+                        k,
+                        format=NumFormat(v["format"]) if v.get("format") else None,
+                        num_type=NumType(t),
+                        **(v.get("optionalParameters") or {}),
+                    )
+                    if extra := v.get("example"):
+                        p.example = extra
+                    if extra := v.get("description"):
+                        p.description = extra
+                    self.placeholders.append(p)
+                elif t == "DateTime":
+                    if not v.get("format"):
+                        raise InvalidFormat(f"DateTime placeholder `{k}` of `{self.key}` has no format")
+                    custom = str(v.get("isCustomDateFormat")).lower() == "true"
+                    p = PlaceholderDateTime(k, format=v["format"], custom=custom)
+                    # Compiled once here so an unknown skeleton or a malformed pattern fails the generation
+                    p.formatter(None)
+                    self.placeholders.append(p)
+                else:
+                    raise UnsupportedFormat(t + " is not yet a supported type")
@@ -0,0 +1,105 @@
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from enum import Enum
+from typing import Callable, Type, Union
+
+
+class LocaleContext:
+    """
+    The current `Lang` of a generated module, kept in a context variable so every asyncio task and thread
+    renders in its own lang without passing a `Translator` down the call stack.
+
+    Tags and Accept-Language headers are resolved with `negotiate` once, when the lang is set; every render
+    then reads the `Lang` as it is, without coercing or allocating anything.
+    """
+
+    __slots__ = ("languages", "default", "negotiate", "_current", "get")
+
+    def __init__(self, languages: Type[Enum], default: Enum, negotiate: Callable[[Union[Enum, str, None]], Enum]):
+        self.languages = languages
+        self.default = default
+        self.negotiate = negotiate
+        self._current = ContextVar(languages.__module__ + ".lang", default=default)
+        self.get = self._current.get
+
+    def set(self, lang: Union[Enum, str, None]) -> Token:
+        """
+        Makes `lang`, a `Lang`, a tag such as `es-MX` or an Accept-Language header, the current lang of this
+        context. Returns a token to hand to `reset`.
+        """
+        if lang.__class__ is not self.languages:
+            lang = self.negotiate(lang)
+        return self._current.set(lang)
+
+    def reset(self, token: Token):
+        self._current.reset(token)
+
+    @contextmanager
+    def use(self, lang: Union[Enum, str, None]):
+        """
+        Renders in `lang` inside the `with` block. Yields the negotiated `Lang`.
+        """
+        token = self.set(lang)
+        try:
+            yield self._current.get()
+        finally:
+            self._current.reset(token)
+
+    def render_function(self, static: Callable[..., str], name: str) -> Callable[..., str]:
+        """
+        A function taking the arguments of the static method `static` but its lang, rendering in the current one.
+        """
+        current = self._current.get
+
+        def render(*args, **kwargs):
+            return static(current(), *args, **kwargs)
+
+        render.__name__ = render.__qualname__ = name
+        render.__doc__ = static.__doc__
+        return render
+
+    def module_getattr(self, namespace: dict, translator: type):
+        """
+        A module `__getattr__` exposing every static method of `translator`, such as `followers_count_static`,
+        as a module-level `followers_count` rendering in the current lang. Each function is created the first
+        time it is looked up and stored in `namespace`, so every later lookup is a plain global access.
+        Names the module already defines are left as they are.
+        """
+
+        def __getattr__(name: str):
+            static = None if name.startswith("_") else getattr(translator, name + "_static", None)
+            if static is None:
+                raise AttributeError(f"module '{namespace['__name__']}' has no attribute '{name}'")
+            function = namespace[name] = self.render_function(static, name)
+            return function
+
+        return __getattr__
+
+
+class LocaleMiddleware:
+    """
+    ASGI middleware making the lang negotiated from each request's Accept-Language header current while the
+    request is handled, so handlers can call the module-level render functions directly. Requests without the
+    header use the default lang. Negotiation is memoized, so a repeated header costs a single dict lookup.
+    """
+
+    __slots__ = ("app", "locale", "header")
+
+    def __init__(self, app, locale: LocaleContext, header: str = "accept-language"):
+        self.app = app
+        self.locale = locale
+        self.header = header.lower().encode("latin-1")
+
+    async def __call__(self, scope: dict, receive, send):
+        if scope["type"] != "http" and scope["type"] != "websocket":
+            return await self.app(scope, receive, send)
+        requested = None
+        for name, value in scope.get("headers", ()):
+            if name == self.header:
+                requested = value.decode("latin-1")
+                break
+        token = self.locale.set(requested)
+        try:
+            return await self.app(scope, receive, send)
+        finally:
+            self.locale.reset(token)
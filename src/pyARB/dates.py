@@ -0,0 +1,437 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Optional
+
+from pyARB.exceptions import InvalidFormat, UnsupportedFormat
+
+# Date and time names and the CLDR patterns of the ARB (intl `DateFormat`) skeletons by the locales using them.
+# Weekdays start on Monday, as `datetime.weekday()` does. Every name or skeleton a locale leaves out is that of
+# its language, and then that of `root`.
+DATE_SYMBOLS: dict[str, dict] = {
+    "root": {
+        "months": (
+            "January",
+            "February",
+            "March",
+            "April",
+            "May",
+            "June",
+            "July",
+            "August",
+            "September",
+            "October",
+            "November",
+            "December",
+        ),
+        "short_months": ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        "weekdays": ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"),
+        "short_weekdays": ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"),
+        "quarters": ("1st quarter", "2nd quarter", "3rd quarter", "4th quarter"),
+        "short_quarters": ("Q1", "Q2", "Q3", "Q4"),
+        "periods": ("AM", "PM"),
+        "skeletons": {
+            "d": "d",
+            "E": "EEE",
+            "EEEE": "EEEE",
+            "LLL": "LLL",
+            "LLLL": "LLLL",
+            "M": "L",
+            "Md": "M/d",
+            "MEd": "EEE, M/d",
+            "MMM": "LLL",
+            "MMMd": "MMM d",
+            "MMMEd": "EEE, MMM d",
+            "MMMM": "LLLL",
+            "MMMMd": "MMMM d",
+            "MMMMEEEEd": "EEEE, MMMM d",
+            "QQQ": "QQQ",
+            "QQQQ": "QQQQ",
+            "y": "y",
+            "yM": "M/y",
+            "yMd": "M/d/y",
+            "yMEd": "EEE, M/d/y",
+            "yMMM": "MMM y",
+            "yMMMd": "MMM d, y",
+            "yMMMEd": "EEE, MMM d, y",
+            "yMMMM": "MMMM y",
+            "yMMMMd": "MMMM d, y",
+            "yMMMMEEEEd": "EEEE, MMMM d, y",
+            "yQQQ": "QQQ y",
+            "yQQQQ": "QQQQ y",
+            "H": "HH",
+            "Hm": "HH:mm",
+            "Hms": "HH:mm:ss",
+            "j": "h a",
+            "jm": "h:mm a",
+            "jms": "h:mm:ss a",
+            "jmv": "h:mm a v",
+            "jmz": "h:mm a z",
+            "jz": "h a z",
+            "m": "m",
+            "ms": "mm:ss",
+            "s": "s",
+        },
+    },
+    "de": {
+        "months": (
+            "Januar",
+            "Februar",
+            "März",
+            "April",
+            "Mai",
+            "Juni",
+            "Juli",
+            "August",
+            "September",
+            "Oktober",
+            "November",
+            "Dezember",
+        ),
+        "short_months": (
+            "Jan.",
+            "Feb.",
+            "März",
+            "Apr.",
+            "Mai",
+            "Juni",
+            "Juli",
+            "Aug.",
+            "Sept.",
+            "Okt.",
+            "Nov.",
+            "Dez.",
+        ),
+        "weekdays": ("Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"),
+        "short_weekdays": ("Mo.", "Di.", "Mi.", "Do.", "Fr.", "Sa.", "So."),
+        "quarters": ("1. Quartal", "2. Quartal", "3. Quartal", "4. Quartal"),
+        "skeletons": {
+            "Md": "d.M.",
+            "MEd": "EEE, d.M.",
+            "MMMd": "d. MMM",
+            "MMMEd": "EEE, d. MMM",
+            "MMMMd": "d. MMMM",
+            "MMMMEEEEd": "EEEE, d. MMMM",
+            "yM": "M/y",
+            "yMd": "d.M.y",
+            "yMEd": "EEE, d.M.y",
+            "yMMMd": "d. MMM y",
+            "yMMMEd": "EEE, d. MMM y",
+            "yMMMMd": "d. MMMM y",
+            "yMMMMEEEEd": "EEEE, d. MMMM y",
+            "H": "HH 'Uhr'",
+            "j": "HH 'Uhr'",
+            "jm": "HH:mm",
+            "jms": "HH:mm:ss",
+            "jmv": "HH:mm v",
+            "jmz": "HH:mm z",
+            "jz": "HH 'Uhr' z",
+        },
+    },
+    "es": {
+        "months": (
+            "enero",
+            "febrero",
+            "marzo",
+            "abril",
+            "mayo",
+            "junio",
+            "julio",
+            "agosto",
+            "septiembre",
+            "octubre",
+            "noviembre",
+            "diciembre",
+        ),
+        "short_months": ("ene", "feb", "mar", "abr", "may", "jun", "jul", "ago", "sept", "oct", "nov", "dic"),
+        "weekdays": ("lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"),
+        "short_weekdays": ("lun", "mar", "mié", "jue", "vie", "sáb", "dom"),
+        "quarters": ("1.er trimestre", "2.º trimestre", "3.er trimestre", "4.º trimestre"),
+        "short_quarters": ("T1", "T2", "T3", "T4"),
+        "periods": ("a.\u00a0m.", "p.\u00a0m."),
+        "skeletons": {
+            "Md": "d/M",
+            "MEd": "EEE, d/M",
+            "MMMd": "d MMM",
+            "MMMEd": "EEE, d MMM",
+            "MMMMd": "d 'de' MMMM",
+            "MMMMEEEEd": "EEEE, d 'de' MMMM",
+            "yMd": "d/M/y",
+            "yMEd": "EEE, d/M/y",
+            "yMMMd": "d MMM y",
+            "yMMMEd": "EEE, d MMM y",
+            "yMMMM": "MMMM 'de' y",
+            "yMMMMd": "d 'de' MMMM 'de' y",
+            "yMMMMEEEEd": "EEEE, d 'de' MMMM 'de' y",
+            "yQQQQ": "QQQQ 'de' y",
+            "H": "H",
+            "Hm": "H:mm",
+            "Hms": "H:mm:ss",
+            "j": "H",
+            "jm": "H:mm",
+            "jms": "H:mm:ss",
+            "jmv": "H:mm v",
+            "jmz": "H:mm z",
+            "jz": "H z",
+        },
+    },
+    "fr": {
+        "months": (
+            "janvier",
+            "février",
+            "mars",
+            "avril",
+            "mai",
+            "juin",
+            "juillet",
+            "août",
+            "septembre",
+            "octobre",
+            "novembre",
+            "décembre",
+        ),
+        "short_months": (
+            "janv.",
+            "févr.",
+            "mars",
+            "avr.",
+            "mai",
+            "juin",
+            "juil.",
+            "août",
+            "sept.",
+            "oct.",
+            "nov.",
+            "déc.",
+        ),
+        "weekdays": ("lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche"),
+        "short_weekdays": ("lun.", "mar.", "mer.", "jeu.", "ven.", "sam.", "dim."),
+        "quarters": ("1er trimestre", "2e trimestre", "3e trimestre", "4e trimestre"),
+        "short_quarters": ("T1", "T2", "T3", "T4"),
+        "skeletons": {
+            "Md": "dd/MM",
+            "MEd": "EEE dd/MM",
+            "MMMEd": "EEE d MMM",
+            "MMMd": "d MMM",
+            "MMMMd": "d MMMM",
+            "MMMMEEEEd": "EEEE d MMMM",
+            "yM": "MM/y",
+            "yMd": "dd/MM/y",
+            "yMEd": "EEE dd/MM/y",
+            "yMMMd": "d MMM y",
+            "yMMMEd": "EEE d MMM y",
+            "yMMMMd": "d MMMM y",
+            "yMMMMEEEEd": "EEEE d MMMM y",
+            "H": "HH 'h'",
+            "j": "HH 'h'",
+            "jm": "HH:mm",
+            "jms": "HH:mm:ss",
+            "jmv": "HH:mm v",
+            "jmz": "HH:mm z",
+            "jz": "HH 'h' z",
+        },
+    },
+    "pt": {
+        "months": (
+            "janeiro",
+            "fevereiro",
+            "março",
+            "abril",
+            "maio",
+            "junho",
+            "julho",
+            "agosto",
+            "setembro",
+            "outubro",
+            "novembro",
+            "dezembro",
+        ),
+        "short_months": (
+            "jan.",
+            "fev.",
+            "mar.",
+            "abr.",
+            "mai.",
+            "jun.",
+            "jul.",
+            "ago.",
+            "set.",
+            "out.",
+            "nov.",
+            "dez.",
+        ),
+        "weekdays": (
+            "segunda-feira",
+            "terça-feira",
+            "quarta-feira",
+            "quinta-feira",
+            "sexta-feira",
+            "sábado",
+            "domingo",
+        ),
+        "short_weekdays": ("seg.", "ter.", "qua.", "qui.", "sex.", "sáb.", "dom."),
+        "quarters": ("1º trimestre", "2º trimestre", "3º trimestre", "4º trimestre"),
+        "short_quarters": ("T1", "T2", "T3", "T4"),
+        "skeletons": {
+            "Md": "d/M",
+            "MEd": "EEE, dd/MM",
+            "MMMd": "d 'de' MMM",
+            "MMMEd": "EEE, d 'de' MMM",
+            "MMMMd": "d 'de' MMMM",
+            "MMMMEEEEd": "EEEE, d 'de' MMMM",
+            "yM": "MM/y",
+            "yMd": "dd/MM/y",
+            "yMEd": "EEE, dd/MM/y",
+            "yMMM": "MMM 'de' y",
+            "yMMMd": "d 'de' MMM 'de' y",
+            "yMMMEd": "EEE, d 'de' MMM 'de' y",
+            "yMMMM": "MMMM 'de' y",
+            "yMMMMd": "d 'de' MMMM 'de' y",
+            "yMMMMEEEEd": "EEEE, d 'de' MMMM 'de' y",
+            "yQQQQ": "QQQQ 'de' y",
+            "j": "HH",
+            "jm": "HH:mm",
+            "jms": "HH:mm:ss",
+            "jmv": "HH:mm v",
+            "jmz": "HH:mm z",
+            "jz": "HH z",
+        },
+    },
+}
+
+_SYMBOLS_BY_LOCALE = {locale: symbols for locales, symbols in DATE_SYMBOLS.items() for locale in locales.split()}
+
+
+@lru_cache(maxsize=None)
+def date_symbols(locale: Optional[str]) -> dict:
+    """
+    The date and time names and skeleton patterns of a locale such as `pt_PT`, `pt-BR` or `en`, see
+    `DATE_SYMBOLS`. Those of the whole locale take precedence over those of its language.
+    Unknown locales get the `root` ones.
+    """
+    root = _SYMBOLS_BY_LOCALE["root"]
+    symbols = dict(root)
+    skeletons = dict(root["skeletons"])
+    if locale:
+        tag = locale.replace("-", "_")
+        for key in (tag.split("_")[0].lower(), tag):
+            if key != "root" and (found := _SYMBOLS_BY_LOCALE.get(key)):
+                symbols.update(found)
+                skeletons.update(found.get("skeletons", {}))
+    symbols["skeletons"] = skeletons
+    return symbols
+
+
+def _zone(d: datetime):
+    return d.tzname() or ""
+
+
+# A pattern field, a quoted literal or plain text
+_PATTERN_PART = re.compile(r"([A-Za-z])\1*|'((?:[^']|'')*)'|[^A-Za-z']+")
+
+
+def _field(letter: str, width: int) -> str:
+    """
+    Python expression of the pattern field `letter` repeated `width` times, for a datetime `d`.
+    """
+    pad = f":0{width}" if width > 1 else ""
+    if letter == "y":
+        return "d.year % 100:02" if width == 2 else f"d.year{pad}"
+    if letter in "ML":
+        if width >= 4:
+            return "months[d.month - 1]"
+        if width == 3:
+            return "short_months[d.month - 1]"
+        return f"d.month{pad}"
+    if letter == "d":
+        return f"d.day{pad}"
+    if letter in "Ec":
+        return "weekdays[d.weekday()]" if width >= 4 else "short_weekdays[d.weekday()]"
+    if letter == "Q":
+        if width >= 4:
+            return "quarters[(d.month - 1) // 3]"
+        if width == 3:
+            return "short_quarters[(d.month - 1) // 3]"
+        return f"(d.month - 1) // 3 + 1{pad}"
+    if letter == "a":
+        return "periods[d.hour >= 12]"
+    if letter == "h":
+        return f"d.hour % 12 or 12{pad}"
+    if letter == "H":
+        return f"d.hour{pad}"
+    if letter == "K":
+        return f"d.hour % 12{pad}"
+    if letter == "k":
+        return f"d.hour or 24{pad}"
+    if letter == "m":
+        return f"d.minute{pad}"
+    if letter == "s":
+        return f"d.second{pad}"
+    if letter == "S":
+        return f"d.microsecond // {10 ** max(6 - width, 0)}:0{width}"
+    if letter in "vz":
+        return "zone(d)"
+    raise UnsupportedFormat(f"`{letter * width}` is not a supported date field")
+
+
+def _compile_pattern(pattern: str) -> str:
+    """
+    A CLDR date pattern such as `EEE, MMM d, y` as the source of an f-string of a datetime `d`.
+    """
+    template = ""
+    pos = 0
+    while pos < len(pattern):
+        if not (m := _PATTERN_PART.match(pattern, pos)):
+            raise InvalidFormat(f"Unclosed quote at {pos} in date pattern `{pattern}`")
+        if m.group(1):
+            template += "{" + _field(m.group(1), len(m.group(0))) + "}"
+        else:
+            literal = m.group(0)
+            if m.group(2) is not None:
+                # '' inside or outside quotes is a literal quote
+                literal = m.group(2).replace("''", "'") if m.group(2) else "'"
+            template += literal.replace("{", "{{").replace("}", "}}")
+        pos = m.end()
+    return "f" + repr(template)
+
+
+class DateFormatter:
+    """
+    Formats datetimes with one ARB skeleton (such as `yMd`, `jm` or both as `yMd+jm`) or a custom pattern in one
+    locale. The pattern is compiled into a python function once, so formatting a datetime parses nothing.
+
+    Formatters are built by `date_formatter`, once per locale and format.
+    """
+
+    __slots__ = ("locale", "skeleton", "pattern", "format")
+
+    def __init__(self, locale: Optional[str], skeleton: str, custom: bool = False):
+        self.locale = locale
+        self.skeleton = skeleton
+        symbols = date_symbols(locale)
+        if custom:
+            self.pattern = skeleton
+        else:
+            patterns = []
+            for s in skeleton.split("+"):
+                if (pattern := symbols["skeletons"].get(s)) is None:
+                    raise UnsupportedFormat(f"`{s}` is not a supported DateTime format")
+                patterns.append(pattern)
+            self.pattern = " ".join(patterns)
+        namespace = {name: symbols[name] for name in symbols if name != "skeletons"}
+        namespace["zone"] = _zone
+        source = f"def format(d):\n    return {_compile_pattern(self.pattern)}\n"
+        exec(compile(source, "<date pattern>", "exec"), namespace)
+        self.format: Callable[[datetime], str] = namespace["format"]
+
+    def __repr__(self):
+        return f"DateFormatter({self.locale!r}, {self.skeleton!r}, pattern={self.pattern!r})"
+
+
+@lru_cache(maxsize=1024)
+def date_formatter(locale: Optional[str], skeleton: str, custom: bool = False) -> DateFormatter:
+    """
+    The formatter of the ARB DateTime `skeleton` in `locale`, or of the CLDR pattern `skeleton` if `custom`,
+    built on the first call and shared by every later one.
+    """
+    return DateFormatter(locale, skeleton, custom)
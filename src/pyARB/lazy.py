@@ -0,0 +1,74 @@
+import textwrap
+import threading
+
+from pyARB.localize import Placeholder, snake_case
+from pyARB.codegen import ArbKey
+
+_lock = threading.Lock()
+
+
+def method_source(key: str, definitions: dict[str, Placeholder]):
+    """
+    Source of the instance and static methods of `key`, the same methods
+    `generate_localizations` writes into the class body, without their docstrings.
+    """
+    arb_key = ArbKey(key, None)
+    arb_key.placeholders = list(definitions.values())
+    return textwrap.dedent(arb_key.print_methods(docstrings=False))
+
+
+class LazyMethods(type):
+    """
+    Metaclass of translators whose per-key methods are created the first time they are used.
+
+    The class lists its keys in `_definitions` (arb key to placeholder definitions) and holds the globals of
+    its module in `_globals`, so it works whether or not the module was registered in `sys.modules`. Looking up
+    `followers_count` or `followers_count_static` compiles both methods of `followersCount` in those globals
+    and stores them on the class, so every later lookup is a plain attribute access.
+    """
+
+    def __getattr__(cls, name: str):
+        if name.startswith("_"):
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        return cls._materialize(name)
+
+    def __dir__(cls):
+        names = set(super().__dir__())
+        for snake_key in cls._method_keys():
+            names.update((snake_key, snake_key + "_static"))
+        return sorted(names)
+
+    def _method_keys(cls) -> dict[str, str]:
+        if (keys := cls.__dict__.get("_keys_by_method")) is None:
+            keys = {snake_case(k): k for k in cls._definitions}
+            cls._keys_by_method = keys
+        return keys
+
+    def _materialize(cls, name: str):
+        snake_key = name[: -len("_static")] if name.endswith("_static") else name
+        if (key := cls._method_keys().get(snake_key)) is None:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        with _lock:
+            if snake_key not in cls.__dict__:
+                methods = {}
+                exec(method_source(key, cls._definitions[key]), cls._globals, methods)
+                for method in methods.values():
+                    method = getattr(method, "__func__", method)
+                    method.__qualname__ = cls.__qualname__ + "." + method.__name__
+                    setattr(cls, method.__name__, methods[method.__name__])
+        return type.__getattribute__(cls, name)
+
+
+class LazyTranslator(metaclass=LazyMethods):
+    """
+    Base of generated translators with lazily created methods. See `LazyMethods`.
+    """
+
+    _definitions: dict[str, dict[str, Placeholder]] = {}
+    _globals: dict = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        type(self)._materialize(name)
+        return object.__getattribute__(self, name)
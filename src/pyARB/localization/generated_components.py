@@ -1,6 +1,20 @@
+from datetime import datetime
 from enum import Enum
-from typing import Union
-from pyARB.localize import log, read_translations, inject_placeholders, Placeholder, PlaceholderNum, NumFormat, NumType
+from typing import Iterable, Optional, Union
+from pyARB.cache import RenderCache
+from pyARB.metrics import RenderMetrics
+from pyARB.negotiation import LocaleNegotiator
+from pyARB.context import LocaleContext
+from pyARB.localize import (
+    read_translations,
+    index_placeholders,
+    render_batch,
+    Placeholder,
+    PlaceholderNum,
+    PlaceholderDateTime,
+    NumFormat,
+    NumType,
+)
 
 
 class Lang(Enum):
@@ -9,8 +23,138 @@ class Lang(Enum):
     pt_BR = "pt_BR"
 
 
-TRANSLATIONS = read_translations("src/pyARB/localization/arbs", Lang)
 FALLBACK_LANG = Lang.en_US
+# Langs tried, in order, before FALLBACK_LANG when a lang lacks a key or a tag has no lang
+FALLBACKS = {
+}
+TRANSLATIONS = read_translations("src/pyARB/localization/arbs", Lang, FALLBACK_LANG, FALLBACKS)
+
+# Best available Lang for a tag such as `es-MX` or a whole Accept-Language header
+negotiate = LocaleNegotiator(Lang, FALLBACK_LANG, FALLBACKS).negotiate
+
+# Current Lang of each asyncio task or thread, read by the module-level render functions
+LOCALE = LocaleContext(Lang, FALLBACK_LANG, negotiate)
+
+# Placeholder definitions of every key, numbered in the order methods pass their values
+PLACEHOLDERS = index_placeholders({
+    "unitedStates": {},
+    "puertoRico": {},
+    "canada": {},
+    "mexico": {},
+    "virginIslandsBritish": {},
+    "virginIslandsUS": {},
+    "unitedKingdom": {},
+    "france": {},
+    "switzerland": {},
+    "bulgaria": {},
+    "estonia": {},
+    "greece": {},
+    "latvia": {},
+    "spain": {},
+    "hungary": {},
+    "romania": {},
+    "sweden": {},
+    "austria": {},
+    "croatia": {},
+    "finlandAlandIslands": {},
+    "investmentCreatedAt": {
+        "date": PlaceholderDateTime("date", format="yMd"),
+        "time": PlaceholderDateTime("time", format="jm"),
+    },
+    "followersCount": {
+        "amount": PlaceholderNum("amount", format=NumFormat.compact, num_type=NumType.int),
+    },
+    "no": {},
+    "cancel": {},
+    "joinedDate": {
+        "date": Placeholder("date"),
+    },
+    "manyItems": {
+        "first": Placeholder("first"),
+        "count": PlaceholderNum("count", num_type=NumType.int),
+    },
+    "notificationRequestedToFollow": {
+        "username": Placeholder("username"),
+        "count": PlaceholderNum("count", format=NumFormat.compact, num_type=NumType.int),
+    },
+    "stockChange": {
+        "stock": Placeholder("stock"),
+        "pnl": PlaceholderNum("pnl", format=NumFormat.decimalPercentPattern, num_type=NumType.double, decimalDigits=2),
+        "profitLoss": Placeholder("profitLoss"),
+    },
+})
+
+
+def preload(*langs: Union[Lang, str], workers: Optional[int] = 1):
+    """
+    Loads the translations of the given langs now instead of on first use. Loads every lang if none are given.
+    With `workers` other than 1 the arb files are parsed in a pool of that many processes, or one per core if None.
+    """
+    TRANSLATIONS.preload(*langs, workers=workers)
+
+
+RENDER_CACHE: Optional[RenderCache] = None
+
+
+def enable_render_cache(maxsize: int = 4096, exclude: Iterable[str] = ()):
+    """
+    Caches rendered strings in a bounded LRU cache. Keys in `exclude` are never cached.
+    Returns the cache so its `stats()` can be read.
+    """
+    global RENDER_CACHE
+    RENDER_CACHE = RenderCache(maxsize, exclude)
+    return RENDER_CACHE
+
+
+def disable_render_cache():
+    global RENDER_CACHE
+    RENDER_CACHE = None
+
+
+METRICS: Optional[RenderMetrics] = None
+
+
+def enable_metrics(sample_every: int = 100):
+    """
+    Counts renders per lang and key, fallbacks, missing keys and selects falling through to `other`, and times
+    every `sample_every`th render. Returns the metrics so their `snapshot()` can be exported.
+    """
+    global METRICS
+    disable_metrics()
+    METRICS = RenderMetrics(TRANSLATIONS, sample_every).attach()
+    return METRICS
+
+
+def disable_metrics():
+    global METRICS
+    if METRICS is not None:
+        METRICS.detach()
+    METRICS = None
+
+
+def _reloaded(langs: list):
+    if langs and RENDER_CACHE is not None:
+        RENDER_CACHE.invalidate()
+    return langs
+
+
+def reload_translations(*langs: Union[Lang, str]):
+    """
+    Reads the arb files that changed since they were loaded, or those of the given langs, again and swaps in
+    their new translations without blocking renders. Returns the reloaded langs.
+    """
+    return _reloaded(TRANSLATIONS.reload(*langs))
+
+
+def auto_reload(interval: float = 2.0):
+    """
+    Checks the arb files for changes every `interval` seconds on a background thread. See `reload_translations`.
+    """
+    TRANSLATIONS.auto_reload(interval, on_reload=_reloaded)
+
+
+def stop_auto_reload():
+    TRANSLATIONS.stop_auto_reload()
 
 
 class Translator:
@@ -20,21 +164,45 @@ class Translator:
         self.lang = lang
 
     @staticmethod
-    def _key_check(lang: Lang, key: str):
-        if lang in TRANSLATIONS:
-            if key in TRANSLATIONS[lang]:
-                return True
-            log.error(f"{lang.name}.arb does not have key `{key}`")
-        return False
+    def _localize(lang: Lang, key: str, values: tuple, options: Optional[dict] = None):
+        if METRICS is not None:
+            return METRICS.render(lang, key, values, options, Translator._uncounted)
+        if RENDER_CACHE is not None and key not in RENDER_CACHE.exclude:
+            return RENDER_CACHE.render(lang, key, values, options, Translator._render)
+        return Translator._render(lang, key, values, options)
 
     @staticmethod
-    def _localize(lang: Lang, key: str, *placeholders: Placeholder):
-        if Translator._key_check(lang, key):
-            return inject_placeholders(TRANSLATIONS[lang][key], *placeholders)
-        if Translator._key_check(FALLBACK_LANG, key):
-            return inject_placeholders(TRANSLATIONS[FALLBACK_LANG][key], *placeholders)
-        log.error(f"Key `{key}` not found in requested or fallback langs!!!")
-        return key
+    def _uncounted(lang: Lang, key: str, values: tuple, options: Optional[dict] = None):
+        if RENDER_CACHE is not None and key not in RENDER_CACHE.exclude:
+            return RENDER_CACHE.render(lang, key, values, options, Translator._render)
+        return Translator._render(lang, key, values, options)
+
+    @staticmethod
+    def _render(lang: Lang, key: str, values: tuple, options: Optional[dict] = None):
+        # Tables are merged with their fallbacks when loaded, so a miss means no lang in the chain has the key
+        if (message := TRANSLATIONS[lang].get(key)) is None:
+            if METRICS is not None:
+                METRICS.count_missing(lang, key)
+            return TRANSLATIONS.report_unresolved(lang, key)
+        return message.render(PLACEHOLDERS[key], values, options)
+
+    def render_many(self, items: list):
+        """
+        Renders many keys at once. See `render_many_static`.
+        """
+        return self.render_many_static(self.lang, items)
+
+    @staticmethod
+    def render_many_static(lang: Union[Lang, str], items: list):
+        """
+        Renders many keys at once. `items` holds `(key, args)` pairs or bare keys, where `key` is
+        the arb key and `args` the placeholder values as a tuple, or a dict keyed by parameter name.
+        Optional parameters keep their baked values. Returns the rendered strings in order.
+        Batches bypass the render cache and the metrics.
+        """
+        if isinstance(lang, str):
+            lang = Lang(lang)
+        return render_batch(TRANSLATIONS, lang, PLACEHOLDERS, items)
 
     def united_states(self):
         """
@@ -49,7 +217,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "unitedStates")
+        return Translator._localize(lang, "unitedStates", ())
 
     def puerto_rico(self):
         """
@@ -64,7 +232,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "puertoRico")
+        return Translator._localize(lang, "puertoRico", ())
 
     def canada(self):
         """
@@ -79,7 +247,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "canada")
+        return Translator._localize(lang, "canada", ())
 
     def mexico(self):
         """
@@ -94,7 +262,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "mexico")
+        return Translator._localize(lang, "mexico", ())
 
     def virgin_islands_british(self):
         """
@@ -109,7 +277,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "virginIslandsBritish")
+        return Translator._localize(lang, "virginIslandsBritish", ())
 
     def virgin_islands_us(self):
         """
@@ -124,7 +292,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "virginIslandsUS")
+        return Translator._localize(lang, "virginIslandsUS", ())
 
     def united_kingdom(self):
         """
@@ -139,7 +307,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "unitedKingdom")
+        return Translator._localize(lang, "unitedKingdom", ())
 
     def france(self):
         """
@@ -154,7 +322,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "france")
+        return Translator._localize(lang, "france", ())
 
     def switzerland(self):
         """
@@ -169,7 +337,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "switzerland")
+        return Translator._localize(lang, "switzerland", ())
 
     def bulgaria(self):
         """
@@ -184,7 +352,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "bulgaria")
+        return Translator._localize(lang, "bulgaria", ())
 
     def estonia(self):
         """
@@ -199,7 +367,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "estonia")
+        return Translator._localize(lang, "estonia", ())
 
     def greece(self):
         """
@@ -214,7 +382,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "greece")
+        return Translator._localize(lang, "greece", ())
 
     def latvia(self):
         """
@@ -229,7 +397,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "latvia")
+        return Translator._localize(lang, "latvia", ())
 
     def spain(self):
         """
@@ -244,7 +412,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "spain")
+        return Translator._localize(lang, "spain", ())
 
     def hungary(self):
         """
@@ -259,7 +427,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "hungary")
+        return Translator._localize(lang, "hungary", ())
 
     def romania(self):
         """
@@ -274,7 +442,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "romania")
+        return Translator._localize(lang, "romania", ())
 
     def sweden(self):
         """
@@ -289,7 +457,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "sweden")
+        return Translator._localize(lang, "sweden", ())
 
     def austria(self):
         """
@@ -304,7 +472,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "austria")
+        return Translator._localize(lang, "austria", ())
 
     def croatia(self):
         """
@@ -319,7 +487,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "croatia")
+        return Translator._localize(lang, "croatia", ())
 
     def finland_aland_islands(self):
         """
@@ -334,38 +502,49 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "finlandAlandIslands")
+        return Translator._localize(lang, "finlandAlandIslands", ())
 
-    def investment_created_at(self, date: str, time: str):
+    def investment_created_at(self, date: datetime, time: datetime):
         """
         `Opened: {date} at {time}`
 
         Description: Displays a position's creation date
 
         Placeholders:
-            date: String
-            time: String
+            date: {
+                type: DateTime
+                format: yMd
+            }
+            time: {
+                type: DateTime
+                format: jm
+            }
         """
         return self.investment_created_at_static(self.lang, date, time)
 
     @staticmethod
-    def investment_created_at_static(lang: Union[Lang, str], date: str, time: str):
+    def investment_created_at_static(lang: Union[Lang, str], date: datetime, time: datetime):
         """
         `Opened: {date} at {time}`
 
         Description: Displays a position's creation date
 
         Placeholders:
-            date: String
-            time: String
+            date: {
+                type: DateTime
+                format: yMd
+            }
+            time: {
+                type: DateTime
+                format: jm
+            }
         """
         if isinstance(lang, str):
             lang = Lang(lang)
         return Translator._localize(
             lang,
             "investmentCreatedAt",
-            Placeholder("date").set(date),
-            Placeholder("time").set(time),
+            (date, time),
         )
 
     def followers_count(self, amount: int):
@@ -400,7 +579,7 @@ class Translator:
         return Translator._localize(
             lang,
             "followersCount",
-            PlaceholderNum("amount", format=NumFormat.compact, num_type=NumType.int).set(amount),
+            (amount,),
         )
 
     def no(self):
@@ -416,7 +595,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "no")
+        return Translator._localize(lang, "no", ())
 
     def cancel(self):
         """
@@ -435,7 +614,7 @@ class Translator:
         """
         if isinstance(lang, str):
             lang = Lang(lang)
-        return Translator._localize(lang, "cancel")
+        return Translator._localize(lang, "cancel", ())
 
     def joined_date(self, date: str):
         """
@@ -463,7 +642,7 @@ class Translator:
         return Translator._localize(
             lang,
             "joinedDate",
-            Placeholder("date").set(date),
+            (date,),
         )
 
     def many_items(self, first: str, count: int):
@@ -490,8 +669,7 @@ class Translator:
         return Translator._localize(
             lang,
             "manyItems",
-            Placeholder("first").set(first),
-            PlaceholderNum("count", num_type=NumType.int).set(count),
+            (first, count),
         )
 
     def notification_requested_to_follow(self, username: str, count: int):
@@ -528,13 +706,12 @@ class Translator:
         return Translator._localize(
             lang,
             "notificationRequestedToFollow",
-            Placeholder("username").set(username),
-            PlaceholderNum("count", format=NumFormat.compact, num_type=NumType.int).set(count),
+            (username, count),
         )
 
     def stock_change(self, stock: str, pnl: float, profit_loss: str, pnl_decimal_digits: int = 2):
         """
-        `{stock} has received {pnl} {profitLoss, select, profit{Profit} loss{Loss}, other{Even}}`
+        `{stock} has received {pnl} {profitLoss, select, profit{Profit} loss{Loss} other{Even}}`
 
         Description: Show when a stock has changed and by how much
 
@@ -556,7 +733,7 @@ class Translator:
     @staticmethod
     def stock_change_static(lang: Union[Lang, str], stock: str, pnl: float, profit_loss: str, pnl_decimal_digits: int = 2):
         """
-        `{stock} has received {pnl} {profitLoss, select, profit{Profit} loss{Loss}, other{Even}}`
+        `{stock} has received {pnl} {profitLoss, select, profit{Profit} loss{Loss} other{Even}}`
 
         Description: Show when a stock has changed and by how much
 
@@ -578,7 +755,10 @@ class Translator:
         return Translator._localize(
             lang,
             "stockChange",
-            Placeholder("stock").set(stock),
-            PlaceholderNum("pnl", format=NumFormat.decimalPercentPattern, num_type=NumType.double, decimalDigits=pnl_decimal_digits).set(pnl),
-            Placeholder("profitLoss").set(profit_loss),
+            (stock, pnl, profit_loss),
+            None if pnl_decimal_digits == 2 else {"pnl": {"decimalDigits": pnl_decimal_digits}},
         )
+
+
+# Module-level functions such as `followers_count(count)` render in LOCALE's current lang
+__getattr__ = LOCALE.module_getattr(globals(), Translator)
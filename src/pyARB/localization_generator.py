@@ -1,133 +1,101 @@
+import hashlib
+import io
 import os
 import shutil
 import json
+import time
+from typing import Optional, Union
 from tqdm import tqdm
 
-from pyARB.localize import Placeholder, PlaceholderNum, NumFormat, NumType, snake_case
-from pyARB.exceptions import UnsupportedFormat, DuplicateKey
+from pyARB.localize import read_arbs, iter_arb, plural_rule, fallback_chains
+from pyARB.codegen import ArbKey, tab, quote
+from pyARB.catalog import catalog_bytes
+from pyARB.exceptions import InvalidFormat, UnsupportedFormat, DuplicateKey
 
 
-def tab(n: int):
-    return " " * n * 4
+MANIFEST_NAME = "generated_components.manifest.json"
 
 
-class ArbKey:
-    def __init__(self, key: str, native_value: str):
-        self.key = key
-        self.snake_key = snake_case(key)
-        self.native_value = native_value
-        self.description: str = None
-        self.placeholders: list[Placeholder] = None
+def digest(*data):
+    return hashlib.sha256(json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
 
-    def method_signature(self, static=False):
-        signature = tab(1)
-        if static:
-            signature += "@staticmethod\n" + tab(1)
-        signature += "def " + self.snake_key
-        if static:
-            signature += "_static(lang: Union[Lang, str]"
-        else:
-            signature += "(self"
-        if self.placeholders:
-            params = [p.get_parameter() for p in self.placeholders]
-            params.extend(
-                _
-                for p in self.placeholders
-                if isinstance(p, PlaceholderNum) and p.optional_parameters
-                for _ in p.format_params()
-            )
-            signature += ", " + ", ".join(params)
-        signature += "):\n"
-        return signature
-
-    def docstring(self):
-        doc = tab(2) + f'"""\n{tab(2)}`{self.native_value}`\n'
-
-        if self.description:
-            doc += f"\n{tab(2)}Description: {self.description}\n"
-
-        if self.placeholders:
-            doc += f"\n{tab(2)}Placeholders:\n"
-            for p in self.placeholders:
-                doc += tab(3) + p.name + ": "
-                if type(p) is Placeholder:
-                    doc += "String\n"
-                elif type(p) is PlaceholderNum:
-                    if not p.format:
-                        doc += p.get_type_string() + "\n"
-                    else:
-                        doc += "{\n" + tab(4) + "type: " + p.get_type_string() + "\n"
-                        doc += tab(4) + "format: " + p.format.name + "\n"
-                        if p.example:
-                            doc += tab(4) + "example: " + p.example + "\n"
-                        if p.description:
-                            doc += tab(4) + "description: " + p.description + "\n"
-                        if p.optional_parameters:
-                            doc += tab(4) + "bakedParameters: {\n"
-                            for k, v in p.optional_parameters.items():
-                                doc += tab(5) + f"{k}: {v}\n"
-                            doc += tab(4) + "}\n"
-                        doc += tab(3) + "}\n"
-
-        doc += tab(2) + '"""\n'
-        return doc
-
-    def method_return(self, static=False):
-        ret = tab(2) + "return "
-        if static:
-            ret = tab(2) + "if isinstance(lang, str):\n" + tab(3) + "lang = Lang(lang)\n" + ret
-            ret += "Translator._localize("
-            if self.placeholders:
-                ret += "\n" + tab(3) + "lang,\n" + tab(3) + f'"{self.key}",\n'
-                for p in self.placeholders:
-                    ret += tab(3) + p.get_code() + "\n"
-                ret += tab(2) + ")\n"
-            else:
-                ret += f'lang, "{self.key}")\n'
-        else:
-            ret += f"self.{self.snake_key}_static(self.lang"
-            if self.placeholders:
-                params = [p.snake_name for p in self.placeholders]
-                params.extend(
-                    (a := p.snake_name + "_" + snake_case(k)) + "=" + a
-                    for p in self.placeholders
-                    if isinstance(p, PlaceholderNum) and p.optional_parameters
-                    for k in p.optional_parameters.keys()
-                )
-                ret += ", " + ", ".join(params)
-            ret += ")\n"
-        return ret
-
-    def print_methods(self):
-        methods = "\n" + self.method_signature() + self.docstring() + self.method_return()
-        methods += "\n" + self.method_signature(static=True) + self.docstring() + self.method_return(static=True)
-        return methods
-
-    def process_metadata(self, data: dict):
-        if "description" in data:
-            self.description = data["description"]
-        if "placeholders" in data:
-            self.placeholders = []
-            for k, v in data["placeholders"].items():
-                if (t := v.get("type")) == "String" or not t:
-                    self.placeholders.append(Placeholder(k))
-                elif t in {"int", "double", "num"}:
-                    p = PlaceholderNum(
-                        k,
-                        format=NumFormat(v["format"]) if v.get("format") else None,
-                        num_type=NumType(t),
-                        **(v.get("optionalParameters") or {}),
-                    )
-                    if extra := v.get("example"):
-                        p.example = extra
-                    if extra := v.get("description"):
-                        p.description = extra
-                    self.placeholders.append(p)
-                else:
-                    raise UnsupportedFormat(t + " is not yet a supported type")
-
-
-def generate_localizations(arb_location: str, locales: list[str], target_directory: str = None):
+
+def file_digest(path: str):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def generator_digest():
+    """
+    Digest of pyARB's own modules, so code generated by another version of pyARB is never reused.
+    """
+    directory = os.path.dirname(__file__)
+    modules = sorted(m for m in os.listdir(directory) if m.endswith(".py"))
+    return digest(*(file_digest(os.path.join(directory, m)) for m in modules))
+
+
+def _read_manifest(path: str):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _write_if_changed(path: str, data: Union[str, bytes]):
+    """
+    Writes `data` unless the file already holds exactly these bytes, which keeps its mtime
+    and with it the `.pyc` python compiled from it.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def generate_localizations(
+    arb_location: str,
+    locales: list[str],
+    target_directory: str = None,
+    specialize: bool = False,
+    binary_catalog: bool = False,
+    fallbacks: dict[str, list[str]] = None,
+    lazy_methods: bool = False,
+    workers: Optional[int] = 1,
+):
+    """
+    Generates `generated_components.py` from the primary arb file `locales[0]`.
+
+    With `specialize` every (locale, key) pair gets its own render function with the
+    translation baked in, so the generated module no longer reads the arb files at runtime.
+
+    With `binary_catalog` the compiled translations are also written to `generated_components.catalog`
+    and the generated module maps that file instead of reading the arb files. Processes that import it
+    share the catalog's memory. It has no effect together with `specialize`.
+
+    `fallbacks` maps a locale to the locales tried, in order, when it lacks a key, e.g. `{"es_MX": ["es_ES"]}`.
+    The primary locale is always tried last. A tag that is not one of `locales`, e.g. `{"ca": ["es_ES"]}`, only
+    makes the generated `negotiate` resolve it through its fallbacks.
+
+    With `lazy_methods` the per-key methods are left out of the generated `Translator` and created the first
+    time they are used, which keeps the module small and its import time flat for catalogs with many keys.
+    The methods then have no docstrings. It has no effect together with `specialize`.
+
+    Generation is incremental. `generated_components.manifest.json` keeps the digest of every arb file and the
+    code generated for every key, so only keys whose entry, metadata or (with `specialize`) translations changed
+    are generated again, and files whose contents did not change are not rewritten.
+
+    Whenever an arb file changed every locale is parsed, which raises InvalidFormat or DuplicateKey for a broken
+    translation before anything is written. With `workers` other than 1 the locales are parsed in a pool of that
+    many processes, or one per core if None.
+    """
     arb_location = arb_location.replace("\\", "/")
     if arb_location.endswith("/"):
         arb_location = arb_location[:-1]
@@ -143,73 +111,391 @@ def generate_localizations(arb_location: str, locales: list[str], target_directo
             target_directory = target_directory[:-1]
         raise FileNotFoundError(target_directory + " does not exist")
 
+    fallbacks = fallbacks or {}
+    # Tags other than the locales may have fallbacks, which only negotiation uses
+    for l in [l for v in fallbacks.values() for l in v]:
+        if l not in locales:
+            raise UnsupportedFormat(f"Fallback locale {l} is not one of {', '.join(locales)}")
+    chains = fallback_chains(locales, locales[0], fallbacks)
+
     primary_arb = os.path.join(arb_location, locales[0] + ".arb")
     if not os.path.exists(primary_arb):
         raise FileNotFoundError(primary_arb + " does not exist")
 
-    with open(primary_arb, "r") as f:
-        arb: dict = json.loads(f.read())
+    # Raises DuplicateKey for a key found twice
+    arb = dict(iter_arb(primary_arb))
 
     keys: dict[str, ArbKey] = {}
     for k, v in arb.items():
         if k == "@@locale":
             continue
         if "@" not in k:
-            if k in keys:
-                raise DuplicateKey(f"Key {k} found twice in {primary_arb}")
             keys[k] = ArbKey(k, v)
         elif k[1:] in keys:
             keys[k[1:]].process_metadata(v)
         else:
             raise UnsupportedFormat(f"Expected to find `@{k}` after original `{k}`")
 
-    with open(os.path.join(target_directory, "generated_components.py"), "w") as f:
+    # Check if other locales have arb files, if so, leave them, if not, create them.
+    for l in locales[1:]:
+        if not os.path.exists(new_arb := os.path.join(arb_location, l + ".arb")):
+            shutil.copy(primary_arb, new_arb)
+
+    output = os.path.join(target_directory, "generated_components.py")
+    catalog = os.path.join(target_directory, "generated_components.catalog")
+    manifest_path = os.path.join(target_directory, MANIFEST_NAME)
+    mapped = binary_catalog and not specialize
+    lazy_methods = lazy_methods and not specialize
+    options = digest(generator_digest(), arb_location, locales, specialize, binary_catalog, fallbacks, lazy_methods)
+    files = {l: file_digest(os.path.join(arb_location, l + ".arb")) for l in locales}
+    manifest = _read_manifest(manifest_path)
+    if manifest.get("options") != options:
+        manifest = {}
+    elif manifest.get("files") == files and os.path.exists(output) and (not mapped or os.path.exists(catalog)):
+        print("Localizations are up to date")
+        return
+
+    arb_files = {l: os.path.join(arb_location, l + ".arb") for l in locales}
+    messages = {}
+    if manifest.get("files") != files and not specialize:
+        messages = read_arbs(arb_files, workers=workers)
+
+    # The code of a key only depends on its entry and metadata, and in specialized modules on its translations
+    translations = {}
+    if specialize:
+        for l in locales:
+            translations[l] = dict(iter_arb(arb_files[l]))
+    digests = {k: digest(k, arb[k], arb.get("@" + k), [t.get(k) for t in translations.values()]) for k in keys}
+    cached = manifest.get("keys", {})
+    code = {k: cached[k] for k in keys if k in cached and cached[k]["digest"] == digests[k]}
+    changed = [k for k in keys if k not in code]
+    if changed:
+        if code:
+            print(f"Generating {len(changed)} changed localizations...")
+        else:
+            print("Generating localizations...")
+        if specialize:
+            messages = read_arbs(arb_files, set(changed), workers)
+        for k in tqdm(changed, ncols=50):
+            v = keys[k]
+            code[k] = {"digest": digests[k]}
+            if specialize:
+                functions = v.print_render_functions({l: m[k] for l, m in messages.items() if k in m}, chains)
+                code[k]["render_functions"] = functions
+            else:
+                code[k]["definitions"] = v.print_definitions()
+            if not lazy_methods:
+                code[k]["methods"] = v.print_methods(specialized=specialize)
+
+    with io.StringIO() as f:
+        if binary_catalog and not specialize:
+            f.write("import os\n")
+        f.write("from datetime import datetime\n")
         f.write("from enum import Enum\n")
-        f.write("from typing import Union\n")
-        f.write(
-            "from pyARB.localize import log, read_translations, inject_placeholders, Placeholder, PlaceholderNum, NumFormat, NumType\n\n\n"
-        )
+        if specialize:
+            f.write("from typing import Union\n")
+        else:
+            f.write("from typing import Iterable, Optional, Union\n")
+            f.write("from pyARB.cache import RenderCache\n")
+            f.write("from pyARB.metrics import RenderMetrics\n")
+            if lazy_methods:
+                f.write("from pyARB.lazy import LazyTranslator\n")
+        f.write("from pyARB.negotiation import LocaleNegotiator\n")
+        f.write("from pyARB.context import LocaleContext\n")
+        if specialize:
+            f.write(
+                "from pyARB.localize import (\n"
+                "    NumFormat,\n"
+                "    number_formatter,\n"
+                "    plural_category,\n"
+                "    plural_rule,\n"
+                "    date_formatter,\n"
+                "    call_batch,\n"
+                ")\n\n\n"
+            )
+        elif binary_catalog:
+            f.write("from pyARB.catalog import load_catalog\n")
+            f.write(
+                "from pyARB.localize import (\n"
+                "    index_placeholders,\n"
+                "    render_batch,\n"
+                "    Placeholder,\n"
+                "    PlaceholderNum,\n"
+                "    PlaceholderDateTime,\n"
+                "    NumFormat,\n"
+                "    NumType,\n"
+                ")\n\n\n"
+            )
+        else:
+            f.write(
+                "from pyARB.localize import (\n"
+                "    read_translations,\n"
+                "    index_placeholders,\n"
+                "    render_batch,\n"
+                "    Placeholder,\n"
+                "    PlaceholderNum,\n"
+                "    PlaceholderDateTime,\n"
+                "    NumFormat,\n"
+                "    NumType,\n"
+                ")\n\n\n"
+            )
 
         f.write("class Lang(Enum):\n")
         for l in locales:
             f.write(tab(1) + f'{l} = "{l}"\n')
 
-        f.write(f'\n\nTRANSLATIONS = read_translations("{arb_location}", Lang)\n')
-        f.write(f"FALLBACK_LANG = Lang.{locales[0]}\n\n")
+        f.write(f"\n\nFALLBACK_LANG = Lang.{locales[0]}\n")
+        f.write("# Langs tried, in order, before FALLBACK_LANG when a lang lacks a key or a tag has no lang\n")
+        f.write("FALLBACKS = {\n")
+        for k, v in fallbacks.items():
+            f.write(tab(1) + f"{'Lang.' + k if k in locales else quote(k)}: [{', '.join('Lang.' + l for l in v)}],\n")
+        f.write("}\n")
+        if specialize:
+            if rules := [l for l in locales if plural_rule(l)]:
+                f.write("\n# CLDR plural rule of every locale\n")
+                for l in rules:
+                    f.write(f'_plural_{l} = plural_rule("{l}")\n')
+            f.write("\n# Best available Lang for a tag such as `es-MX` or a whole Accept-Language header\n")
+            f.write("negotiate = LocaleNegotiator(Lang, FALLBACK_LANG, FALLBACKS).negotiate\n\n")
+            f.write("# Current Lang of each asyncio task or thread, read by the module-level render functions\n")
+            f.write("LOCALE = LocaleContext(Lang, FALLBACK_LANG, negotiate)\n")
+            for k in keys:
+                f.write(code[k]["render_functions"])
+            f.write("\n\n_RENDERERS = {\n")
+            for v in keys.values():
+                f.write(tab(1) + f'"{v.key}": {v.table_name()},\n')
+            f.write("}\n")
+            f.write(
+                """
 
-        f.write(
-            """
 class Translator:
     def __init__(self, lang: Union[Lang, str]):
         if isinstance(lang, str):
             lang = Lang(lang)
         self.lang = lang
 
+    def render_many(self, items: list):
+        \"\"\"
+        Renders many keys at once. See `render_many_static`.
+        \"\"\"
+        return self.render_many_static(self.lang, items)
+
+    @staticmethod
+    def render_many_static(lang: Union[Lang, str], items: list):
+        \"\"\"
+        Renders many keys at once. `items` holds `(key, args)` pairs or bare keys, where `key` is
+        the arb key and `args` the method's arguments as a tuple, or a dict keyed by parameter name.
+        Returns the rendered strings in order.
+        \"\"\"
+        if isinstance(lang, str):
+            lang = Lang(lang)
+        return call_batch(_RENDERERS, lang, items)
+"""
+            )
+        else:
+            if binary_catalog:
+                if manifest.get("files") != files or not os.path.exists(catalog):
+                    messages = messages or read_arbs(arb_files, workers=workers)
+                    _write_if_changed(catalog, catalog_bytes(messages))
+                f.write(
+                    "TRANSLATIONS = load_catalog(\n"
+                    '    os.path.join(os.path.dirname(__file__), "generated_components.catalog"),\n'
+                    "    Lang,\n"
+                    "    FALLBACK_LANG,\n"
+                    "    FALLBACKS,\n"
+                    ")\n\n"
+                )
+            else:
+                f.write(f'TRANSLATIONS = read_translations("{arb_location}", Lang, FALLBACK_LANG, FALLBACKS)\n\n')
+            f.write("# Best available Lang for a tag such as `es-MX` or a whole Accept-Language header\n")
+            f.write("negotiate = LocaleNegotiator(Lang, FALLBACK_LANG, FALLBACKS).negotiate\n\n")
+            f.write("# Current Lang of each asyncio task or thread, read by the module-level render functions\n")
+            f.write("LOCALE = LocaleContext(Lang, FALLBACK_LANG, negotiate)\n\n")
+            f.write("# Placeholder definitions of every key, numbered in the order methods pass their values\n")
+            f.write("PLACEHOLDERS = index_placeholders({\n")
+            for k in keys:
+                f.write(code[k]["definitions"])
+            f.write("})\n\n")
+            f.write(
+                """
+def preload(*langs: Union[Lang, str], workers: Optional[int] = 1):
+    \"\"\"
+    Loads the translations of the given langs now instead of on first use. Loads every lang if none are given.
+    With `workers` other than 1 the arb files are parsed in a pool of that many processes, or one per core if None.
+    \"\"\"
+    TRANSLATIONS.preload(*langs, workers=workers)
+
+
+RENDER_CACHE: Optional[RenderCache] = None
+
+
+def enable_render_cache(maxsize: int = 4096, exclude: Iterable[str] = ()):
+    \"\"\"
+    Caches rendered strings in a bounded LRU cache. Keys in `exclude` are never cached.
+    Returns the cache so its `stats()` can be read.
+    \"\"\"
+    global RENDER_CACHE
+    RENDER_CACHE = RenderCache(maxsize, exclude)
+    return RENDER_CACHE
+
+
+def disable_render_cache():
+    global RENDER_CACHE
+    RENDER_CACHE = None
+
+
+METRICS: Optional[RenderMetrics] = None
+
+
+def enable_metrics(sample_every: int = 100):
+    \"\"\"
+    Counts renders per lang and key, fallbacks, missing keys and selects falling through to `other`, and times
+    every `sample_every`th render. Returns the metrics so their `snapshot()` can be exported.
+    \"\"\"
+    global METRICS
+    disable_metrics()
+    METRICS = RenderMetrics(TRANSLATIONS, sample_every).attach()
+    return METRICS
+
+
+def disable_metrics():
+    global METRICS
+    if METRICS is not None:
+        METRICS.detach()
+    METRICS = None
+
+"""
+            )
+            if not binary_catalog:
+                f.write(
+                    """
+def _reloaded(langs: list):
+    if langs and RENDER_CACHE is not None:
+        RENDER_CACHE.invalidate()
+    return langs
+
+
+def reload_translations(*langs: Union[Lang, str]):
+    \"\"\"
+    Reads the arb files that changed since they were loaded, or those of the given langs, again and swaps in
+    their new translations without blocking renders. Returns the reloaded langs.
+    \"\"\"
+    return _reloaded(TRANSLATIONS.reload(*langs))
+
+
+def auto_reload(interval: float = 2.0):
+    \"\"\"
+    Checks the arb files for changes every `interval` seconds on a background thread. See `reload_translations`.
+    \"\"\"
+    TRANSLATIONS.auto_reload(interval, on_reload=_reloaded)
+
+
+def stop_auto_reload():
+    TRANSLATIONS.stop_auto_reload()
+
+"""
+                )
+
+            if lazy_methods:
+                f.write(
+                    """
+class Translator(LazyTranslator):
+    # Methods such as `followers_count` and `followers_count_static` are created on first use from these
+    _definitions = PLACEHOLDERS
+    _globals = globals()
+"""
+                )
+            else:
+                f.write("\nclass Translator:")
+            f.write(
+                """
+    def __init__(self, lang: Union[Lang, str]):
+        if isinstance(lang, str):
+            lang = Lang(lang)
+        self.lang = lang
+
+    @staticmethod
+    def _localize(lang: Lang, key: str, values: tuple, options: Optional[dict] = None):
+        if METRICS is not None:
+            return METRICS.render(lang, key, values, options, Translator._uncounted)
+        if RENDER_CACHE is not None and key not in RENDER_CACHE.exclude:
+            return RENDER_CACHE.render(lang, key, values, options, Translator._render)
+        return Translator._render(lang, key, values, options)
+
     @staticmethod
-    def _key_check(lang: Lang, key: str):
-        if lang in TRANSLATIONS:
-            if key in TRANSLATIONS[lang]:
-                return True
-            log.error(f"{lang.name}.arb does not have key `{key}`")
-        return False
+    def _uncounted(lang: Lang, key: str, values: tuple, options: Optional[dict] = None):
+        if RENDER_CACHE is not None and key not in RENDER_CACHE.exclude:
+            return RENDER_CACHE.render(lang, key, values, options, Translator._render)
+        return Translator._render(lang, key, values, options)
+
+    @staticmethod
+    def _render(lang: Lang, key: str, values: tuple, options: Optional[dict] = None):
+        # Tables are merged with their fallbacks when loaded, so a miss means no lang in the chain has the key
+        if (message := TRANSLATIONS[lang].get(key)) is None:
+            if METRICS is not None:
+                METRICS.count_missing(lang, key)
+            return TRANSLATIONS.report_unresolved(lang, key)
+        return message.render(PLACEHOLDERS[key], values, options)
+
+    def render_many(self, items: list):
+        \"\"\"
+        Renders many keys at once. See `render_many_static`.
+        \"\"\"
+        return self.render_many_static(self.lang, items)
 
     @staticmethod
-    def _localize(lang: Lang, key: str, *placeholders: Placeholder):
-        if Translator._key_check(lang, key):
-            return inject_placeholders(TRANSLATIONS[lang][key], *placeholders)
-        if Translator._key_check(FALLBACK_LANG, key):
-            return inject_placeholders(TRANSLATIONS[FALLBACK_LANG][key], *placeholders)
-        log.error(f"Key `{key}` not found in requested or fallback langs!!!")
-        return key
+    def render_many_static(lang: Union[Lang, str], items: list):
+        \"\"\"
+        Renders many keys at once. `items` holds `(key, args)` pairs or bare keys, where `key` is
+        the arb key and `args` the placeholder values as a tuple, or a dict keyed by parameter name.
+        Optional parameters keep their baked values. Returns the rendered strings in order.
+        Batches bypass the render cache and the metrics.
+        \"\"\"
+        if isinstance(lang, str):
+            lang = Lang(lang)
+        return render_batch(TRANSLATIONS, lang, PLACEHOLDERS, items)
 """
-        )
+            )
 
-        # Loop through keys to create instance and static methods
-        print("Generating localizations...")
-        for v in tqdm(keys.values(), ncols=50):
-            f.write(v.print_methods())
+        # Instance and static methods of every key
+        if not lazy_methods:
+            for k in keys:
+                f.write(code[k]["methods"])
 
-    # Check if other locales have arb files, if so, leave them, if not, create them.
-    for l in locales[1:]:
-        if not os.path.exists(new_arb := os.path.join(arb_location, l + ".arb")):
-            shutil.copy(primary_arb, new_arb)
+        f.write("\n\n# Module-level functions such as `followers_count(count)` render in LOCALE's current lang\n")
+        f.write("__getattr__ = LOCALE.module_getattr(globals(), Translator)\n")
+        _write_if_changed(output, f.getvalue())
+
+    manifest = {"options": options, "files": files, "keys": code}
+    _write_if_changed(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=1))
+
+
+def _arb_snapshot(arb_location: str):
+    return {
+        entry.name: (entry.stat().st_mtime_ns, entry.stat().st_size)
+        for entry in os.scandir(arb_location)
+        if entry.name.endswith(".arb")
+    }
+
+
+def watch_localizations(arb_location: str, locales: list[str], interval: float = 1.0, **options):
+    """
+    Generates the localizations, then generates them again whenever an arb file in `arb_location` changes
+    until interrupted. Invalid arb files are reported and the last generated code is kept.
+    `options` are passed on to `generate_localizations`.
+    """
+    snapshot = None
+    print(f"Watching {arb_location} for changes. Press Ctrl+C to stop.")
+    try:
+        while True:
+            if (current := _arb_snapshot(arb_location)) != snapshot:
+                try:
+                    generate_localizations(arb_location, locales, **options)
+                except (InvalidFormat, UnsupportedFormat, DuplicateKey, ValueError, FileNotFoundError) as e:
+                    print(f"\u001b[31m{type(e).__name__}: {e}\u001b[0m")
+                # Generating may create missing arb files, which should not trigger another run, while a file
+                # edited during the run keeps the state it was generated from so the edit is picked up next
+                snapshot = {**_arb_snapshot(arb_location), **current}
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
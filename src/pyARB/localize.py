@@ -1,11 +1,24 @@
+import hashlib
 import json
 import os
-from typing import Type
+from typing import Callable, Iterable, Optional, Type, Union
+from functools import lru_cache
 from enum import Enum
 from logging import Logger
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
 
-from pyARB.exceptions import InvalidFormat
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyARB.exceptions import InvalidFormat, DuplicateKey
+from pyARB.plurals import plural_rule
+from pyARB.numbers import NumFormat, NumberFormatter, number_formatter, compact_formatter, compact_array_formatter
+from pyARB.dates import DateFormatter, date_formatter
 
 log = Logger("pyARB")
 
@@ -33,51 +46,99 @@ def snake_case(text: str):
     return snake
 
 
-# Allowed types at the moment: String, int, double, num
+def _literal(value):
+    return json.dumps(value, ensure_ascii=False) if isinstance(value, str) else repr(value)
+
+
+# Allowed types at the moment: String, int, double, num, DateTime
 
 
 class Placeholder:
+    __slots__ = ("name", "snake_name", "example", "description", "value", "index")
+
     def __init__(self, name: str):
         self.name = name
         self.snake_name = snake_case(name)
         self.example = None
         self.description = None
+        # Position of the value in the tuple of values messages are rendered with, see `index_placeholders`
+        self.index = 0
 
     def get_parameter(self) -> str:
         return self.snake_name + ": str"
 
-    def get_code(self) -> str:
-        return f'Placeholder("{self.name}").set({self.snake_name}),'
+    def get_definition(self) -> str:
+        return f'Placeholder("{self.name}")'
+
+    def get_formatter_expression(self, locale: str) -> Optional[str]:
+        """
+        Python expression of the function formatting this placeholder in `locale` with its baked optional
+        parameters, which specialized modules bind once at module level. None if the value is used as it is.
+        """
+        return None
+
+    def get_expression(self, value: str, locale: Optional[str] = None, formatter: Optional[str] = None) -> str:
+        return value
 
     def set(self, value: str):
         self.value = value
         return self
 
+    def format_value(self, value: str, options: dict = None, locale: Optional[str] = None) -> str:
+        return value
+
     def get(self) -> str:
         return self.value
 
 
-class NumFormat(Enum):
-    compact = "compact"
-    compactCurrency = "compactCurrency"
-    compactSimpleCurrency = "compactSimpleCurrency"
-    # compactLong = "compactLong"
-    currency = "currency"
-    decimalPattern = "decimalPattern"
-    decimalPercentPattern = "decimalPercentPattern"
-    percentPattern = "percentPattern"
-    scientificPattern = "scientificPattern"
-    simpleCurrency = "simpleCurrency"
-
-
 class NumType(Enum):
     num = "num"
     int = "int"
     double = "double"
 
 
+def compact_number(value, digits, long: bool = False):
+    return compact_formatter(None, digits, long)(value)
+
+
+def readable_number(value, digits):
+    return f"{value:,.{digits}f}"
+
+
+def compact_numbers(values, digits, long: bool = False):
+    """
+    `compact_number` for a sequence or numpy array of values. Arrays are formatted by `compact_array_formatter`.
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        return compact_array_formatter(None, digits, long)(values)
+    compact = compact_formatter(None, digits, long)
+    return [compact(v) for v in values]
+
+
+def readable_numbers(values, digits, scale=1):
+    """
+    `readable_number` for a sequence or numpy array of values, each multiplied by `scale` first.
+    """
+    spec = f",.{digits}f"
+    if np is not None and isinstance(values, np.ndarray):
+        values = (values * scale if scale != 1 else values).tolist()
+    elif scale != 1:
+        values = [v * scale for v in values]
+    return [format(v, spec) for v in values]
+
+
+def format_numbers(values, format: NumFormat = None, locale: Optional[str] = None, **options):
+    """
+    Formats every value of a sequence or numpy array the same way a `PlaceholderNum`
+    with the given format and optional parameters would in `locale`.
+    """
+    return PlaceholderNum("values", format=format, **options).get_many(values, locale)
+
+
 class PlaceholderNum(Placeholder):
-    def __init__(self, name: str, format: NumFormat = None, num_type: NumType = NumType.num, **kwargs):
+    __slots__ = ("format", "num_type", "optional_parameters", "_formatters")
+
+    def __init__(self, name: str, /, format: NumFormat = None, num_type: NumType = NumType.num, **kwargs):
         super().__init__(name)
         self.format = format
         self.num_type = num_type
@@ -96,6 +157,7 @@ class PlaceholderNum(Placeholder):
             self.optional_parameters = {"symbol": "$", "decimalDigits": 2}
 
         self.optional_parameters.update(kwargs)
+        self._formatters: dict[str, NumberFormatter] = {}
 
     def format_params(self):
         return [
@@ -109,185 +171,1044 @@ class PlaceholderNum(Placeholder):
     def get_parameter(self) -> str:
         return self.snake_name + ": " + self.get_type_string()
 
-    def get_code(self) -> str:
+    def get_definition(self) -> str:
         args = [f'"{self.name}"']
         if self.format:
             args.append(f"format=NumFormat.{self.format.name}")
         if self.num_type != NumType.num:
             args.append(f"num_type=NumType.{self.num_type.name}")
-        if self.optional_parameters:
-            args.extend(k + "=" + self.snake_name + "_" + snake_case(k) for k in self.optional_parameters.keys())
-        return f'PlaceholderNum({", ".join(_ for _ in args)}).set({self.snake_name}),'
-
-    def _round_or_int(self, value: float, digits: int, recurse=True):
-        if value == int(value):
-            return int(value)
-        if recurse:
-            return self._round_or_int(round(value, digits), digits, recurse=False)
-        return round(value, digits)
-
-    def _compact(self, value, digits):
-        units = ["", "k", "M", "B", "T"]
-        u = 0
-        while value >= 1000:
-            u += 1
-            value /= 1000
-        double_check = self._round_or_int(value, digits)
-        if double_check >= 1000:
-            u += 1
-            double_check /= 1000
-        return str(self._round_or_int(double_check, digits)) + units[u]
-
-    def _readable_long(self, value, digits):
-        return f"{value:,.{digits}f}"
+        args.extend(f"{k}={v!r}" for k, v in self.optional_parameters.items())
+        return f'PlaceholderNum({", ".join(args)})'
+
+    def formatter(self, locale: str, options: dict = None) -> NumberFormatter:
+        """
+        The formatter of this placeholder's format in `locale`. `options` overrides some of the optional parameters.
+        """
+        if options:
+            return number_formatter(locale, self.format, **{**self.optional_parameters, **options})
+        if (formatter := self._formatters.get(locale)) is None:
+            formatter = self._formatters[locale] = number_formatter(locale, self.format, **self.optional_parameters)
+        return formatter
+
+    def get_many(self, values, locale: Optional[str] = None) -> list:
+        """
+        Formats every value of a sequence or numpy array the same way `get` would, or `format_value` in `locale`.
+        """
+        if locale is not None:
+            return self.formatter(locale).format_many(values)
+        options = self.optional_parameters
+        if self.format == NumFormat.compact:
+            return compact_numbers(values, 1)
+        elif self.format == NumFormat.compactLong:
+            return compact_numbers(values, 1, long=True)
+        elif self.format == NumFormat.compactCurrency:
+            return [options["name"] + v for v in compact_numbers(values, options["decimalDigits"])]
+        elif self.format == NumFormat.compactSimpleCurrency:
+            return [options["symbol"] + v for v in compact_numbers(values, options["decimalDigits"])]
+        elif self.format == NumFormat.currency:
+            return [options["name"] + v for v in readable_numbers(values, options["decimalDigits"])]
+        elif self.format == NumFormat.decimalPattern:
+            return readable_numbers(values, options["decimalDigits"])
+        elif self.format == NumFormat.decimalPercentPattern:
+            return [v + "%" for v in readable_numbers(values, options["decimalDigits"], scale=100)]
+        elif self.format == NumFormat.percentPattern:
+            return [v + "%" for v in readable_numbers(values, 0, scale=100)]
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+        if self.format == NumFormat.scientificPattern:
+            return [format(v, ".2e") for v in values]
+        elif self.format == NumFormat.simpleCurrency:
+            return [options["symbol"] + v for v in readable_numbers(values, options["decimalDigits"])]
+        return [format(v, ",") for v in values]
+
+    def get_formatter_expression(self, locale: str) -> str:
+        args = [f'"{locale}"', f"NumFormat.{self.format.name}" if self.format else "None"]
+        args.extend(f"{k}={_literal(v)}" for k, v in self.optional_parameters.items())
+        return f'number_formatter({", ".join(args)}).format'
+
+    def get_expression(self, value: str, locale: Optional[str] = None, formatter: Optional[str] = None) -> str:
+        """
+        Python expression formatting `value` the same way `get` would, or `format_value` in `locale`.
+        Optional parameters are read from the generated method's parameters.
+
+        `formatter` names the function `get_formatter_expression(locale)` is bound to. It formats the value
+        while every optional parameter keeps its baked value, so the formatter is only looked up for overrides.
+        """
+        options = {k: self.snake_name + "_" + snake_case(k) for k in self.optional_parameters}
+        if locale is not None:
+            args = [f'"{locale}"', f"NumFormat.{self.format.name}" if self.format else "None"]
+            args.extend(f"{k}={v}" for k, v in options.items())
+            lookup = f'number_formatter({", ".join(args)}).format'
+            if formatter is None:
+                return f"{lookup}({value})"
+            if not options:
+                return f"{formatter}({value})"
+            unchanged = " and ".join(f"{options[k]} == {_literal(v)}" for k, v in self.optional_parameters.items())
+            return f"({formatter} if {unchanged} else {lookup})({value})"
+        if self.format == NumFormat.compact:
+            return f"compact_number({value}, 1)"
+        elif self.format == NumFormat.compactLong:
+            return f"compact_number({value}, 1, long=True)"
+        elif self.format == NumFormat.compactCurrency:
+            return f"{options['name']} + compact_number({value}, {options['decimalDigits']})"
+        elif self.format == NumFormat.compactSimpleCurrency:
+            return f"{options['symbol']} + compact_number({value}, {options['decimalDigits']})"
+        elif self.format == NumFormat.currency:
+            return f"{options['name']} + readable_number({value}, {options['decimalDigits']})"
+        elif self.format == NumFormat.decimalPattern:
+            return f"readable_number({value}, {options['decimalDigits']})"
+        elif self.format == NumFormat.decimalPercentPattern:
+            return f'readable_number({value} * 100, {options["decimalDigits"]}) + "%"'
+        elif self.format == NumFormat.percentPattern:
+            return f'readable_number({value} * 100, 0) + "%"'
+        elif self.format == NumFormat.scientificPattern:
+            return f'format({value}, ".2e")'
+        elif self.format == NumFormat.simpleCurrency:
+            return f"{options['symbol']} + readable_number({value}, {options['decimalDigits']})"
+        return f'format({value}, ",")'
 
     def set(self, value: float):
         self.value = value
         return self
 
     def get(self) -> str:
-        value = self.value
-        options = self.optional_parameters
+        return self.format_value(self.value)
+
+    def format_value(self, value: float, options: dict = None, locale: Optional[str] = None) -> str:
+        """
+        Formats `value` without storing it. `options` overrides some of the optional parameters.
+
+        With a `locale` the number is formatted with its symbols and patterns by a cached `NumberFormatter`,
+        otherwise with US separators and the currency in front.
+        """
+        if locale is not None:
+            return self.formatter(locale, options).format(value)
+        if options:
+            options = {**self.optional_parameters, **options}
+        else:
+            options = self.optional_parameters
         if self.format == NumFormat.compact:
-            return self._compact(value, 1)
+            return compact_number(value, 1)
+        elif self.format == NumFormat.compactLong:
+            return compact_number(value, 1, long=True)
         elif self.format == NumFormat.compactCurrency:
-            return options["name"] + self._compact(value, options["decimalDigits"])
+            return options["name"] + compact_number(value, options["decimalDigits"])
         elif self.format == NumFormat.compactSimpleCurrency:
-            return options["symbol"] + self._compact(value, options["decimalDigits"])
+            return options["symbol"] + compact_number(value, options["decimalDigits"])
         elif self.format == NumFormat.currency:
-            return options["name"] + self._readable_long(value, options["decimalDigits"])
+            return options["name"] + readable_number(value, options["decimalDigits"])
         elif self.format == NumFormat.decimalPattern:
-            return self._readable_long(value, options["decimalDigits"])
+            return readable_number(value, options["decimalDigits"])
         elif self.format == NumFormat.decimalPercentPattern:
-            return self._readable_long(value * 100, options["decimalDigits"]) + "%"
+            return readable_number(value * 100, options["decimalDigits"]) + "%"
         elif self.format == NumFormat.percentPattern:
-            return self._readable_long(value * 100, 0) + "%"
+            return readable_number(value * 100, 0) + "%"
         elif self.format == NumFormat.scientificPattern:
             return f"{value:.2e}"
         elif self.format == NumFormat.simpleCurrency:
-            return options["symbol"] + self._readable_long(value, options["decimalDigits"])
+            return options["symbol"] + readable_number(value, options["decimalDigits"])
         return f"{value:,}"
 
 
-def read_translations(arb_location: str, languages: Type[Enum]):
-    translations: dict[Type[Enum], dict[str, str]] = {}
-    for lang in languages:
-        arb_file = arb_location + "/" + lang.name + ".arb"
-        if not os.path.exists(arb_file):
-            log.warn(f"{lang.name}.arb not found in {arb_location}; using fallback lang")
+class PlaceholderDateTime(Placeholder):
+    """
+    A datetime placeholder. `format` is an ARB DateTime skeleton such as `yMd` or `jm`, several joined with `+`
+    as `yMd+jm`, or a CLDR date pattern when `custom` (the ARB `isCustomDateFormat`).
+    """
+
+    __slots__ = ("format", "custom", "_formatters")
+
+    def __init__(self, name: str, /, format: str, custom: bool = False):
+        super().__init__(name)
+        self.format = format
+        self.custom = custom
+        self._formatters: dict[Optional[str], DateFormatter] = {}
+
+    def get_parameter(self) -> str:
+        return self.snake_name + ": datetime"
+
+    def get_definition(self) -> str:
+        args = [f'"{self.name}"', f"format={json.dumps(self.format, ensure_ascii=False)}"]
+        if self.custom:
+            args.append("custom=True")
+        return f'PlaceholderDateTime({", ".join(args)})'
+
+    def formatter(self, locale: Optional[str]) -> DateFormatter:
+        """
+        The formatter of this placeholder's format in `locale`, compiled the first time it is needed.
+        """
+        if (formatter := self._formatters.get(locale)) is None:
+            formatter = self._formatters[locale] = date_formatter(locale, self.format, self.custom)
+        return formatter
+
+    def get_many(self, values: Iterable, locale: Optional[str] = None) -> list:
+        """
+        Formats every datetime of `values` the same way `format_value` would in `locale`.
+        """
+        formatter = self.formatter(locale).format
+        return [formatter(v) for v in values]
+
+    def get_formatter_expression(self, locale: str) -> str:
+        args = [json.dumps(locale), json.dumps(self.format, ensure_ascii=False)]
+        if self.custom:
+            args.append("custom=True")
+        return f'date_formatter({", ".join(args)}).format'
+
+    def get_expression(self, value: str, locale: Optional[str] = None, formatter: Optional[str] = None) -> str:
+        return f"{formatter or self.get_formatter_expression(locale)}({value})"
+
+    def get(self) -> str:
+        return self.format_value(self.value)
+
+    def format_value(self, value, options: dict = None, locale: Optional[str] = None) -> str:
+        """
+        Formats the datetime `value` with the names and patterns of `locale`, or those of `root` (English).
+        """
+        return self.formatter(locale).format(value)
+
+
+_BRACKET = re.compile(r"([{}])")
+_NOT_WHITESPACE = str.maketrans("", "", " \n\t")
+
+
+def purify(text: str):
+    """
+    Removes the whitespace from the parts of a message between an odd number of brackets, i.e. argument names,
+    select and plural types and case keys, leaving the literal text and the text of cases as they are.
+
+    Raises InvalidFormat with the offset of the first unbalanced bracket.
+    """
+    if "{" not in text and "}" not in text:
+        return text
+    # Text and brackets alternate, so the text after the bracket at i is at i + 1
+    pieces = _BRACKET.split(text)
+    depth = 0
+    for i in range(1, len(pieces), 2):
+        if pieces[i] == "{":
+            depth += 1
+        elif (depth := depth - 1) < 0:
+            _unbalanced(text)
+        if depth % 2 == 1:
+            piece = pieces[i + 1]
+            if " " in piece or "\n" in piece or "\t" in piece:
+                pieces[i + 1] = piece.translate(_NOT_WHITESPACE)
+    if depth:
+        _unbalanced(text)
+    return "".join(pieces)
+
+
+def _unbalanced(text: str):
+    opened = []
+    for m in _BRACKET.finditer(text):
+        if m.group() == "{":
+            opened.append(m.start())
+        elif not opened:
+            raise InvalidFormat(f"Unexpected `}}` at {m.start()} in `{text}`")
         else:
-            translations[lang] = {}
-            with open(arb_file, "r", encoding="utf-8") as f:
-                arb: dict[str, str] = json.loads(f.read())
-            for k, v in arb.items():
-                if "@" not in k:
-                    # purify whitespace
-                    purified = ""
-                    layer = 0
-                    for c in v:
-                        if layer % 2 == 1 and c in {" ", "\n", "\t"}:
-                            continue
-                        if c == "{":
-                            layer += 1
-                        elif c == "}":
-                            layer -= 1
-                        if layer < 0:
-                            raise InvalidFormat(f"`{lang} -> {k} -> {v}` has invalid brackets")
-                        purified += c
-                    if layer != 0:
-                        raise InvalidFormat(f"`{lang} -> {k} -> {v}` has invalid brackets")
-                    translations[lang][k] = purified
-    return translations
+            opened.pop()
+    raise InvalidFormat(f"Unclosed `{{` at {opened[-1]} in `{text}`")
 
 
-def _split_select_cases(selectable: str):
+_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Keys without escapes and the separators after values, matched without going through the decoder
+_PLAIN_KEY = re.compile(r'[ \t\n\r]*"([^"\\]*)"[ \t\n\r]*:')
+_SEPARATOR = re.compile(r"[ \t\n\r]*([,}])")
+
+
+class _ArbStream:
     """
-    Could be passed a string with content beyond the end of the select cases
-    such as `male{He}female{She}other{They}} went to {storeName}.`
+    The text of an arb file read in chunks, with the position of the decoder in the file for error messages.
+    """
+
+    def __init__(self, f, arb_file: str, chunk_size: int):
+        self.f = f
+        self.arb_file = arb_file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        # Characters and lines dropped from the front of the buffer, and the offset of the line it starts in
+        self.offset = 0
+        self.line = 1
+        self.line_start = 0
+        self.eof = False
+
+    def drop_consumed(self):
+        if self.pos > self.chunk_size:
+            self.line += self.buffer.count("\n", 0, self.pos)
+            if (newline := self.buffer.rfind("\n", 0, self.pos)) >= 0:
+                self.line_start = self.offset + newline + 1
+            self.offset += self.pos
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+
+    def read_more(self):
+        # Reading at least as much as is buffered keeps retried decodes of long values linear
+        chunk = self.f.read(max(self.chunk_size, len(self.buffer)))
+        self.eof = not chunk
+        self.buffer += chunk
+        return not self.eof
+
+    def location(self, pos: int = None):
+        pos = self.pos if pos is None else pos
+        line = self.line + self.buffer.count("\n", 0, pos)
+        newline = self.buffer.rfind("\n", 0, pos)
+        line_start = self.offset + newline + 1 if newline >= 0 else self.line_start
+        column = self.offset + pos - line_start + 1
+        return f"line {line} column {column} (char {self.offset + pos}) of {self.arb_file}"
+
+    def skip_whitespace(self):
+        while True:
+            self.pos = _JSON_WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return
+            self.drop_consumed()
+            if not self.read_more():
+                return
+
+    def expect(self, characters: str):
+        self.skip_whitespace()
+        if self.pos == len(self.buffer) or self.buffer[self.pos] not in characters:
+            found = f"`{self.buffer[self.pos]}`" if self.pos < len(self.buffer) else "end of file"
+            expected = " or ".join(f"`{c}`" for c in characters)
+            raise InvalidFormat(f"Expected {expected} but found {found} at {self.location()}")
+        self.pos += 1
+        return self.buffer[self.pos - 1]
+
+    def decode(self):
+        self.skip_whitespace()
+        self.drop_consumed()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.read_more():
+                    continue
+                raise InvalidFormat(f"{e.msg} at {self.location(e.pos)}") from e
+            # A number or literal at the end of the buffer may continue in the next chunk, as may a number followed
+            # by what could start its fraction or exponent
+            incomplete = end == len(self.buffer) or (
+                value.__class__ in (int, float) and self.buffer[end] in ".eE+-"
+            )
+            if not incomplete or not self.read_more():
+                start, self.pos = self.pos, end
+                return value, start
+
 
-    Will return: {
-        male: "He"
-        female: "She"
-        other: "They"
+def iter_arb(arb_file: str, chunk_size: int = 1 << 16):
+    """
+    Yields the entries of an arb file in order while reading it in chunks, so a large file is never held in
+    memory both as text and as a dict. Only the top level object is decoded entry by entry; the metadata of a key
+    is yielded as a dict.
+
+    Raises InvalidFormat for malformed JSON and DuplicateKey for a key found twice, with the line, column and
+    offset in the file.
+    """
+    seen = set()
+    with open(arb_file, "r", encoding="utf-8") as f:
+        stream = _ArbStream(f, arb_file, chunk_size)
+        stream.expect("{")
+        stream.skip_whitespace()
+        if stream.buffer.startswith("}", stream.pos):
+            stream.pos += 1
+        else:
+            while True:
+                if m := _PLAIN_KEY.match(stream.buffer, stream.pos):
+                    key, start = m.group(1), m.start(1) - 1
+                    stream.pos = m.end()
+                else:
+                    key, start = stream.decode()
+                    if not isinstance(key, str):
+                        raise InvalidFormat(f"Expected a key but found `{key}` at {stream.location(start)}")
+                    stream.expect(":")
+                if key in seen:
+                    raise DuplicateKey(f"Key `{key}` found twice, again at {stream.location(start)}")
+                seen.add(key)
+                value, _ = stream.decode()
+                yield key, value
+                if m := _SEPARATOR.match(stream.buffer, stream.pos):
+                    stream.pos = m.end()
+                    separator = m.group(1)
+                else:
+                    separator = stream.expect(",}")
+                if separator == "}":
+                    break
+        stream.skip_whitespace()
+        if stream.pos < len(stream.buffer):
+            raise InvalidFormat(f"Extra data at {stream.location()}")
+
+
+def read_arb(arb_file: str, lang_name: str, keys: Optional[set] = None):
+    """
+    Reads and compiles the messages of a single arb file. Metadata entries are skipped.
+    If `keys` is given only those messages are compiled.
+
+    The file is decoded entry by entry (see `iter_arb`) and each message is compiled as soon as it is read.
+    """
+    messages: dict[str, Message] = {}
+    for k, v in iter_arb(arb_file):
+        if "@" not in k and (keys is None or k in keys):
+            if not isinstance(v, str):
+                raise InvalidFormat(f"`{lang_name} -> {k}` is not a string")
+            try:
+                messages[k] = compile_message(purify(v), lang_name)
+            except InvalidFormat as e:
+                raise InvalidFormat(f"`{lang_name} -> {k}`: {e}") from e
+    return messages
+
+
+def _read_arb_job(job: tuple):
+    return read_arb(*job)
+
+
+def read_arbs(arb_files: dict[str, str], keys: Optional[set] = None, workers: Optional[int] = 1):
+    """
+    `read_arb` for many files. `arb_files` maps every lang name to its arb file and the tables are returned
+    under the same names, in the same order.
+
+    With `workers` other than 1 the files are parsed in a pool of that many processes, or one per core if None.
+    Errors are those of `read_arb`; when several files fail, the error of the first one in order is raised.
+    """
+    jobs = [(arb_file, lang_name, keys) for lang_name, arb_file in arb_files.items()]
+    if workers == 1 or len(jobs) < 2:
+        tables = [read_arb(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(min(workers or os.cpu_count() or 1, len(jobs))) as pool:
+            tables = list(pool.map(_read_arb_job, jobs))
+    return dict(zip(arb_files, tables))
+
+
+def fallback_chains(langs: Iterable, default, fallbacks: Optional[dict] = None):
+    """
+    The lookup order of every lang: the lang itself, its configured fallbacks (followed through their own
+    fallbacks), then `default`. `fallbacks` maps a lang to the langs tried after it, so
+    `{es_MX: [es_ES], es_ES: [pt_BR]}` with default `en_US` gives es_MX the chain es_MX, es_ES, pt_BR, en_US.
+    """
+    fallbacks = fallbacks or {}
+    chains = {}
+    for lang in langs:
+        chain = []
+        pending = [lang]
+        while pending:
+            if (l := pending.pop(0)) not in chain:
+                chain.append(l)
+                pending[:0] = fallbacks.get(l, ())
+        if default not in chain:
+            chain.append(default)
+        chains[lang] = tuple(chain)
+    return chains
+
+
+def lang_fallbacks(languages: Type[Enum], fallbacks: Optional[dict]):
+    """
+    `fallbacks` with every lang as a `Lang`. Tags that are not a lang, such as `ca` in `{"ca": ["es_ES"]}`,
+    are left out; they only matter to negotiation.
+    """
+    names = {lang.value: lang for lang in languages}
+    return {
+        (names[k] if isinstance(k, str) else k): [names[l] if isinstance(l, str) else l for l in v]
+        for k, v in (fallbacks or {}).items()
+        if not isinstance(k, str) or k in names
     }
 
-    It is an error to not specify the `other` case in any select.
+
+class Translations:
     """
-    brackets = 1
-    end = 0
-    cases = {}
-    buffer = ""
-    key = ""
-    # Check if there is an offset for plurals
-    offset = 0
-    if m := re.match(r"^offset:([-\d]\d*)", selectable):
-        offset = int(m.groups()[0])
-        end = len(m.group())
-
-    while brackets > 0:
-        if selectable[end] == "{":
-            brackets += 1
-            if brackets == 2:
-                key = buffer
-                buffer = ""
+    Compiled message tables of every language, each read from its arb file on first use.
+
+    The table of a language is merged with the tables of its fallback chain when it is loaded, so it holds
+    every key any language in the chain translates and a lookup is always a single dict access.
+    Keys filled in from a fallback are logged once per language and kept in `missing_keys()`.
+
+    Loading is guarded by a lock per language so concurrent first uses still read each file only once.
+
+    Changed arb files are picked up by `reload`, on demand or every few seconds with `auto_reload`. New tables
+    are built aside and swapped in with a single assignment, so readers never lock or see a half-built table.
+    """
+
+    def __init__(
+        self,
+        arb_location: str,
+        languages: Type[Enum],
+        default: Optional[Enum] = None,
+        fallbacks: Optional[dict] = None,
+    ):
+        self.arb_location = arb_location
+        self.languages = languages
+        self.default = default if default is not None else next(iter(languages))
+        self.chains: dict[Enum, tuple[Enum, ...]] = fallback_chains(
+            languages, self.default, lang_fallbacks(languages, fallbacks)
+        )
+        self._arbs: dict[Enum, dict[str, Message]] = {}
+        self._tables: dict[Enum, dict[str, Message]] = {}
+        self._missing: dict[Enum, list[str]] = {}
+        self._fallback_keys: dict[Enum, set[str]] = {}
+        self._unresolved: set[str] = set()
+        # Called with the lang, the key, the select and its value when a select falls through to `other`
+        self.select_fallthrough_hook: Optional[Callable] = None
+        self._arb_locks = {lang: threading.Lock() for lang in languages}
+        self._locks = {lang: threading.Lock() for lang in languages}
+        # (mtime, size) and sha256 of every arb file as it was when last read
+        self._stamps: dict[Enum, Optional[tuple[int, int]]] = {}
+        self._digests: dict[Enum, Optional[str]] = {}
+        self._reload_lock = threading.Lock()
+        self._stop_reloading: Optional[threading.Event] = None
+
+    def _lang(self, lang: Union[Enum, str]):
+        return self.languages(lang) if isinstance(lang, str) else lang
+
+    def _arb_file(self, lang: Enum):
+        return self.arb_location + "/" + lang.name + ".arb"
+
+    def _stamp(self, lang: Enum):
+        try:
+            stat = os.stat(self._arb_file(lang))
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _digest(self, lang: Enum):
+        try:
+            with open(self._arb_file(lang), "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except FileNotFoundError:
+            return None
+
+    def _read(self, lang: Enum):
+        try:
+            return self._arbs[lang]
+        except KeyError:
+            pass
+        with self._arb_locks[lang]:
+            if lang not in self._arbs:
+                # Stamped before reading so a write racing the read is seen by the next reload
+                stamp, digest = self._stamp(lang), self._digest(lang)
+                self._store(lang, stamp, digest, read_arb(self._arb_file(lang), lang.name) if digest else None)
+        return self._arbs[lang]
+
+    def _store(self, lang: Enum, stamp: Optional[tuple[int, int]], digest: Optional[str], arb: Optional[dict]):
+        if digest is None:
+            log.warn(f"{lang.name}.arb not found in {self.arb_location}; using fallback lang")
+        self._stamps[lang], self._digests[lang] = stamp, digest
+        self._arbs[lang] = arb
+
+    def _read_many(self, langs: Iterable[Enum], workers: Optional[int]):
+        pending = {}
+        for lang in langs:
+            if lang not in self._arbs and lang not in pending:
+                pending[lang] = self._stamp(lang), self._digest(lang)
+        files = {lang.name: self._arb_file(lang) for lang, (_, digest) in pending.items() if digest is not None}
+        arbs = read_arbs(files, workers=workers)
+        for lang, (stamp, digest) in pending.items():
+            with self._arb_locks[lang]:
+                # Unless a render loaded it in the meantime
+                if lang not in self._arbs:
+                    self._store(lang, stamp, digest, arbs.get(lang.name))
+
+    def _merge(self, lang: Enum):
+        merged: dict[str, Message] = {}
+        for l in self.chains[lang]:
+            for k, message in (self._read(l) or {}).items():
+                merged.setdefault(k, message)
+        own = self._read(lang) or {}
+        missing = self._missing[lang] = [k for k in merged if k not in own]
+        self._fallback_keys[lang] = set(missing)
+        if missing and own:
+            chain = " -> ".join(l.name for l in self.chains[lang][1:])
+            log.warn(f"{lang.name}.arb is missing {len(missing)} keys, using {chain}: {', '.join(missing)}")
+        return merged if merged else None
+
+    def _load(self, lang: Enum):
+        try:
+            return self._tables[lang]
+        except KeyError:
+            pass
+        with self._locks[lang]:
+            if lang not in self._tables:
+                self._tables[lang] = self._merge(lang)
+        return self._tables[lang]
+
+    def __contains__(self, lang: Enum):
+        return self._load(lang) is not None
+
+    def __getitem__(self, lang: Enum):
+        if (table := self._load(lang)) is None:
+            raise KeyError(lang)
+        return table
+
+    def get(self, lang: Enum, default=None):
+        if (table := self._load(lang)) is None:
+            return default
+        return table
+
+    def preload(self, *langs: Union[Enum, str], workers: Optional[int] = 1):
+        """
+        Loads the given languages now instead of on first use. Loads all of them if none are given.
+
+        With `workers` other than 1 the arb files of the languages and their fallbacks are parsed in a pool of
+        that many processes (one per core if None) before the tables are merged. See `read_arbs`.
+        """
+        langs = [self._lang(lang) for lang in langs or self.languages]
+        if workers != 1:
+            self._read_many([l for lang in langs for l in self.chains[lang]], workers)
+        for lang in langs:
+            self._load(lang)
+
+    def missing_keys(self, *langs: Union[Enum, str]):
+        """
+        The keys each language takes from its fallback chain, loading the languages if needed.
+        Reports every language if none are given.
+        """
+        report = {}
+        for lang in langs or self.languages:
+            self._load(lang := self._lang(lang))
+            report[lang] = list(self._missing[lang])
+        return report
+
+    def falls_back(self, lang: Enum, key: str):
+        """
+        Whether `lang` takes `key` from its fallback chain.
+        """
+        return key in self._fallback_keys.get(lang, ())
+
+    def report_unresolved(self, lang: Enum, key: str):
+        """
+        Logs a key that neither `lang` nor its fallbacks translate, once per key.
+        Returns the key to render in its place.
+        """
+        if key not in self._unresolved:
+            self._unresolved.add(key)
+            log.error(f"Key `{key}` not found in {lang.name} or its fallbacks")
+        return key
+
+    def reload(self, *langs: Union[Enum, str]):
+        """
+        Reads the arb files of the given languages again, or of every loaded language whose file changed on disk
+        if none are given. Files whose contents are the same are not parsed again. The tables of the reloaded
+        languages, and of every loaded language falling back to them, are rebuilt and then swapped in.
+
+        A file that fails to parse is logged and its previous table kept. Returns the reloaded languages.
+        """
+        with self._reload_lock:
+            if langs:
+                candidates = [self._lang(lang) for lang in langs]
+            else:
+                candidates = [lang for lang in list(self._arbs) if self._stamp(lang) != self._stamps.get(lang)]
+            reloaded = []
+            for lang in candidates:
+                stamp, digest = self._stamp(lang), self._digest(lang)
+                if lang in self._arbs and digest == self._digests.get(lang):
+                    self._stamps[lang] = stamp
+                    continue
+                try:
+                    table = read_arb(self._arb_file(lang), lang.name) if digest is not None else None
+                except (InvalidFormat, DuplicateKey, ValueError, OSError) as e:
+                    # Not retried until the file changes again
+                    self._stamps[lang] = stamp
+                    log.error(f"Keeping the loaded {lang.name} translations: {e}")
+                    continue
+                with self._arb_locks[lang]:
+                    self._arbs[lang] = table
+                    self._stamps[lang], self._digests[lang] = stamp, digest
+                reloaded.append(lang)
+
+            for lang in list(self._tables):
+                if any(l in reloaded for l in self.chains[lang]):
+                    with self._locks[lang]:
+                        self._tables[lang] = self._merge(lang)
+            if reloaded:
+                log.info(f"Reloaded {', '.join(lang.name for lang in reloaded)}")
+            return reloaded
+
+    def auto_reload(self, interval: float = 2.0, on_reload: Optional[Callable[[list], None]] = None):
+        """
+        Calls `reload` every `interval` seconds on a daemon thread until `stop_auto_reload` is called.
+        `on_reload` is called with the reloaded languages whenever a reload changed something.
+        """
+        self.stop_auto_reload()
+        stop = self._stop_reloading = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                if (reloaded := self.reload()) and on_reload is not None:
+                    on_reload(reloaded)
+
+        thread = threading.Thread(target=run, name="pyARB reload", daemon=True)
+        thread.start()
+        return thread
+
+    def stop_auto_reload(self):
+        if self._stop_reloading is not None:
+            self._stop_reloading.set()
+            self._stop_reloading = None
+
+
+def read_translations(
+    arb_location: str,
+    languages: Type[Enum],
+    default: Optional[Enum] = None,
+    fallbacks: Optional[dict] = None,
+    lazy: bool = True,
+    workers: Optional[int] = 1,
+):
+    translations = Translations(arb_location, languages, default, fallbacks)
+    if not lazy:
+        translations.preload(workers=workers)
+    return translations
+
+
+def plural_category(value: float):
+    """
+    The plural rule of messages compiled without a locale, or for a locale whose plural rules are unknown.
+    See `pyARB.plurals.plural_rule` for the rules of every other locale.
+    """
+    if value == 0:
+        return "zero"
+    elif value == 1:
+        return "one"
+    elif value == 2:
+        return "two"
+    elif value < 20:
+        return "few"
+    return "many"
+
+
+def _render(parts: tuple, definitions: dict, values: tuple, options: dict, shorthand: tuple = None):
+    return "".join([p if p.__class__ is str else p.render(definitions, values, options, shorthand) for p in parts])
+
+
+class Argument:
+    __slots__ = ("name", "locale")
+
+    def __init__(self, name: str, locale: Optional[str] = None):
+        self.name = name
+        self.locale = locale
+
+    def render(self, definitions: dict, values: tuple, options: dict, shorthand: tuple):
+        var = definitions.get(self.name)
+        if var is None:
+            return "{" + self.name + "}"
+        return var.format_value(values[var.index], options.get(self.name) if options else None, self.locale)
+
+
+class Shorthand:
+    __slots__ = ()
+
+    def render(self, definitions: dict, values: tuple, options: dict, shorthand: tuple):
+        var, value, locale = shorthand
+        return var.format_value(value, options.get(var.name) if options else None, locale)
+
+
+# The `select_fallthrough_hook` of the translations a message is rendered from, with the lang and key, while
+# `pyARB.metrics.RenderMetrics` renders it. Kept per context so concurrent renders of different translation sets
+# each report to their own hook
+rendering: ContextVar[Optional[tuple]] = ContextVar("pyARB.rendering", default=None)
+_warned_selects: set[str] = set()
+
+
+def _fell_through(select: "Select", value):
+    if (current := rendering.get()) is not None:
+        hook, lang, key = current
+        hook(lang, key, select, value)
+    # Warned once per select, as some selects rely on `other` for most values
+    if select.source not in _warned_selects:
+        _warned_selects.add(select.source)
+        log.warn(f"Select in `{select.source}` does not have a case for `{value}`; using `other`")
+
+
+class Select:
+    __slots__ = ("name", "cases", "other", "source")
+
+    def __init__(self, name: str, cases: dict, source: str):
+        self.name = name
+        self.cases = cases
+        self.other = cases["other"]
+        self.source = source
+
+    def render(self, definitions: dict, values: tuple, options: dict, shorthand: tuple):
+        if (var := definitions.get(self.name)) is None:
+            return self.source
+        value = values[var.index]
+        case = self.cases.get(value)
+        if case is None:
+            _fell_through(self, value)
+            case = self.other
+        return _render(case, definitions, values, options, shorthand)
+
+
+# Like Flutter, 0, 1 and 2 pick the `zero`, `one` and `two` cases when a plural has them, whatever the locale
+IMPLICIT_PLURAL_CASES = {0: "zero", 1: "one", 2: "two"}
+
+
+class Plural:
+    __slots__ = ("name", "offset", "exact", "cases", "other", "source", "locale", "rule", "implicit")
+
+    def __init__(self, name: str, offset: int, cases: dict, source: str, locale: Optional[str] = None):
+        self.name = name
+        self.offset = offset
+        self.locale = locale
+        self.rule = plural_rule(locale) or plural_category
+        self.exact = {}
+        self.cases = {}
+        for k, v in cases.items():
+            if k.startswith("="):
+                try:
+                    number = float(k[1:])
+                except ValueError:
+                    raise InvalidFormat(f"`{k}` is not a valid exact match in `{source}`")
+                self.exact[int(number) if number == int(number) else number] = v
             else:
-                buffer += "{"
-        elif selectable[end] == "}":
-            brackets -= 1
-            if brackets == 1:
-                cases[key] = buffer
-                buffer = ""
+                self.cases[k] = v
+        self.other = cases["other"]
+        self.source = source
+        self.implicit = {n: self.cases[c] for n, c in IMPLICIT_PLURAL_CASES.items() if c in self.cases}
+
+    def __reduce__(self):
+        # The rule is a compiled function, so the plural is rebuilt from its cases instead
+        cases = {"=" + str(k): v for k, v in self.exact.items()}
+        cases.update(self.cases)
+        return Plural, (self.name, self.offset, cases, self.source, self.locale)
+
+    def render(self, definitions: dict, values: tuple, options: dict, shorthand: tuple):
+        var = definitions.get(self.name)
+        if var is None:
+            return self.source
+        value = values[var.index]
+        if (case := self.exact.get(value)) is not None:
+            return _render(case, definitions, values, options, (var, value, self.locale))
+        # `#` shows the value minus the offset; the caller's value is left as it is
+        val = abs(value - self.offset)
+        if (case := self.implicit.get(val)) is None:
+            case = self.cases.get(self.rule(val), self.other)
+        return _render(case, definitions, values, options, (var, val, self.locale))
+
+
+_SPECIAL = re.compile(r"[{}#\\]")
+_ARGUMENT = re.compile(r"([^{},]*)([},])")
+_SELECT_TYPE = re.compile(r"([^{},]*),\s*(?:offset:\s*(-?\d+))?")
+_CASE_KEY = re.compile(r"\s*([^{}]*?)\s*(\{|\})")
+_SHORTHAND = Shorthand()
+
+
+def _parse_parts(text: str, pos: int, in_plural: bool, nested: bool, locale: Optional[str] = None):
+    """
+    Parses literal text and arguments starting at `pos` until the end of the text,
+    or, when `nested`, until the bracket closing the current case.
+
+    Returns the parts and the position just after what was consumed.
+    """
+    parts = []
+    literal = ""
+    while m := _SPECIAL.search(text, pos):
+        start = m.start()
+        c = text[start]
+        literal += text[pos:start]
+        pos = start + 1
+        if c == "\\" or c == "#":
+            if not in_plural:
+                literal += c
+            elif c == "#":
+                if literal:
+                    parts.append(literal)
+                    literal = ""
+                parts.append(_SHORTHAND)
+            elif text.startswith("#", pos):
+                literal += "#"
+                pos += 1
             else:
-                buffer += "}"
+                literal += c
+            continue
+        if literal:
+            parts.append(literal)
+            literal = ""
+        if c == "}":
+            if nested:
+                return tuple(parts), pos
+            raise InvalidFormat(f"Unexpected `}}` at {start} in `{text}`")
+        node, pos = _parse_argument(text, start, in_plural, locale)
+        parts.append(node)
+    if nested:
+        raise InvalidFormat(f"Unclosed case in `{text}`")
+    literal += text[pos:]
+    if literal:
+        parts.append(literal)
+    return tuple(parts), pos
+
+
+def _parse_argument(text: str, start: int, in_plural: bool, locale: Optional[str]):
+    if not (m := _ARGUMENT.match(text, start + 1)):
+        raise InvalidFormat(f"Unclosed argument at {start} in `{text}`")
+    name = m.group(1).strip()
+    if not name:
+        raise InvalidFormat(f"Argument without a name at {start} in `{text}`")
+    if m.group(2) == "}":
+        return Argument(name, locale), m.end()
+
+    if not (m := _SELECT_TYPE.match(text, m.end())):
+        raise InvalidFormat(f"Expected select or plural at {start} in `{text}`")
+    select_type = m.group(1).strip()
+    if select_type not in {"select", "plural"}:
+        raise InvalidFormat(f"Expected select or plural but got `{select_type}` in `{text}`")
+    offset = 0
+    if m.group(2) is not None:
+        if select_type != "plural":
+            raise InvalidFormat(f"Only a plural may specify an offset. Offset found in `{text}`.")
+        offset = int(m.group(2))
+
+    cases = {}
+    pos = m.end()
+    while True:
+        if not (m := _CASE_KEY.match(text, pos)):
+            raise InvalidFormat(f"Unclosed {select_type} at {start} in `{text}`")
+        key = m.group(1)
+        if m.group(2) == "}":
+            if key:
+                raise InvalidFormat(f"Case `{key}` has no message at {m.start(1)} in `{text}`")
+            break
+        if not key:
+            raise InvalidFormat(f"Case without a key at {m.start(2)} in `{text}`")
+        cases[key], pos = _parse_parts(text, m.end(), in_plural or select_type == "plural", True, locale)
+    end = m.end()
+
+    if "other" not in cases:
+        raise InvalidFormat(f"{select_type.capitalize()} at {start} is missing the `other` case in `{text}`")
+    if select_type == "select":
+        return Select(name, cases, text[start:end]), end
+    return Plural(name, offset, cases, text[start:end], locale), end
+
+
+class Message:
+    """
+    An ARB message compiled into literal segments and argument nodes.
+
+    Select and plural cases are split into dictionaries once here
+    so rendering never has to look at the message syntax again.
+    """
+
+    __slots__ = ("text", "parts", "literal")
+
+    def __init__(self, text: str, parts: tuple):
+        self.text = text
+        self.parts = parts
+        self.literal = None
+        if not self.parts:
+            self.literal = ""
+        elif len(self.parts) == 1 and self.parts[0].__class__ is str:
+            self.literal = self.parts[0]
+
+    def render(self, definitions: dict, values: tuple, options: dict = None) -> str:
+        """
+        Renders with the placeholder `definitions`, keyed by placeholder name, and their `values` in the order of
+        the definitions (see `index_placeholders`). `options` may override the optional parameters of some
+        placeholders, keyed by name.
+
+        Nothing is written to the definitions, so they can be shared between threads.
+        """
+        if self.literal is not None:
+            return self.literal
+        return _render(self.parts, definitions, values, options)
+
+
+def compile_message(text: str, locale: Optional[str] = None):
+    """
+    Compiles the (whitespace purified) text of an ARB message. Its plurals use the plural rules of `locale`
+    and its numbers are formatted the way `locale` formats them.
+
+    Raises InvalidFormat if the message is malformed.
+    """
+    return Message(text, _parse_parts(text, 0, False, False, locale)[0])
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached(text: str, in_plural: bool):
+    return Message(text, _parse_parts(text, 0, in_plural, nested=False)[0])
+
+
+def index_placeholders(placeholders: dict[str, dict[str, Placeholder]]):
+    """
+    Numbers the placeholder definitions of every key in order, which is the order generated methods
+    pass their values in. Returns `placeholders`.
+    """
+    for definitions in placeholders.values():
+        for i, p in enumerate(definitions.values()):
+            p.index = i
+    return placeholders
+
+
+def _numbered(placeholders: tuple):
+    """
+    Definitions and values of placeholders that carry their own values, numbered in the order they were passed.
+    """
+    definitions = {}
+    values = []
+    for p in placeholders:
+        p.index = len(values)
+        definitions[p.name] = p
+        values.append(p.value)
+    return definitions, values
+
+
+def render_message(message: Message, *placeholders: Placeholder):
+    if message.literal is not None:
+        return message.literal
+    definitions, values = _numbered(placeholders)
+    return _render(message.parts, definitions, values, None)
+
+
+def render_batch(translations: Translations, lang: Enum, definitions: dict, items: list):
+    """
+    Renders many keys of one lang in a single pass, looking up the lang's table only once.
+
+    `definitions` maps every key to its numbered placeholders by name (see `index_placeholders`), and `items`
+    holds `(key, args)` pairs or bare keys. `args` are the placeholder values in order, or a dict keyed by their
+    snake_case names.
+    Optional parameters keep their baked values.
+    """
+    table = translations.get(lang, {})
+    rendered = []
+    for item in items:
+        if isinstance(item, str):
+            key, args = item, ()
+        else:
+            key, args = item
+        if (message := table.get(key)) is None:
+            rendered.append(translations.report_unresolved(lang, key))
+            continue
+        if message.literal is not None:
+            rendered.append(message.literal)
+            continue
+        defined = definitions[key]
+        if isinstance(args, dict):
+            args = tuple(args[p.snake_name] for p in defined.values())
+        rendered.append(_render(message.parts, defined, args, None))
+    return rendered
+
+
+def call_batch(renderers: dict, lang: Enum, items: list):
+    """
+    `render_batch` for specialized modules, where `renderers` maps each key to its table of
+    render functions (or plain strings) per lang.
+    """
+    rendered = []
+    for item in items:
+        if isinstance(item, str):
+            key, args = item, ()
+        else:
+            key, args = item
+        renderer = renderers[key][lang]
+        if renderer.__class__ is str:
+            rendered.append(renderer)
+        elif isinstance(args, dict):
+            rendered.append(renderer(**args))
         else:
-            buffer += selectable[end]
-        end += 1
-    return cases, end, offset
+            rendered.append(renderer(*args))
+    return rendered
 
 
 def inject_placeholders(text: str, *placeholders: Placeholder, num_shorthand: PlaceholderNum = None):
-    if num_shorthand:
-        text = re.sub(r"(?<!\\)(#)", num_shorthand.get(), text)
-        text = text.replace("\\#", "#")
-    for var in placeholders:
-        if "{" + var.name + "}" in text:
-            text = text.replace("{" + var.name + "}", var.get())
-        # Check for Selects or Plurals
-        elif (l := text.find("{" + var.name)) >= 0:
-            l += len(var.name) + 2
-            select_type = text[l : (case_start := text.find(",", l))]
-            if select_type == "select":
-                cases, select_end, offset = _split_select_cases(text[case_start + 1 :])
-                if offset != 0:
-                    raise InvalidFormat(f"Only a plural may specify an offset. Offset found in `{text}`.")
-                if var.value not in cases:
-                    log.warn(f"Select in `{text}` does not have a case for `{var.value}`; using `other`")
-                    inner = inject_placeholders(cases["other"], *placeholders)
-                else:
-                    inner = inject_placeholders(cases[var.value], *placeholders)
-            elif select_type == "plural":
-                cases, select_end, offset = _split_select_cases(text[case_start + 1 :])
-                exact = f"={var.value}"
-                if exact in cases:
-                    inner = inject_placeholders(cases[exact], *placeholders, num_shorthand=var)
-                else:
-                    val = abs(var.value - offset)
-                    if val == 0:
-                        offseted = "zero"
-                    elif val == 1:
-                        offseted = "one"
-                    elif val == 2:
-                        offseted = "two"
-                    elif val < 20:
-                        offseted = "few"
-                    else:
-                        offseted = "many"
-                    if offseted not in cases:
-                        # log.warn(f"Plural in `{text}` does not have a case for `{var.value}`; using `other`")
-                        inner = inject_placeholders(cases["other"], *placeholders, num_shorthand=var.set(val))
-                    else:
-                        inner = inject_placeholders(cases[offseted], *placeholders, num_shorthand=var.set(val))
-            else:
-                raise InvalidFormat(f"Expected select or plural but got `{select_type}` in `{text}`")
-            text = text[: l - (len(var.name) + 2)] + inner + text[case_start + 1 + select_end :]
-    return text
+    message = _compile_cached(text, num_shorthand is not None)
+    if message.literal is not None:
+        return message.literal
+    shorthand = (num_shorthand, num_shorthand.value, None) if num_shorthand else None
+    definitions, values = _numbered(placeholders)
+    return _render(message.parts, definitions, values, None, shorthand)
@@ -0,0 +1,137 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from enum import Enum
+from typing import Callable, Optional
+
+from pyARB import localize
+
+# Upper bounds of the latency buckets in microseconds. Slower renders fall in the last, unbounded bucket.
+LATENCY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000)
+
+# Most distinct (lang, key, select, value) entries counted separately before the values of the rest are counted
+# together
+MAX_SELECT_VALUES = 1000
+
+
+class RenderMetrics:
+    """
+    Counters of the renders of a generated module: renders per lang and key, renders served by a fallback
+    lang, keys no lang has, and selects falling through to `other`. Every `sample_every`th render is timed
+    into a latency histogram.
+
+    `snapshot()` returns everything as plain dicts to hand to a metrics pipeline.
+    """
+
+    def __init__(self, translations, sample_every: int = 100):
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be at least 1, not {sample_every}")
+        self.translations = translations
+        self.sample_every = sample_every
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self):
+        self.total = 0
+        self.renders: Counter = Counter()
+        self.fallbacks: Counter = Counter()
+        self.missing: Counter = Counter()
+        self.select_other: Counter = Counter()
+        self.latency = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum_ns = 0
+
+    def reset(self):
+        with self._lock:
+            self._clear()
+
+    def render(self, lang: Enum, key: str, values: tuple, options: Optional[dict], render: Callable[..., str]):
+        """
+        Counts a render of `key` and returns `render(lang, key, values, options)`, timing it if it is sampled.
+        """
+        with self._lock:
+            self.total += 1
+            sampled = self.total % self.sample_every == 0
+            self.renders[lang.name, key] += 1
+        if self.translations.falls_back(lang, key):
+            with self._lock:
+                self.fallbacks[lang.name, key] += 1
+        if (hook := self.translations.select_fallthrough_hook) is None:
+            return self._render(sampled, lang, key, values, options, render)
+        token = localize.rendering.set((hook, lang, key))
+        try:
+            return self._render(sampled, lang, key, values, options, render)
+        finally:
+            localize.rendering.reset(token)
+
+    def _render(self, sampled: bool, lang: Enum, key: str, values: tuple, options: Optional[dict], render: Callable):
+        if not sampled:
+            return render(lang, key, values, options)
+
+        start = time.perf_counter_ns()
+        rendered = render(lang, key, values, options)
+        elapsed = time.perf_counter_ns() - start
+        with self._lock:
+            self.latency[bisect_left(LATENCY_BUCKETS, elapsed / 1000)] += 1
+            self.latency_sum_ns += elapsed
+        return rendered
+
+    def count_missing(self, lang: Enum, key: str):
+        with self._lock:
+            self.missing[lang.name, key] += 1
+
+    def count_select_other(self, lang: Enum, key: str, select: "localize.Select", value):
+        entry = (lang.name, key, select.name, str(value))
+        with self._lock:
+            if entry not in self.select_other and len(self.select_other) >= MAX_SELECT_VALUES:
+                entry = (lang.name, key, select.name, None)
+            self.select_other[entry] += 1
+
+    def attach(self):
+        """
+        Counts the selects of every message of the translations falling through to `other`. Returns the metrics.
+        """
+        self.translations.select_fallthrough_hook = self.count_select_other
+        return self
+
+    def detach(self):
+        if self.translations.select_fallthrough_hook == self.count_select_other:
+            self.translations.select_fallthrough_hook = None
+
+    def snapshot(self, reset: bool = False):
+        """
+        Everything counted so far, nested by lang and key. Select fall-throughs are further nested by the
+        placeholder of the select and the value that had no case; values past the first `MAX_SELECT_VALUES` are
+        under null.
+        Latency buckets are keyed by their upper bound in microseconds.
+        """
+        with self._lock:
+            snapshot = {
+                "renders_total": self.total,
+                "renders": _nested(self.renders),
+                "fallbacks": _nested(self.fallbacks),
+                "missing": _nested(self.missing),
+                "select_other": _nested(self.select_other),
+                "latency": {
+                    "sample_every": self.sample_every,
+                    "samples": sum(self.latency),
+                    "sum_us": self.latency_sum_ns / 1000,
+                    "buckets_us": {
+                        **{str(bound): count for bound, count in zip(LATENCY_BUCKETS, self.latency)},
+                        "+Inf": self.latency[-1],
+                    },
+                },
+            }
+        if reset:
+            self.reset()
+        return snapshot
+
+
+def _nested(counter: Counter):
+    nested = {}
+    for entry, count in counter.items():
+        level = nested
+        for name in entry[:-1]:
+            level = level.setdefault(name, {})
+        level[entry[-1]] = count
+    return nested
@@ -0,0 +1,121 @@
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Optional, Type, Union
+
+from pyARB.localize import fallback_chains
+
+_SEPARATORS = re.compile(r"[-_]")
+
+
+def normalize_tag(tag: str):
+    """
+    BCP-47 tag to the `Lang` naming convention
+
+    es-mx - es_MX
+    pt_br - pt_BR
+    zh-hant-tw - zh_Hant_TW
+    EN - en
+    """
+    subtags = [s for s in _SEPARATORS.split(tag.strip()) if s]
+    if not subtags:
+        return ""
+    normalized = [subtags[0].lower()]
+    for s in subtags[1:]:
+        if len(s) == 4 and s.isalpha():
+            normalized.append(s.title())  # script
+        elif len(s) == 2 or (len(s) == 3 and s.isdigit()):
+            normalized.append(s.upper())  # region
+        else:
+            normalized.append(s.lower())
+    return "_".join(normalized)
+
+
+def _name(lang: Union[Enum, str]):
+    return lang.name if isinstance(lang, Enum) else lang
+
+
+def parse_accept_language(header: str):
+    """
+    The tags of an Accept-Language header, most preferred first.
+    Tags with `q=0` and the `*` wildcard are dropped.
+
+    `da, en-GB;q=0.8, en;q=0.7` - [da, en_GB, en]
+    """
+    weighted = []
+    for i, item in enumerate(header.split(",")):
+        tag, *params = item.split(";")
+        tag = tag.strip()
+        if not tag or tag == "*":
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            weighted.append((-q, i, normalize_tag(tag)))
+    return [tag for _, _, tag in sorted(weighted)]
+
+
+class LocaleNegotiator:
+    """
+    Resolves language tags or whole Accept-Language headers to the best available `Lang`.
+
+    Requested tags are tried most preferred first. Each is tried as an exact match, then with its
+    trailing subtags removed (es_Latn_MX, es_Latn, es), then against any available lang of the same
+    language, so `es-MX` resolves to `es_ES` rather than falling through to a less preferred tag.
+    If none of them match the default lang is used.
+
+    `fallbacks` are the fallback chains the translations use, e.g. `{"ca": ["es_ES"]}`. A requested tag
+    without a lang of its own that has a chain resolves to the first available lang of it, before the
+    same-language match.
+
+    Results are memoized in a bounded cache so repeated headers cost a single dict lookup.
+    """
+
+    def __init__(self, languages: Type[Enum], default: Enum, fallbacks: Optional[dict] = None, maxsize: int = 1024):
+        self.languages = languages
+        self.default = default
+        self._by_tag: dict[str, Enum] = {}
+        self._by_language: dict[str, Enum] = {}
+        for lang in languages:
+            tag = normalize_tag(lang.name)
+            self._by_tag[tag] = lang
+            self._by_language.setdefault(tag.split("_")[0], lang)
+        self._by_language[normalize_tag(default.name).split("_")[0]] = default
+
+        chains = {
+            normalize_tag(_name(k)): [normalize_tag(_name(l)) for l in v] for k, v in (fallbacks or {}).items()
+        }
+        # Tags that are not a lang but have a chain resolve to its first available lang
+        aliases = [tag for tag in chains if tag not in self._by_tag]
+        available = dict(self._by_tag)
+        for tag, chain in fallback_chains(aliases, normalize_tag(default.name), chains).items():
+            self._by_tag[tag] = next(available[l] for l in chain if l in available)
+
+        self.negotiate_header = lru_cache(maxsize=maxsize)(self._negotiate)
+
+    def _negotiate(self, header: str):
+        for tag in parse_accept_language(header):
+            subtags = tag.split("_")
+            while subtags:
+                if (lang := self._by_tag.get("_".join(subtags))) is not None:
+                    return lang
+                subtags.pop()
+            if (lang := self._by_language.get(tag.split("_")[0])) is not None:
+                return lang
+        return self.default
+
+    def negotiate(self, requested: Union[Enum, str, None]):
+        """
+        The best available lang for a `Lang`, a single tag such as `es-MX`, or an Accept-Language header.
+        """
+        if isinstance(requested, self.languages):
+            return requested
+        if not requested:
+            return self.default
+        return self.negotiate_header(requested)
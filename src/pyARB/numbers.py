@@ -0,0 +1,474 @@
+import math
+from bisect import bisect_right
+from enum import Enum
+from functools import lru_cache
+from typing import Callable, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyARB.plurals import plural_rule
+
+
+class NumFormat(Enum):
+    compact = "compact"
+    compactCurrency = "compactCurrency"
+    compactSimpleCurrency = "compactSimpleCurrency"
+    compactLong = "compactLong"
+    currency = "currency"
+    decimalPattern = "decimalPattern"
+    decimalPercentPattern = "decimalPercentPattern"
+    percentPattern = "percentPattern"
+    scientificPattern = "scientificPattern"
+    simpleCurrency = "simpleCurrency"
+
+
+# CLDR number symbols and patterns by the locales using them. In the patterns `#` stands for the number, `¤` for
+# the currency and `%` for the percent sign; negative numbers put the minus sign in front of the whole pattern.
+# `min_grouping` is the number of integer digits before a number is grouped at all, `grouping` the size of the
+# first group and of the groups before it, and `compact` and `compact_long` the short and long units of thousands,
+# millions, billions and trillions. A unit varying with the number is a dict by plural category, see `plurals`.
+# Every symbol a locale leaves out is that of its language, and then that of `root`.
+NUMBER_SYMBOLS: dict[str, dict] = {
+    "root": {
+        "decimal": ".",
+        "group": ",",
+        "minus": "-",
+        "min_grouping": 1,
+        "grouping": (3, 3),
+        "currency": "¤#",
+        "percent": "#%",
+        "compact": ("", "k", "M", "B", "T"),
+        "compact_long": ("", " thousand", " million", " billion", " trillion"),
+    },
+    "en_IN hi": {"grouping": (3, 2)},
+    "cs sk": {"decimal": ",", "group": "\u00a0", "currency": "#\u00a0¤", "percent": "#\u00a0%"},
+    "da": {"decimal": ",", "group": ".", "currency": "#\u00a0¤", "percent": "#\u00a0%"},
+    "de": {
+        "decimal": ",",
+        "group": ".",
+        "currency": "#\u00a0¤",
+        "percent": "#\u00a0%",
+        "compact": ("", "\u00a0Tsd.", "\u00a0Mio.", "\u00a0Mrd.", "\u00a0Bio."),
+        "compact_long": (
+            "",
+            " Tausend",
+            {"one": " Million", "other": " Millionen"},
+            {"one": " Milliarde", "other": " Milliarden"},
+            {"one": " Billion", "other": " Billionen"},
+        ),
+    },
+    "de_AT": {"group": "\u00a0", "currency": "¤\u00a0#"},
+    "de_CH de_LI": {"decimal": ".", "group": "’", "currency": "¤\u00a0#", "percent": "#%"},
+    "es": {
+        "decimal": ",",
+        "group": ".",
+        "min_grouping": 2,
+        "currency": "#\u00a0¤",
+        "percent": "#\u00a0%",
+        "compact": ("", "\u00a0mil", "\u00a0M", "\u00a0mil\u00a0M", "\u00a0B"),
+        "compact_long": (
+            "",
+            " mil",
+            {"one": " millón", "other": " millones"},
+            " mil millones",
+            {"one": " billón", "other": " billones"},
+        ),
+    },
+    "es_419 es_MX es_US": {"decimal": ".", "group": ",", "currency": "¤#"},
+    "fi nb no sv": {
+        "decimal": ",",
+        "group": "\u00a0",
+        "minus": "\u2212",
+        "currency": "#\u00a0¤",
+        "percent": "#\u00a0%",
+    },
+    "fr": {
+        "decimal": ",",
+        "group": "\u202f",
+        "currency": "#\u00a0¤",
+        "percent": "#\u202f%",
+        "compact": ("", "\u00a0k", "\u00a0M", "\u00a0Md", "\u00a0Bn"),
+        "compact_long": (
+            "",
+            " mille",
+            {"one": " million", "other": " millions"},
+            {"one": " milliard", "other": " milliards"},
+            {"one": " billion", "other": " billions"},
+        ),
+    },
+    "fr_CH": {"group": "\u202f", "currency": "#\u00a0¤", "percent": "#%"},
+    "id": {"decimal": ",", "group": "."},
+    "it": {"decimal": ",", "group": ".", "currency": "#\u00a0¤"},
+    "it_CH": {"decimal": ".", "group": "’", "currency": "¤\u00a0#"},
+    "nl": {
+        "decimal": ",",
+        "group": ".",
+        "currency": "¤\u00a0#",
+        "compact": ("", "K", "\u00a0mln.", "\u00a0mld.", "\u00a0bln."),
+        "compact_long": (
+            "",
+            " duizend",
+            " miljoen",
+            " miljard",
+            " biljoen",
+        ),
+    },
+    "pl": {
+        "decimal": ",",
+        "group": "\u00a0",
+        "min_grouping": 2,
+        "currency": "#\u00a0¤",
+        "compact": ("", "\u00a0tys.", "\u00a0mln", "\u00a0mld", "\u00a0bln"),
+        "compact_long": (
+            "",
+            {"one": " tysiąc", "few": " tysiące", "many": " tysięcy", "other": " tysiąca"},
+            {"one": " milion", "few": " miliony", "many": " milionów", "other": " miliona"},
+            {"one": " miliard", "few": " miliardy", "many": " miliardów", "other": " miliarda"},
+            {"one": " bilion", "few": " biliony", "many": " bilionów", "other": " biliona"},
+        ),
+    },
+    "pt": {
+        "decimal": ",",
+        "group": ".",
+        "currency": "¤\u00a0#",
+        "compact": ("", "\u00a0mil", "\u00a0mi", "\u00a0bi", "\u00a0tri"),
+        "compact_long": (
+            "",
+            " mil",
+            {"one": " milhão", "other": " milhões"},
+            {"one": " bilhão", "other": " bilhões"},
+            {"one": " trilhão", "other": " trilhões"},
+        ),
+    },
+    "pt_PT": {
+        "group": "\u00a0",
+        "min_grouping": 2,
+        "currency": "#\u00a0¤",
+        "compact": ("", "\u00a0mil", "\u00a0M", "\u00a0mM", "\u00a0Bi"),
+        "compact_long": (
+            "",
+            " mil",
+            {"one": " milhão", "other": " milhões"},
+            " mil milhões",
+            {"one": " bilião", "other": " biliões"},
+        ),
+    },
+    "ru": {
+        "decimal": ",",
+        "group": "\u00a0",
+        "currency": "#\u00a0¤",
+        "percent": "#\u00a0%",
+        "compact": ("", "\u00a0тыс.", "\u00a0млн", "\u00a0млрд", "\u00a0трлн"),
+        "compact_long": (
+            "",
+            {"one": " тысяча", "few": " тысячи", "many": " тысяч", "other": " тысячи"},
+            {"one": " миллион", "few": " миллиона", "many": " миллионов", "other": " миллиона"},
+            {"one": " миллиард", "few": " миллиарда", "many": " миллиардов", "other": " миллиарда"},
+            {"one": " триллион", "few": " триллиона", "many": " триллионов", "other": " триллиона"},
+        ),
+    },
+    "tr": {"decimal": ",", "group": ".", "percent": "%#"},
+    "uk": {
+        "decimal": ",",
+        "group": "\u00a0",
+        "currency": "#\u00a0¤",
+        "percent": "#\u00a0%",
+        "compact": ("", "\u00a0тис.", "\u00a0млн", "\u00a0млрд", "\u00a0трлн"),
+        "compact_long": (
+            "",
+            {"one": " тисяча", "few": " тисячі", "many": " тисяч", "other": " тисячі"},
+            {"one": " мільйон", "few": " мільйони", "many": " мільйонів", "other": " мільйона"},
+            {"one": " мільярд", "few": " мільярди", "many": " мільярдів", "other": " мільярда"},
+            {"one": " трильйон", "few": " трильйони", "many": " трильйонів", "other": " трильйона"},
+        ),
+    },
+    "vi": {"decimal": ",", "group": ".", "currency": "#\u00a0¤"},
+}
+
+_SYMBOLS_BY_LOCALE = {locale: symbols for locales, symbols in NUMBER_SYMBOLS.items() for locale in locales.split()}
+
+
+@lru_cache(maxsize=None)
+def number_symbols(locale: Optional[str]) -> dict:
+    """
+    The number symbols and patterns of a locale such as `pt_PT`, `pt-BR` or `en`, see `NUMBER_SYMBOLS`.
+    Those of the whole locale take precedence over those of its language. Unknown locales get the `root` ones.
+    """
+    symbols = dict(_SYMBOLS_BY_LOCALE["root"])
+    if locale:
+        tag = locale.replace("-", "_")
+        symbols.update(_SYMBOLS_BY_LOCALE.get(tag.split("_")[0].lower(), {}))
+        symbols.update(_SYMBOLS_BY_LOCALE.get(tag, {}))
+    return symbols
+
+
+def _number(symbols: dict, digits: Optional[int]) -> Callable[[float], str]:
+    """
+    A function formatting a number with the grouping and decimal symbols of `symbols`,
+    with `digits` fraction digits, or as many as python shows when None.
+    """
+    plain = "" if digits is None else f".{digits}f"
+    grouped = "," + plain
+    translation = None
+    if symbols["group"] != "," or symbols["decimal"] != "." or symbols["minus"] != "-":
+        translation = str.maketrans({",": symbols["group"], ".": symbols["decimal"], "-": symbols["minus"]})
+
+    if symbols["grouping"] != (3, 3):
+        primary, secondary = symbols["grouping"]
+        least = max(primary, symbols["min_grouping"] + primary - 1)
+
+        def number(value):
+            sign, integer, dot, fraction = "", *format(value, plain).partition(".")
+            if integer.startswith("-"):
+                sign, integer = "-", integer[1:]
+            if len(integer) > least and integer.isdigit():
+                head, groups = integer[:-primary], [integer[-primary:]]
+                while len(head) > secondary:
+                    groups.append(head[-secondary:])
+                    head = head[:-secondary]
+                integer = ",".join([head, *reversed(groups)])
+            text = sign + integer + dot + fraction
+            return text.translate(translation) if translation else text
+
+    elif symbols["min_grouping"] > 1:
+        # With a `min_grouping` of 2 numbers are only grouped from 10000 on, e.g. 1234 but 12.345
+        least = 10 ** (symbols["min_grouping"] + 2)
+
+        def number(value):
+            text = format(value, grouped if value >= least or value <= -least else plain)
+            return text.translate(translation) if translation else text
+
+    elif translation:
+
+        def number(value):
+            return format(value, grouped).translate(translation)
+
+    else:
+
+        def number(value):
+            return format(value, grouped)
+
+    return number
+
+
+# Where each compact unit after the first starts: thousands, millions, billions and trillions
+_MAGNITUDES = (1e3, 1e6, 1e9, 1e12)
+
+
+def _other(value):
+    return "other"
+
+
+@lru_cache(maxsize=None)
+def compact_formatter(locale: Optional[str], digits: int, long: bool = False) -> Callable[[float], str]:
+    """
+    A function formatting a number in thousands, millions, billions or trillions with the `compact` units of
+    `locale`, or its `compact_long` ones, rounded to `digits` fraction digits.
+
+    The unit is found with a single search of the magnitudes and the number is rounded once. A number that
+    rounds up to 1000 of its unit, such as 999950 to 1000k, moves on to the next one (1M).
+    """
+    symbols = number_symbols(locale)
+    units = symbols["compact_long" if long else "compact"]
+    top = len(units) - 1
+    magnitudes = _MAGNITUDES[:top]
+    translation = None
+    if symbols["decimal"] != "." or symbols["minus"] != "-":
+        translation = str.maketrans({".": symbols["decimal"], "-": symbols["minus"]})
+    rule = plural_rule(locale) or _other
+    spec = f".{digits}f"
+
+    def compact(value):
+        scaled = -value if value < 0 else value
+        if u := bisect_right(magnitudes, scaled):
+            scaled /= magnitudes[u - 1]
+        # Rounded and written in one go, then without the zeros ending the fraction, as `1.5k` or `2M`
+        text = format(scaled, spec)
+        if digits:
+            text = text.rstrip("0").rstrip(".")
+        if scaled >= 999 and u < top and text.startswith("1000"):
+            # Below 1000 of its unit, so it rounded up to exactly 1000: 1 of the next unit
+            u += 1
+            text = "1"
+        unit = units[u]
+        if unit.__class__ is dict:
+            unit = unit.get(rule(float(text) if "." in text else int(text)), unit["other"])
+        if value < 0:
+            text = "-" + text
+        return (text.translate(translation) if translation else text) + unit
+
+    return compact
+
+
+def _rollover(digits: int) -> float:
+    """
+    The smallest float that rounds to 1000 with `digits` fraction digits, as `format` rounds it.
+    """
+    spec = f".{digits}f"
+    limit = 1000 - 0.5 / 10**digits
+    while format(limit, spec).startswith("1000"):
+        limit = math.nextafter(limit, 0)
+    while not format(limit, spec).startswith("1000"):
+        limit = math.nextafter(limit, 1000)
+    return limit
+
+
+@lru_cache(maxsize=None)
+def compact_array_formatter(locale: Optional[str], digits: int, long: bool = False) -> Callable[..., list]:
+    """
+    `compact_formatter` for a numpy array, formatting every value exactly as it does.
+
+    Magnitudes and units are found with one search of the whole array, and the numbers rounding up to 1000 of
+    their unit are moved to the next one with array operations, so only the text is written value by value.
+    """
+    symbols = number_symbols(locale)
+    units = symbols["compact_long" if long else "compact"]
+    top = len(units) - 1
+    magnitudes = np.array(_MAGNITUDES[:top])
+    divisors = np.array((1.0, *_MAGNITUDES[:top]))
+    rollover = _rollover(digits)
+    translation = None
+    if symbols["decimal"] != "." or symbols["minus"] != "-":
+        translation = str.maketrans({".": symbols["decimal"], "-": symbols["minus"]})
+    rule = plural_rule(locale) or _other
+    spec = f".{digits}f"
+
+    def compact(values) -> list:
+        values = np.asarray(values, dtype=float)
+        scaled = np.abs(values)
+        u = np.searchsorted(magnitudes, scaled, side="right")
+        scaled = scaled / divisors[u]
+        rolled = (scaled >= rollover) & (u < top)
+        scaled[rolled] = 1
+        u[rolled] += 1
+        result = []
+        for value, u, negative in zip(scaled.tolist(), u.tolist(), (values < 0).tolist()):
+            text = format(value, spec)
+            if digits:
+                text = text.rstrip("0").rstrip(".")
+            unit = units[u]
+            if unit.__class__ is dict:
+                unit = unit.get(rule(float(text) if "." in text else int(text)), unit["other"])
+            if negative:
+                text = "-" + text
+            result.append((text.translate(translation) if translation else text) + unit)
+        return result
+
+    return compact
+
+
+def _pattern(pattern: str, number: Callable[[float], str], minus: str) -> Callable[[float], str]:
+    """
+    `number` placed in a pattern, with the minus sign of negative numbers in front of the whole pattern.
+    """
+    prefix, _, suffix = pattern.partition("#")
+    if not prefix:
+        # `number` already puts the minus sign in front
+        return (lambda value: number(value) + suffix) if suffix else number
+
+    def placed(value):
+        if value < 0:
+            return minus + prefix + number(-value) + suffix
+        return prefix + number(value) + suffix
+
+    return placed
+
+
+def _pattern_array(pattern: str, numbers: Callable[..., list], minus: str) -> Callable[..., list]:
+    """
+    `_pattern` for a function formatting a whole numpy array.
+    """
+    prefix, _, suffix = pattern.partition("#")
+    if not prefix:
+        return (lambda values: [text + suffix for text in numbers(values)]) if suffix else numbers
+
+    def placed(values):
+        texts = numbers(np.abs(values))
+        return [
+            (minus + prefix + text + suffix) if negative else (prefix + text + suffix)
+            for text, negative in zip(texts, (values < 0).tolist())
+        ]
+
+    return placed
+
+
+class NumberFormatter:
+    """
+    Formats numbers one way in one locale: a `NumFormat` with its optional parameters, with the grouping and
+    decimal symbols, the currency and percent placement and the compact units of the locale worked out up front.
+
+    Formatters are built by `number_formatter`, once per locale, format and optional parameters.
+    """
+
+    __slots__ = ("locale", "num_format", "options", "format", "_format_array")
+
+    def __init__(self, locale: Optional[str], num_format: Optional[NumFormat], options: dict):
+        self.locale = locale
+        self.num_format = num_format
+        self.options = options
+        self._format_array = None
+        symbols = number_symbols(locale)
+        minus = symbols["minus"]
+        currency = symbols["currency"]
+        if num_format in (NumFormat.compact, NumFormat.compactLong):
+            long = num_format == NumFormat.compactLong
+            self.format = compact_formatter(locale, 1, long)
+            if np is not None:
+                self._format_array = compact_array_formatter(locale, 1, long)
+        elif num_format in (NumFormat.compactCurrency, NumFormat.compactSimpleCurrency):
+            if num_format == NumFormat.compactCurrency:
+                currency = currency.replace("¤", options["name"])
+            else:
+                currency = currency.replace("¤", options["symbol"])
+            self.format = _pattern(currency, compact_formatter(locale, options["decimalDigits"]), minus)
+            if np is not None:
+                compact = compact_array_formatter(locale, options["decimalDigits"])
+                self._format_array = _pattern_array(currency, compact, minus)
+        elif num_format == NumFormat.currency:
+            currency = currency.replace("¤", options["name"])
+            self.format = _pattern(currency, _number(symbols, options["decimalDigits"]), minus)
+        elif num_format == NumFormat.decimalPattern:
+            self.format = _number(symbols, options["decimalDigits"])
+        elif num_format in (NumFormat.decimalPercentPattern, NumFormat.percentPattern):
+            digits = options["decimalDigits"] if num_format == NumFormat.decimalPercentPattern else 0
+            percent = _pattern(symbols["percent"], _number(symbols, digits), minus)
+            self.format = lambda value: percent(value * 100)
+            self._format_array = lambda values: [percent(v) for v in (values * 100).tolist()]
+        elif num_format == NumFormat.scientificPattern:
+            if symbols["decimal"] == "." and minus == "-":
+                self.format = lambda value: format(value, ".2e")
+            else:
+                translation = str.maketrans({".": symbols["decimal"], "-": minus})
+                self.format = lambda value: format(value, ".2e").translate(translation)
+        elif num_format == NumFormat.simpleCurrency:
+            currency = currency.replace("¤", options["symbol"])
+            self.format = _pattern(currency, _number(symbols, options["decimalDigits"]), minus)
+        else:
+            self.format = _number(symbols, None)
+
+    def format_many(self, values) -> list:
+        """
+        Formats every value of a sequence or numpy array as `format` would. Compact units and rounding, and the
+        scaling of percentages, are worked out for a whole numpy array at once.
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            if self._format_array is not None:
+                return self._format_array(values)
+            values = values.tolist()
+        return [self.format(v) for v in values]
+
+    def __repr__(self):
+        name = self.num_format.name if self.num_format else None
+        return f"NumberFormatter({self.locale!r}, {name}, {self.options!r})"
+
+
+@lru_cache(maxsize=1024)
+def number_formatter(locale: Optional[str], num_format: Optional[NumFormat] = None, **options) -> NumberFormatter:
+    """
+    The formatter of `num_format` with the optional parameters `options` in `locale`,
+    built on the first call and shared by every later one.
+    """
+    return NumberFormatter(locale, num_format, options)
@@ -0,0 +1,186 @@
+import re
+from decimal import Decimal
+from functools import lru_cache
+from typing import Callable, Optional
+
+# CLDR cardinal plural rules (samples left out) by the locales using them. Every category not listed is `other`.
+# Languages without plural forms are listed with no rules so they are not mistaken for unknown ones.
+CARDINAL_RULES: dict[str, dict[str, str]] = {
+    (
+        "bm bo dz hnj id ig ii in ja jbo jv jw kde kea km ko lkt lo ms my nqo osa root sah ses sg su th to "
+        "tpi vi wo yo yue zh"
+    ): {},
+    (
+        "af an asa az bal bem bez bg brx ce cgg chr ckb dv ee el eo eu fo fur gsw ha haw hu jgo jmc ka kaj "
+        "kcg kk kkj kl ks ksb ku ky lb lg mas mgo ml mn mr nah nb nd ne nn nnh no nr ny nyn om or os pap ps "
+        "rm rof rwk saq sd sdh seh sn so sq ss ssy st syr ta te teo tig tk tn tr ts ug uz ve vo vun wae xh "
+        "xog"
+    ): {"one": "n = 1"},
+    "ast de en et fi fy gl ia io ji lij nl sc sv sw ur yi": {"one": "i = 1 and v = 0"},
+    "ak bho guw ln mg nso pa ti wa": {"one": "n = 0..1"},
+    "am as bn doi fa gu hi kn pcm zu": {"one": "i = 0 or n = 1"},
+    "ff hy kab": {"one": "i = 0,1"},
+    "si": {"one": "n = 0,1 or i = 0 and f = 1"},
+    "da": {"one": "n = 1 or t != 0 and i = 0,1"},
+    "is": {"one": "t = 0 and i % 10 = 1 and i % 100 != 11 or t % 10 = 1 and t % 100 != 11"},
+    "mk": {"one": "v = 0 and i % 10 = 1 and i % 100 != 11 or f % 10 = 1 and f % 100 != 11"},
+    "ceb fil tl": {"one": "v = 0 and i = 1,2,3 or v = 0 and i % 10 != 4,6,9 or v != 0 and f % 10 != 4,6,9"},
+    "tzm": {"one": "n = 0..1 or n = 11..99"},
+    "ksh": {"zero": "n = 0", "one": "n = 1"},
+    "lag": {"zero": "n = 0", "one": "i = 0,1 and n != 0"},
+    "iu naq sat se sma smi smj smn sms": {"one": "n = 1", "two": "n = 2"},
+    "shi": {"one": "i = 0 or n = 1", "few": "n = 2..10"},
+    "he iw": {"one": "i = 1 and v = 0 or i = 0 and v != 0", "two": "i = 2 and v = 0"},
+    "cs sk": {"one": "i = 1 and v = 0", "few": "i = 2..4 and v = 0", "many": "v != 0"},
+    "es": {"one": "n = 1", "many": "e = 0 and i != 0 and i % 1000000 = 0 and v = 0 or e != 0..5"},
+    "fr": {"one": "i = 0,1", "many": "e = 0 and i != 0 and i % 1000000 = 0 and v = 0 or e != 0..5"},
+    "pt": {"one": "i = 0..1", "many": "e = 0 and i != 0 and i % 1000000 = 0 and v = 0 or e != 0..5"},
+    "ca it pt_PT scn vec": {
+        "one": "i = 1 and v = 0",
+        "many": "e = 0 and i != 0 and i % 1000000 = 0 and v = 0 or e != 0..5",
+    },
+    "lv prg": {
+        "zero": "n % 10 = 0 or n % 100 = 11..19 or v = 2 and f % 100 = 11..19",
+        "one": "n % 10 = 1 and n % 100 != 11 or v = 2 and f % 10 = 1 and f % 100 != 11 or v != 2 and f % 10 = 1",
+    },
+    "ro mo": {"one": "i = 1 and v = 0", "few": "v != 0 or n = 0 or n != 1 and n % 100 = 1..19"},
+    "bs hr sh sr": {
+        "one": "v = 0 and i % 10 = 1 and i % 100 != 11 or f % 10 = 1 and f % 100 != 11",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14 or f % 10 = 2..4 and f % 100 != 12..14",
+    },
+    "gd": {"one": "n = 1,11", "two": "n = 2,12", "few": "n = 3..10,13..19"},
+    "sl": {
+        "one": "v = 0 and i % 100 = 1",
+        "two": "v = 0 and i % 100 = 2",
+        "few": "v = 0 and i % 100 = 3..4 or v != 0",
+    },
+    "ru uk": {
+        "one": "v = 0 and i % 10 = 1 and i % 100 != 11",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": "v = 0 and i % 10 = 0 or v = 0 and i % 10 = 5..9 or v = 0 and i % 100 = 11..14",
+    },
+    "be": {
+        "one": "n % 10 = 1 and n % 100 != 11",
+        "few": "n % 10 = 2..4 and n % 100 != 12..14",
+        "many": "n % 10 = 0 or n % 10 = 5..9 or n % 100 = 11..14",
+    },
+    "lt": {
+        "one": "n % 10 = 1 and n % 100 != 11..19",
+        "few": "n % 10 = 2..9 and n % 100 != 11..19",
+        "many": "f != 0",
+    },
+    "pl": {
+        "one": "i = 1 and v = 0",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": "v = 0 and i != 1 and i % 10 = 0..1 or v = 0 and i % 10 = 5..9 or v = 0 and i % 100 = 12..14",
+    },
+    "mt": {"one": "n = 1", "two": "n = 2", "few": "n = 0 or n % 100 = 3..10", "many": "n % 100 = 11..19"},
+    "ga": {"one": "n = 1", "two": "n = 2", "few": "n = 3..6", "many": "n = 7..10"},
+    "br": {
+        "one": "n % 10 = 1 and n % 100 != 11,71,91",
+        "two": "n % 10 = 2 and n % 100 != 12,72,92",
+        "few": "n % 10 = 3..4,9 and n % 100 != 10..19,70..79,90..99",
+        "many": "n != 0 and n % 1000000 = 0",
+    },
+    "ar ars": {
+        "zero": "n = 0",
+        "one": "n = 1",
+        "two": "n = 2",
+        "few": "n % 100 = 3..10",
+        "many": "n % 100 = 11..99",
+    },
+    "cy": {"zero": "n = 0", "one": "n = 1", "two": "n = 2", "few": "n = 3", "many": "n = 6"},
+}
+
+_RULES_BY_LOCALE = {locale: rules for locales, rules in CARDINAL_RULES.items() for locale in locales.split()}
+
+# Integers below this are looked up in a table built when a rule is compiled
+SMALL_INTS = 1000
+
+_RELATION = re.compile(r"\s*([nivwfte])\s*(?:%\s*(\d+))?\s*(!=|=)\s*([\d.,]+)\s*$")
+
+
+def plural_operands(value):
+    """
+    The CLDR operands of a number: `n` its absolute value, `i` its integer digits, `v` and `w` the number of
+    visible fraction digits with and without trailing zeros, `f` and `t` those digits as an integer with and
+    without trailing zeros, and `e` the compact exponent, which is always 0 here.
+
+    Floats keep the fraction digits python shows, so `1.0` has `v = 1` and `1` has `v = 0`.
+    """
+    if isinstance(value, int):
+        n = abs(value)
+        return n, n, 0, 0, 0, 0, 0
+    text = repr(value) if isinstance(value, float) else str(value)
+    if "e" in text or "E" in text:
+        text = format(Decimal(text), "f")
+    integer, _, fraction = text.lstrip("-").partition(".")
+    trimmed = fraction.rstrip("0")
+    n = abs(value) if fraction else int(integer)
+    return n, int(integer), len(fraction), len(trimmed), int(fraction or 0), int(trimmed or 0), 0
+
+
+def _condition(rule: str):
+    """
+    A CLDR condition such as `v = 0 and i % 10 = 2..4 or v != 0` as a python expression of the operands.
+    """
+    alternatives = []
+    for alternative in rule.split(" or "):
+        relations = []
+        for relation in alternative.split(" and "):
+            if not (m := _RELATION.match(relation)):
+                raise ValueError(f"Invalid plural rule `{rule}`")
+            operand, modulo, operator, values = m.groups()
+            expression = f"{operand} % {modulo}" if modulo else operand
+            checks = []
+            for value in values.split(","):
+                low, _, high = value.partition("..")
+                if not high:
+                    checks.append(f"{expression} == {low}")
+                elif operand == "n":
+                    # A range only holds integers, and n may have a fraction
+                    checks.append(f"({low} <= {expression} <= {high} and {expression} % 1 == 0)")
+                else:
+                    checks.append(f"{low} <= {expression} <= {high}")
+            test = " or ".join(checks)
+            relations.append(f"not ({test})" if operator == "!=" else f"({test})")
+        alternatives.append(" and ".join(relations))
+    return " or ".join(f"({a})" for a in alternatives)
+
+
+@lru_cache(maxsize=None)
+def _compile_rules(rules: tuple[tuple[str, str], ...]):
+    source = "def category(n, i, v, w, f, t, e):\n"
+    for category, rule in rules:
+        source += f"    if {_condition(rule)}:\n        return {category!r}\n"
+    source += "    return 'other'\n"
+    namespace = {}
+    exec(compile(source, "<plural rules>", "exec"), namespace)
+    predicate = namespace["category"]
+    table = tuple(predicate(*plural_operands(n)) for n in range(SMALL_INTS))
+
+    def plural(value):
+        if value.__class__ is int and 0 <= value < SMALL_INTS:
+            return table[value]
+        return predicate(*plural_operands(value))
+
+    return plural
+
+
+def plural_rule(locale: Optional[str]) -> Optional[Callable[[float], str]]:
+    """
+    The CLDR cardinal plural rule of a locale such as `pt_PT`, `pt-BR` or `en`, as a function from a number to
+    its category (`zero`, `one`, `two`, `few`, `many` or `other`). Rules of the whole locale take precedence over
+    those of its language. Returns None for a locale whose language has no known rule.
+
+    Rules are compiled once into python functions, and shared by every locale with the same rules.
+    """
+    if not locale:
+        return None
+    tag = locale.replace("-", "_")
+    rules = _RULES_BY_LOCALE.get(tag)
+    if rules is None:
+        rules = _RULES_BY_LOCALE.get(tag.split("_")[0].lower())
+    if rules is None:
+        return None
+    return _compile_rules(tuple(rules.items()))
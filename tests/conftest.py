@@ -0,0 +1,31 @@
+import importlib.util
+import itertools
+import json
+import os
+
+import pytest
+
+from pyARB.localization_generator import generate_localizations
+
+_modules = itertools.count()
+
+
+@pytest.fixture
+def generate(tmp_path):
+    """
+    Writes `arbs` (locale to arb contents) to a temporary directory, generates its module and imports it.
+    """
+
+    def generate(arbs: dict[str, dict], **options):
+        arb_location = tmp_path / "arbs"
+        arb_location.mkdir(exist_ok=True)
+        for locale, arb in arbs.items():
+            (arb_location / (locale + ".arb")).write_text(json.dumps(arb, ensure_ascii=False), encoding="utf-8")
+        generate_localizations(str(arb_location), list(arbs), **options)
+        path = os.path.join(tmp_path, "generated_components.py")
+        spec = importlib.util.spec_from_file_location(f"generated_components_{next(_modules)}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return generate
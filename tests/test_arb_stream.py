@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from pyARB.exceptions import InvalidFormat
+from pyARB.localize import iter_arb
+
+ARB = {
+    "@@locale": "en_US",
+    "count": 1.5,
+    "big": 12e10,
+    "small": -2.5e-3,
+    "negative": -42,
+    "flag": True,
+    "nothing": None,
+    "hello": "Hello {name}",
+    "@hello": {"placeholders": {"name": {"example": 3.25}}, "order": [1, 2.5, -3e2]},
+    "escaped": 'a "quoted" \u00e9 value \\n',
+}
+
+
+def test_entries_are_decoded_wherever_a_chunk_ends(tmp_path):
+    arb_file = tmp_path / "en_US.arb"
+    text = json.dumps(ARB, indent=1).replace("1.5", "1.50").replace("120000000000.0", "12E+10")
+    arb_file.write_text(text, encoding="utf-8")
+    expected = list(json.loads(text).items())
+    for chunk_size in range(1, len(text) + 1):
+        assert list(iter_arb(str(arb_file), chunk_size)) == expected, chunk_size
+
+
+def test_a_number_cut_short_by_the_end_of_the_file_is_invalid(tmp_path):
+    arb_file = tmp_path / "en_US.arb"
+    arb_file.write_text('{"count": 1.', encoding="utf-8")
+    for chunk_size in range(1, 13):
+        with pytest.raises(InvalidFormat):
+            list(iter_arb(str(arb_file), chunk_size))
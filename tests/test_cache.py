@@ -0,0 +1,17 @@
+ARB = {
+    "manyItems": "{first} and {count} others",
+    "@manyItems": {"placeholders": {"first": {"type": "String"}, "count": {"type": "num"}}},
+}
+
+
+def test_equal_values_of_different_types_are_cached_apart(generate):
+    module = generate({"en_US": ARB})
+    uncached = [module.Translator.many_items_static("en_US", "Bob", v) for v in (1, 1.0, True)]
+    module.enable_render_cache()
+    try:
+        cached = [module.Translator.many_items_static("en_US", "Bob", v) for v in (1, 1.0, True, 1, 1.0, True)]
+        stats = module.RENDER_CACHE.stats()
+    finally:
+        module.disable_render_cache()
+    assert cached == uncached * 2
+    assert (stats["misses"], stats["hits"]) == (3, 3)
@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pyARB
+
+EN = {"hello": "Hello", "bye": "Bye", "thanks": "Thanks"}
+
+
+def test_catalog_locales_merge_their_fallbacks_on_first_use(generate):
+    arbs = {"en_US": EN, "es_ES": {"hello": "Hola", "bye": "Adiós"}, "es_MX": {"hello": "Qué onda"}}
+    module = generate(arbs, binary_catalog=True, fallbacks={"es_MX": ["es_ES"]})
+    Lang, TRANSLATIONS = module.Lang, module.TRANSLATIONS
+    assert not TRANSLATIONS._locales
+    t = module.Translator(Lang.es_MX)
+    assert (t.hello(), t.bye(), t.thanks()) == ("Qué onda", "Adiós", "Thanks")
+    assert list(TRANSLATIONS._locales) == [Lang.es_MX]
+    assert TRANSLATIONS.missing_keys() == {Lang.en_US: [], Lang.es_ES: ["thanks"], Lang.es_MX: ["bye", "thanks"]}
+    assert TRANSLATIONS.falls_back(Lang.es_MX, "bye")
+    assert not TRANSLATIONS.falls_back(Lang.es_MX, "hello")
+    assert not TRANSLATIONS.falls_back(Lang.en_US, "bye")
+
+
+WORKER = """
+import importlib.util, json, sys
+
+spec = importlib.util.spec_from_file_location("worker_components", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+rendered = [module.Translator(lang).followers(n) for lang in module.Lang for n in (1, 1500)]
+with open("/proc/self/maps") as f:
+    mapped = [line.split()[-1] for line in f if line.rstrip().endswith(".catalog")]
+print(json.dumps({"rendered": rendered, "mapped": mapped}))
+"""
+
+
+def test_processes_render_from_one_mapped_catalog(generate, tmp_path):
+    if not os.path.exists("/proc/self/maps"):
+        pytest.skip("reads the mappings of the workers from /proc")
+    arb = {
+        "followers": "{count, plural, one{# follower} other{# followers}}",
+        "@followers": {"placeholders": {"count": {"type": "int", "format": "compact"}}},
+    }
+    arbs = {"en_US": arb, "es_ES": {"followers": "{count, plural, one{# seguidor} other{# seguidores}}"}}
+    runtime = generate(arbs)
+    expected = [runtime.Translator(lang).followers(n) for lang in runtime.Lang for n in (1, 1500)]
+    generate(arbs, binary_catalog=True)
+    path = str(tmp_path / "generated_components.py")
+    src = os.path.dirname(os.path.dirname(pyARB.__file__))
+    workers = [
+        subprocess.Popen([sys.executable, "-c", WORKER, path], stdout=subprocess.PIPE, text=True, cwd=src)
+        for _ in range(2)
+    ]
+    results = [json.loads(worker.communicate()[0]) for worker in workers]
+    catalog = str(tmp_path / "generated_components.catalog")
+    for result in results:
+        assert result["rendered"] == expected
+        assert result["mapped"] == [catalog]
@@ -0,0 +1,20 @@
+import json
+
+from pyARB.check import check_localizations
+
+
+def test_check_returns_problems_and_checked_locales_without_printing(tmp_path, capsys):
+    arbs = tmp_path / "arbs"
+    arbs.mkdir()
+    primary = {"hello": "Hello {name}", "@hello": {"placeholders": {"name": {}}}}
+    (arbs / "en_US.arb").write_text(json.dumps(primary), encoding="utf-8")
+    (arbs / "es_ES.arb").write_text(json.dumps({"hello": "Hola {nombre}"}), encoding="utf-8")
+
+    first = check_localizations(str(arbs), ["en_US", "es_ES"])
+    second = check_localizations(str(arbs), ["en_US", "es_ES"])
+    assert first["checked"] == ["en_US", "es_ES"]
+    assert second["checked"] == []
+    assert first["problems"] == second["problems"]
+    assert first["problems"]["en_US"] == []
+    assert [p["level"] for p in first["problems"]["es_ES"]] == ["error", "warning"]
+    assert capsys.readouterr().out == ""
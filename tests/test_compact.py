@@ -0,0 +1,45 @@
+import pytest
+
+from pyARB.localize import NumFormat
+from pyARB.numbers import compact_formatter, number_formatter
+
+
+@pytest.mark.parametrize(
+    "locale, expected",
+    [
+        ("en_US", ["999", "1 thousand", "1.5 thousand", "999.9 thousand", "1 million", "1 million", "5 million",
+                   "1.2 billion", "-1.5 thousand"]),
+        ("es_ES", ["999", "1 mil", "1,5 mil", "999,9 mil", "1 millón", "1 millón", "5 millones",
+                   "1,2 mil millones", "-1,5 mil"]),
+        ("de_DE", ["999", "1 Tausend", "1,5 Tausend", "999,9 Tausend", "1 Million", "1 Million", "5 Millionen",
+                   "1,2 Milliarden", "-1,5 Tausend"]),
+        ("ru_RU", ["999", "1 тысяча", "1,5 тысячи", "999,9 тысячи", "1 миллион", "1 миллион", "5 миллионов",
+                   "1,2 миллиарда", "-1,5 тысячи"]),
+    ],
+)
+def test_compact_long_picks_the_unit_and_its_plural(locale, expected):
+    values = [999, 1000, 1500, 999_949, 999_950, 1_000_000, 5_000_000, 1.2e9, -1500]
+    assert [number_formatter(locale, NumFormat.compactLong).format(v) for v in values] == expected
+
+
+def test_rounding_up_to_a_thousand_units_moves_to_the_next_unit():
+    assert number_formatter("en_US", NumFormat.compact).format(999_950) == "1M"
+    assert number_formatter("en_US", NumFormat.compact).format(999_949) == "999.9k"
+    assert compact_formatter("en_US", 0, long=True)(999_500) == "1 million"
+    assert compact_formatter("en_US", 2, long=True)(999_995) == "1 million"
+    assert compact_formatter("en_US", 2, long=True)(999_994) == "999.99 thousand"
+    assert compact_formatter("ru_RU", 1, long=True)(999_950_000) == "1 миллиард"
+
+
+def test_compact_long_placeholders_render_in_messages(generate):
+    module = generate(
+        {
+            "en_US": {
+                "views": "{count} views",
+                "@views": {"placeholders": {"count": {"type": "int", "format": "compactLong"}}},
+            },
+            "ru_RU": {"views": "{count} просмотров"},
+        }
+    )
+    assert module.Translator("en_US").views(999_950) == "1 million views"
+    assert module.Translator("ru_RU").views(21_000) == "21 тысяча просмотров"
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from pyARB.exceptions import InvalidFormat
+from pyARB.localize import Message, Plural, Select, compile_message
+
+COUNT = {"placeholders": {"count": {"type": "int"}}}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "{count, plural, one{# item}}",
+        "{count, plural, =x{none} other{# items}}",
+        "{count, select, a{A} b{B}}",
+        "{count, plural, one{# item} other{# items}",
+        "Unclosed {count",
+    ],
+)
+@pytest.mark.parametrize("options", [{}, {"specialize": True}, {"binary_catalog": True}])
+def test_malformed_messages_fail_at_generation(generate, text, options):
+    with pytest.raises(InvalidFormat):
+        generate({"en_US": {"items": text, "@items": COUNT}}, **options)
+
+
+def test_malformed_translations_fail_when_their_locale_loads(generate, tmp_path):
+    module = generate({"en_US": {"items": "{count} items", "@items": COUNT}, "es_ES": {"items": "{count} cosas"}})
+    (tmp_path / "arbs" / "es_ES.arb").write_text(json.dumps({"items": "{count, plural, one{# cosa}}"}))
+    with pytest.raises(InvalidFormat):
+        module.TRANSLATIONS[module.Lang.es_ES]
+
+
+def test_messages_compile_to_literals_and_nodes():
+    message = compile_message("You have {count, plural, =0{no items} one{# item} other{# items}} in {cart}", "en_US")
+    literal, plural, between, argument = message.parts
+    assert (literal, between) == ("You have ", " in ")
+    assert isinstance(plural, Plural) and plural.exact.keys() == {0} and plural.cases.keys() == {"one", "other"}
+    assert argument.name == "cart"
+    select = compile_message("{gender, select, male{He} other{They}}").parts[0]
+    assert isinstance(select, Select) and select.cases == {"male": ("He",), "other": ("They",)}
+    assert compile_message("Plain text").literal == "Plain text"
+    assert isinstance(message, Message)
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from pyARB.context import LocaleMiddleware
+
+ARBS = {"en_US": {"hello": "Hello"}, "es_ES": {"hello": "Hola"}, "pt_BR": {"hello": "Olá"}}
+
+
+def test_each_task_renders_in_its_own_lang(generate):
+    module = generate(ARBS)
+    both_set = asyncio.Event()
+    entered = []
+
+    async def greet(tag):
+        with module.LOCALE.use(tag) as lang:
+            entered.append(lang)
+            if len(entered) == 2:
+                both_set.set()
+            # Both tasks have set their lang before either one renders
+            await both_set.wait()
+            return lang, module.hello()
+
+    async def main():
+        return await asyncio.gather(greet("es-MX"), greet("pt-BR"), greet(None))
+
+    results = asyncio.run(main())
+    assert results == [(module.Lang.es_ES, "Hola"), (module.Lang.pt_BR, "Olá"), (module.Lang.en_US, "Hello")]
+    assert module.LOCALE.get() is module.Lang.en_US
+
+
+def test_use_restores_the_previous_lang(generate):
+    module = generate(ARBS)
+    with module.LOCALE.use(module.Lang.es_ES):
+        with module.LOCALE.use("pt"):
+            assert module.hello() == "Olá"
+        assert module.hello() == "Hola"
+    assert module.hello() == "Hello"
+
+
+def _request(middleware, headers, type="http"):
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        pass
+
+    return asyncio.run(middleware({"type": type, "headers": headers}, receive, send))
+
+
+def test_middleware_sets_the_lang_from_accept_language(generate):
+    module = generate(ARBS)
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append((module.LOCALE.get(), module.hello()))
+
+    middleware = LocaleMiddleware(app, module.LOCALE)
+    _request(middleware, [(b"host", b"example.com"), (b"accept-language", b"fr-CH, pt-BR;q=0.9, es;q=0.8")])
+    _request(middleware, [(b"accept-language", b"es-AR")])
+    _request(middleware, [])
+    _request(middleware, [(b"accept-language", b"es")], type="lifespan")
+    assert seen == [
+        (module.Lang.pt_BR, "Olá"),
+        (module.Lang.es_ES, "Hola"),
+        (module.Lang.en_US, "Hello"),
+        (module.Lang.en_US, "Hello"),
+    ]
+    assert module.LOCALE.get() is module.Lang.en_US
+
+
+def test_middleware_resets_the_lang_when_the_app_fails(generate):
+    module = generate(ARBS)
+
+    async def app(scope, receive, send):
+        async def check():
+            # Tasks started by the handler inherit its lang
+            return module.hello()
+
+        assert await asyncio.create_task(check()) == "Hola"
+        raise RuntimeError
+
+    middleware = LocaleMiddleware(app, module.LOCALE, header="X-Locale")
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await middleware({"type": "http", "headers": [(b"x-locale", b"es")]}, None, None)
+        return module.LOCALE.get()
+
+    assert asyncio.run(main()) is module.Lang.en_US
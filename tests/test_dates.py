@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pytest
+
+from pyARB.dates import date_formatter
+from pyARB.exceptions import UnsupportedFormat
+
+AFTERNOON = datetime(2023, 1, 1, 16, 5, 9)
+MIDNIGHT = datetime(2023, 3, 7, 0, 30)
+
+
+@pytest.mark.parametrize(
+    "locale, skeleton, expected",
+    [
+        ("en_US", "yMd", ["1/1/2023", "3/7/2023"]),
+        ("en_US", "yMd+jm", ["1/1/2023 4:05 PM", "3/7/2023 12:30 AM"]),
+        ("en_US", "Hm", ["16:05", "00:30"]),
+        ("en_US", "yMMMEd", ["Sun, Jan 1, 2023", "Tue, Mar 7, 2023"]),
+        ("es_ES", "yMd+jm", ["1/1/2023 16:05", "7/3/2023 0:30"]),
+        ("es_ES", "MMMMd", ["1 de enero", "7 de marzo"]),
+        ("de_DE", "yMd+jm", ["1.1.2023 16:05", "7.3.2023 00:30"]),
+        ("de_DE", "yMMMEd", ["So., 1. Jan. 2023", "Di., 7. März 2023"]),
+        ("fr_FR", "yMd", ["01/01/2023", "07/03/2023"]),
+        ("pt_BR", "EEEE", ["domingo", "terça-feira"]),
+        ("pt_BR", "yQQQ", ["T1 2023", "T1 2023"]),
+        # Locales without date symbols use the root (English) ones
+        ("ja_JP", "yMd+jm", ["1/1/2023 4:05 PM", "3/7/2023 12:30 AM"]),
+    ],
+)
+def test_skeletons_follow_the_locale(locale, skeleton, expected):
+    assert [date_formatter(locale, skeleton).format(d) for d in (AFTERNOON, MIDNIGHT)] == expected
+
+
+def test_custom_patterns_keep_quoted_text():
+    patterns = ["yyyy-MM-dd'T'HH:mm:ss", "h 'o''clock' a", "EEE, d MMM yyyy", "dd.MM.yy"]
+    assert [date_formatter("en_US", p, custom=True).format(AFTERNOON) for p in patterns] == [
+        "2023-01-01T16:05:09", "4 o'clock PM", "Sun, 1 Jan 2023", "01.01.23"
+    ]
+
+
+def test_formatters_are_compiled_once_per_locale_and_format():
+    assert date_formatter("es_ES", "yMd+jm") is date_formatter("es_ES", "yMd+jm")
+    assert date_formatter("es_ES", "yMd+jm") is not date_formatter("de_DE", "yMd+jm")
+
+
+def test_unknown_formats_fail_at_generation(generate):
+    with pytest.raises(UnsupportedFormat):
+        date_formatter("en_US", "yMdQq")
+    with pytest.raises(UnsupportedFormat):
+        generate({"en_US": {"at": "{when}", "@at": {"placeholders": {"when": {"type": "DateTime", "format": "Xyz"}}}}})
+
+
+@pytest.mark.parametrize("options", [{}, {"specialize": True}, {"binary_catalog": True}, {"lazy_methods": True}])
+def test_date_placeholders_render_in_their_locale(generate, options):
+    placeholders = {
+        "date": {"type": "DateTime", "format": "yMd"},
+        "time": {"type": "DateTime", "format": "jm"},
+        "stamp": {"type": "DateTime", "format": "yyyy-MM-dd", "isCustomDateFormat": "true"},
+    }
+    module = generate(
+        {
+            "en_US": {"opened": "Opened {date} at {time} ({stamp})", "@opened": {"placeholders": placeholders}},
+            "de_DE": {"opened": "Eröffnet am {date} um {time} ({stamp})"},
+        },
+        **options,
+    )
+    en, de = module.Translator("en_US"), module.Translator("de_DE")
+    assert en.opened(MIDNIGHT, MIDNIGHT, MIDNIGHT) == "Opened 3/7/2023 at 12:30 AM (2023-03-07)"
+    assert de.opened(MIDNIGHT, AFTERNOON, MIDNIGHT) == "Eröffnet am 7.3.2023 um 16:05 (2023-03-07)"
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+
+import pyARB
+
+ARB = {
+    "followersCount": "{amount} Followers",
+    "@followersCount": {"placeholders": {"amount": {"type": "int", "format": "compact"}}},
+    "stockChange": "{stock} moved {pnl}",
+    "@stockChange": {
+        "placeholders": {
+            "stock": {"type": "String"},
+            "pnl": {"type": "double", "format": "decimalPercentPattern", "optionalParameters": {"decimalDigits": 2}},
+        }
+    },
+}
+
+
+def test_lazy_methods_work_without_the_module_in_sys_modules(generate):
+    eager = generate({"en_US": ARB, "es_ES": ARB}).Translator
+    module = generate({"en_US": ARB, "es_ES": ARB}, lazy_methods=True)
+    assert module.__name__ not in sys.modules
+    lazy = module.Translator
+    assert "followers_count" not in lazy.__dict__
+    for lang in ("en_US", "es_ES"):
+        assert lazy(lang).followers_count(1500) == eager(lang).followers_count(1500)
+        assert lazy.stock_change_static(lang, "ACME", 0.1234) == eager.stock_change_static(lang, "ACME", 0.1234)
+        assert lazy(lang).stock_change("ACME", 0.1234, 0) == eager(lang).stock_change("ACME", 0.1234, 0)
+    assert {"followers_count", "followers_count_static", "stock_change", "stock_change_static"} <= set(lazy.__dict__)
+    assert lazy.followers_count is lazy.__dict__["followers_count"]
+
+
+def test_lazy_translators_do_not_import_the_generator():
+    code = "import sys, pyARB.lazy; print('pyARB.localization_generator' in sys.modules, 'tqdm' in sys.modules)"
+    src = os.path.dirname(os.path.dirname(pyARB.__file__))
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=src)
+    assert result.stdout.split() == ["False", "False"]
@@ -0,0 +1,45 @@
+ARB = {
+    "stockChange": "{stock} moved {pnl} {direction, select, up{up} other{down}}",
+    "@stockChange": {
+        "placeholders": {
+            "stock": {"type": "String"},
+            "pnl": {"type": "double", "format": "decimalPercentPattern", "optionalParameters": {"decimalDigits": 2}},
+            "direction": {"type": "String"},
+        }
+    },
+    "cancel": "Cancel",
+}
+
+
+def test_generated_methods_pass_values_in_definition_order(generate, monkeypatch):
+    module = generate({"en_US": ARB})
+    Translator = module.Translator
+    calls = []
+    render = Translator._render
+
+    def recording(lang, key, values, options=None):
+        calls.append((key, values, options))
+        return render(lang, key, values, options)
+
+    monkeypatch.setattr(Translator, "_render", staticmethod(recording))
+    t = Translator("en_US")
+    assert t.stock_change("ACME", 0.1234, "up") == "ACME moved 12.34% up"
+    assert t.stock_change("ACME", 0.1234, "flat", pnl_decimal_digits=0) == "ACME moved 12% down"
+    assert t.cancel() == "Cancel"
+    assert calls == [
+        ("stockChange", ("ACME", 0.1234, "up"), None),
+        ("stockChange", ("ACME", 0.1234, "flat"), {"pnl": {"decimalDigits": 0}}),
+        ("cancel", (), None),
+    ]
+    assert [p.index for p in module.PLACEHOLDERS["stockChange"].values()] == [0, 1, 2]
+
+
+def test_render_many_takes_values_in_order_or_by_name(generate):
+    module = generate({"en_US": ARB})
+    t = module.Translator("en_US")
+    items = [
+        ("stockChange", ("ACME", 0.5, "up")),
+        ("stockChange", {"direction": "up", "stock": "ACME", "pnl": 0.5}),
+        "cancel",
+    ]
+    assert t.render_many(items) == [t.stock_change("ACME", 0.5, "up")] * 2 + ["Cancel"]
@@ -0,0 +1,39 @@
+import pytest
+
+from pyARB.metrics import RenderMetrics
+
+ARB = {
+    "greeting": "{gender, select, male{Hi sir} female{Hi madam} other{Hi}}",
+    "@greeting": {"placeholders": {"gender": {}}},
+    "farewell": "{gender, select, male{Bye sir} other{Bye}}",
+    "@farewell": {"placeholders": {"gender": {}}},
+}
+
+
+def test_select_fallthroughs_are_counted_per_lang_key_and_translations(generate):
+    first = generate({"en_US": ARB, "es_ES": ARB})
+    second = generate({"en_US": ARB})
+    first_metrics, second_metrics = first.enable_metrics(), second.enable_metrics()
+    try:
+        first.Translator("en_US").greeting("robot")
+        first.Translator("en_US").farewell("female")
+        first.Translator("es_ES").farewell("female")
+        first.Translator("es_ES").farewell("female")
+        second.Translator("en_US").greeting("cat")
+    finally:
+        first.disable_metrics()
+        second.disable_metrics()
+
+    assert first_metrics.snapshot()["select_other"] == {
+        "en_US": {"greeting": {"gender": {"robot": 1}}, "farewell": {"gender": {"female": 1}}},
+        "es_ES": {"farewell": {"gender": {"female": 2}}},
+    }
+    assert second_metrics.snapshot()["select_other"] == {"en_US": {"greeting": {"gender": {"cat": 1}}}}
+    assert first.TRANSLATIONS.select_fallthrough_hook is None
+
+
+def test_sample_every_must_be_positive(generate):
+    module = generate({"en_US": ARB})
+    for sample_every in (0, -1):
+        with pytest.raises(ValueError):
+            RenderMetrics(module.TRANSLATIONS, sample_every)
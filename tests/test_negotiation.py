@@ -0,0 +1,15 @@
+ARB = {"hello": "Hello"}
+
+
+def test_negotiation_follows_fallback_chains(generate):
+    fallbacks = {"ca": ["es_ES"], "gl": ["pt_BR"], "es_ES": ["pt_BR"]}
+    for options in ({}, {"specialize": True}, {"binary_catalog": True}):
+        module = generate({"en_US": ARB, "es_ES": {"hello": "Hola"}, "pt_BR": {}}, fallbacks=fallbacks, **options)
+        Lang, negotiate = module.Lang, module.negotiate
+        assert negotiate("ca") is Lang.es_ES
+        assert negotiate("ca-ES") is Lang.es_ES
+        assert negotiate("gl, es;q=0.5") is Lang.pt_BR
+        assert negotiate("fr, ca;q=0.5") is Lang.es_ES
+        assert negotiate("es-MX") is Lang.es_ES
+        assert negotiate("fr") is Lang.en_US
+        assert module.Translator(negotiate("ca")).hello() == "Hola"
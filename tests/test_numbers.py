@@ -0,0 +1,49 @@
+import math
+
+import pytest
+
+from pyARB.localize import PlaceholderNum, NumFormat, format_numbers
+from pyARB.numbers import compact_formatter, compact_array_formatter
+
+np = pytest.importorskip("numpy")
+
+LOCALES = [None, "en_US", "en_IN", "de_DE", "es_ES", "fr_FR", "pl_PL", "pt_BR", "pt_PT", "ru_RU", "uk_UA", "tr_TR"]
+# Floats, as a float array holds them. Integers are compared with integer arrays below
+VALUES = [
+    float(v)
+    for v in (
+        0, 1, -1, 0.5, 1.15, 2.25, 12, 999, 999.4, 999.94, 999.95, 999.96, 1000, 1001, 1049, 1050, 1234.5, -1234.5,
+        21_000, 999_949, 999_950, -999_950, 2_000_000, 5_500_000, 1e9, 999_950_000_000, 1e12, 2.5e15, -7.25e10,
+    )
+]
+
+
+@pytest.mark.parametrize("locale", LOCALES)
+@pytest.mark.parametrize("format", [None, *NumFormat])
+def test_arrays_format_like_lists_and_single_values(locale, format):
+    placeholder = PlaceholderNum("value", format=format)
+    if locale is None:
+        single = [placeholder.format_value(v) for v in VALUES]
+    else:
+        single = [placeholder.formatter(locale).format(v) for v in VALUES]
+    assert format_numbers(VALUES, format, locale) == single
+    assert format_numbers(np.array(VALUES), format, locale) == single
+
+
+@pytest.mark.parametrize("locale", LOCALES)
+def test_integer_arrays_format_like_integer_lists(locale):
+    values = [0, 7, -7, 1234, 999_950, 123_456_789]
+    for format in (None, NumFormat.decimalPattern, NumFormat.compactLong, NumFormat.compactCurrency):
+        assert format_numbers(np.array(values), format, locale) == format_numbers(values, format, locale)
+
+
+@pytest.mark.parametrize("digits", [0, 1, 2])
+def test_compact_arrays_round_at_the_same_edges(digits):
+    rng = np.random.default_rng(digits)
+    edges = [1000 * 10.0**e - 0.5 / 10**digits * 10.0**e for e in range(0, 13, 3)]
+    values = [math.nextafter(v, d) for v in edges for d in (0, math.inf)] + edges
+    values += (10 ** rng.uniform(-1, 14, 2000) * rng.choice([-1, 1], 2000)).tolist()
+    for locale in (None, "de", "pl", "ru"):
+        for long in (False, True):
+            compact = compact_formatter(locale, digits, long)
+            assert compact_array_formatter(locale, digits, long)(np.array(values)) == [compact(v) for v in values]
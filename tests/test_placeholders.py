@@ -0,0 +1,20 @@
+from pyARB.localization_generator import ArbKey
+from pyARB.localize import PlaceholderNum, NumFormat
+
+
+def test_currency_name_is_a_baked_parameter():
+    p = PlaceholderNum("price", NumFormat.currency, name="USD", decimalDigits=2)
+    assert p.name == "price"
+    assert p.optional_parameters == {"name": "USD", "decimalDigits": 2}
+    assert p.format_value(1234.5) == "USD1,234.50"
+
+
+def test_currency_placeholders_build_from_arb_metadata():
+    key = ArbKey("price", "Costs {price}")
+    key.process_metadata(
+        {"placeholders": {"price": {"type": "double", "format": "currency", "optionalParameters": {"name": "EUR"}}}}
+    )
+    (price,) = key.placeholders
+    assert price.name == "price"
+    assert price.format_value(3.5) == "EUR3.50"
+    assert price.format_value(3.5, {"name": "USD"}) == "USD3.50"
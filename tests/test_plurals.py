@@ -0,0 +1,56 @@
+import pytest
+
+from pyARB.plurals import SMALL_INTS, plural_operands, plural_rule
+
+COUNT = {"placeholders": {"count": {"type": "int"}}}
+
+
+@pytest.mark.parametrize(
+    "locale, categories",
+    [
+        ("ru", {1: "one", 21: "one", 101: "one", 2: "few", 4: "few", 22: "few", 0: "many", 5: "many", 11: "many",
+                12: "many", 14: "many", 111: "many", 1.5: "other"}),
+        ("pl", {1: "one", 2: "few", 4: "few", 22: "few", 122: "few", 0: "many", 5: "many", 12: "many", 14: "many",
+                21: "many", 112: "many", 1.5: "other"}),
+        ("ar", {0: "zero", 1: "one", 2: "two", 3: "few", 10: "few", 103: "few", 11: "many", 99: "many",
+                111: "many", 100: "other", 102: "other", 1.5: "other"}),
+        ("en", {1: "one", 0: "other", 2: "other", 1.5: "other"}),
+        ("fr", {0: "one", 1: "one", 1.5: "one", 2: "other"}),
+    ],
+)
+def test_categories_at_the_rule_boundaries(locale, categories):
+    rule = plural_rule(locale)
+    assert {n: rule(n) for n in categories} == categories
+
+
+def test_large_and_negative_numbers_follow_the_rule_not_the_table():
+    ru = plural_rule("ru")
+    assert [ru(n) for n in (SMALL_INTS - 1, SMALL_INTS + 1, SMALL_INTS + 11, SMALL_INTS + 21)] == [
+        "many", "one", "many", "one"
+    ]
+    assert [ru(n) for n in (-1, -21, -11)] == ["one", "one", "many"]
+
+
+def test_visible_fraction_digits_pick_the_category():
+    # `1` has no fraction digits, so it is `one`; `1.0` shows one, so English treats it as `other`
+    assert plural_operands(1) == (1, 1, 0, 0, 0, 0, 0)
+    assert plural_operands(1.50) == (1.5, 1, 1, 1, 5, 5, 0)
+    assert (plural_rule("en")(1), plural_rule("en")(1.0)) == ("one", "other")
+
+
+def test_locales_fall_back_to_their_language_rules():
+    assert plural_rule("ru_RU") is plural_rule("ru")
+    assert plural_rule("pt-PT")(0) == "other" and plural_rule("pt_BR")(0) == "one"
+    assert plural_rule("xx") is None and plural_rule(None) is None
+
+
+def test_messages_render_the_locale_category(generate):
+    module = generate(
+        {
+            "en_US": {"files": "{count, plural, one{# file} other{# files}}", "@files": COUNT},
+            "ru_RU": {"files": "{count, plural, one{# файл} few{# файла} many{# файлов} other{# файла}}"},
+        }
+    )
+    ru = module.Translator("ru_RU")
+    assert [ru.files(n) for n in (1, 21, 3, 11, 25)] == ["1 файл", "21 файл", "3 файла", "11 файлов", "25 файлов"]
+    assert [module.Translator("en_US").files(n) for n in (1, 21)] == ["1 file", "21 files"]
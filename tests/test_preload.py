@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from pyARB.exceptions import InvalidFormat
+from pyARB.localize import read_arbs
+
+COUNT = {"placeholders": {"count": {"type": "int"}}}
+ARBS = {
+    "en_US": {
+        "hello": "Hello",
+        "items": "{count, plural, one{# item} other{# items}}",
+        "@items": COUNT,
+        "bye": "Bye",
+    },
+    "es_ES": {"hello": "Hola", "items": "{count, plural, one{# cosa} other{# cosas}}"},
+    "pt_BR": {"hello": "Olá", "items": "{count, plural, one{# coisa} other{# coisas}}", "bye": "Tchau"},
+    "de_DE": {"items": "{count, plural, one{# Ding} other{# Dinge}}"},
+}
+
+
+def _renders(module):
+    return {
+        lang.name: (translator.hello(), translator.items(1), translator.items(3), translator.bye())
+        for lang in module.Lang
+        for translator in [module.Translator(lang)]
+    }
+
+
+def test_parallel_preload_matches_a_serial_load(generate):
+    serial, parallel = generate(ARBS), generate(ARBS)
+    serial.preload()
+    parallel.preload(workers=2)
+    # Each module has its own Lang, so the results are compared by name
+    assert {l.name for l in parallel.TRANSLATIONS._tables} == {l.name for l in serial.TRANSLATIONS._tables} == set(ARBS)
+    missing = {l.name: keys for l, keys in serial.TRANSLATIONS.missing_keys().items()}
+    assert {l.name: keys for l, keys in parallel.TRANSLATIONS.missing_keys().items()} == missing
+    assert _renders(parallel) == _renders(serial)
+    assert _renders(serial)["de_DE"] == ("Hello", "1 Ding", "3 Dinge", "Bye")
+
+
+def test_parallel_read_keeps_order_and_reports_the_first_error(tmp_path):
+    files = {}
+    for locale, arb in ARBS.items():
+        files[locale] = str(tmp_path / (locale + ".arb"))
+        (tmp_path / (locale + ".arb")).write_text(json.dumps(arb, ensure_ascii=False), encoding="utf-8")
+    serial, parallel = read_arbs(files), read_arbs(files, workers=2)
+    assert list(parallel) == list(serial) == list(ARBS)
+    assert {l: sorted(t) for l, t in parallel.items()} == {l: sorted(t) for l, t in serial.items()}
+
+    for locale in ("es_ES", "de_DE"):
+        (tmp_path / (locale + ".arb")).write_text(json.dumps({"items": "{count, plural, one{# %s}}" % locale}))
+    with pytest.raises(InvalidFormat, match="es_ES"):
+        read_arbs(files, workers=2)
@@ -0,0 +1,53 @@
+import json
+import time
+
+EN = {
+    "followers": "{count} followers",
+    "@followers": {"placeholders": {"count": {"type": "int"}}},
+    "cancel": "Cancel",
+}
+ES = {"followers": "{count} seguidores", "cancel": "Cancelar"}
+
+
+def _write(tmp_path, locale, arb):
+    (tmp_path / "arbs" / (locale + ".arb")).write_text(json.dumps(arb, ensure_ascii=False), encoding="utf-8")
+
+
+def test_reload_picks_up_edited_arb_files(generate, tmp_path):
+    module = generate({"en_US": EN, "es_ES": ES})
+    es = module.Translator("es_ES")
+    module.enable_render_cache()
+    try:
+        assert es.followers(3) == "3 seguidores"
+        _write(tmp_path, "es_ES", {**ES, "followers": "{count} personas te siguen"})
+        assert es.followers(3) == "3 seguidores"
+        assert module.reload_translations() == [module.Lang.es_ES]
+        # The cached render is dropped along with the old table
+        assert es.followers(3) == "3 personas te siguen"
+        assert module.reload_translations() == []
+    finally:
+        module.disable_render_cache()
+
+
+def test_fallbacks_follow_a_reloaded_primary_locale(generate, tmp_path):
+    module = generate({"en_US": EN, "es_ES": {"followers": "{count} seguidores"}})
+    es = module.Translator("es_ES")
+    assert es.cancel() == "Cancel"
+    _write(tmp_path, "en_US", {**EN, "cancel": "Dismiss"})
+    module.reload_translations("en_US")
+    assert es.cancel() == "Dismiss"
+
+
+def test_auto_reload_swaps_in_edited_arb_files(generate, tmp_path):
+    module = generate({"en_US": EN, "es_ES": ES})
+    es = module.Translator("es_ES")
+    assert es.cancel() == "Cancelar"
+    module.auto_reload(interval=0.01)
+    try:
+        _write(tmp_path, "es_ES", {**ES, "cancel": "Anular"})
+        deadline = time.monotonic() + 5
+        while es.cancel() != "Anular" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert es.cancel() == "Anular"
+    finally:
+        module.stop_auto_reload()
@@ -0,0 +1,49 @@
+import pytest
+
+EN = {
+    "followers": "{count, plural, =0{No followers} one{# follower} other{# followers}}",
+    "@followers": {"placeholders": {"count": {"type": "int", "format": "compact"}}},
+    "greeting": "{name} says {mood, select, happy{hi!} other{hello}}",
+    "@greeting": {"placeholders": {"name": {"type": "String"}, "mood": {"type": "String"}}},
+    "balance": "Balance: {amount}",
+    "@balance": {
+        "placeholders": {
+            "amount": {"type": "double", "format": "currency", "optionalParameters": {"name": "EUR"}}
+        }
+    },
+    "cancel": "Cancel",
+}
+ES = {
+    "followers": "{count, plural, =0{Sin seguidores} one{# seguidor} other{# seguidores}}",
+    "greeting": "{name} dice {mood, select, happy{¡hola!} other{buenas}}",
+    "cancel": "Cancelar",
+}
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"specialize": True}, {"binary_catalog": True}, {"lazy_methods": True}], ids=str
+)
+def test_render_many_matches_single_calls(generate, options):
+    module = generate({"en_US": EN, "es_ES": ES}, **options)
+    for lang in module.Lang:
+        t = module.Translator(lang)
+        items = [
+            ("followers", (0,)),
+            ("followers", (1,)),
+            ("followers", {"count": 25_300}),
+            ("greeting", ("Ann", "happy")),
+            ("greeting", {"mood": "grumpy", "name": "Bob"}),
+            ("balance", (12.5,)),
+            "cancel",
+        ]
+        expected = [
+            t.followers(0),
+            t.followers(1),
+            t.followers(25_300),
+            t.greeting("Ann", "happy"),
+            t.greeting("Bob", "grumpy"),
+            t.balance(12.5),
+            t.cancel(),
+        ]
+        assert t.render_many(items) == expected
+        assert module.Translator.render_many_static(lang.value, items) == expected
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+ARB = {
+    "stockChange": "{stock} moved {pnl} on {day}",
+    "@stockChange": {
+        "placeholders": {
+            "stock": {"type": "String"},
+            "pnl": {"type": "double", "format": "decimalPercentPattern", "optionalParameters": {"decimalDigits": 2}},
+            "day": {"type": "DateTime", "format": "yMMMd"},
+        }
+    },
+    "followers": "{count, plural, =0{No followers} one{{count} follower} other{{count} followers}}",
+    "@followers": {"placeholders": {"count": {"type": "int", "format": "compact"}}},
+}
+
+
+def test_specialized_formatters_render_like_the_runtime(generate):
+    arbs = {"en_US": ARB, "es_ES": ARB}
+    runtime = generate(arbs).Translator
+    specialized = generate(arbs, specialize=True).Translator
+    day = datetime(2024, 3, 9, 15, 30)
+    for lang in arbs:
+        for digits in (None, 2, 0, 4):
+            extra = {} if digits is None else {"pnl_decimal_digits": digits}
+            expected = runtime.stock_change_static(lang, "ACME", 0.123456, day, **extra)
+            assert specialized.stock_change_static(lang, "ACME", 0.123456, day, **extra) == expected
+        for count in (0, 1, 1500, 2_000_000):
+            assert specialized.followers_static(lang, count) == runtime.followers_static(lang, count)
+
+
+def test_constant_formatters_are_bound_once(generate, tmp_path):
+    generate({"en_US": ARB}, specialize=True)
+    source = (tmp_path / "generated_components.py").read_text(encoding="utf-8")
+    bound = "_en_US_stock_change__pnl = number_formatter(\"en_US\", NumFormat.decimalPercentPattern, decimalDigits=2)"
+    assert bound in source
+    assert '_en_US_stock_change__day = date_formatter("en_US", "yMMMd").format' in source
+    assert "_en_US_followers__count = number_formatter(\"en_US\", NumFormat.compact).format" in source
+    # Only an overridden decimalDigits looks the formatter up while rendering
+    assert source.count("number_formatter(") == 3
@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from pyARB.localize import Plural, PlaceholderNum
+
+ARB = {
+    "notificationRequestedToFollow": (
+        "@{username} {count, plural, offset:1 zero{has requested to follow you} one{and 1 other user has requested "
+        "to follow you} other{and # other users have requested to follow you}}!"
+    ),
+    "@notificationRequestedToFollow": {
+        "placeholders": {"username": {"type": "String"}, "count": {"type": "int", "format": "compact"}}
+    },
+}
+ES = {
+    "notificationRequestedToFollow": (
+        "@{username} {count, plural, offset:1 zero{te quiere seguir} one{y 1 usuario más te quieren seguir} "
+        "other{y # usuarios más te quieren seguir}}!"
+    ),
+}
+
+
+def _state(module):
+    plurals = [
+        (p.offset, dict(p.exact), dict(p.cases))
+        for lang in module.Lang
+        for p in module.TRANSLATIONS[lang]["notificationRequestedToFollow"].parts
+        if isinstance(p, Plural)
+    ]
+    numbers = [
+        (p.format, dict(p.optional_parameters), dict(p._formatters))
+        for p in module.PLACEHOLDERS["notificationRequestedToFollow"].values()
+        if isinstance(p, PlaceholderNum)
+    ]
+    return plurals, numbers
+
+
+def test_shared_definitions_render_concurrently(generate):
+    module = generate({"en_US": ARB, "es_ES": ES})
+    Translator, Lang = module.Translator, module.Lang
+    message = module.TRANSLATIONS[Lang.en_US]["notificationRequestedToFollow"]
+    definitions = module.PLACEHOLDERS["notificationRequestedToFollow"]
+    jobs = [(f"user{i}", i * 997) for i in range(2000)]
+    expected = [message.render(definitions, values) for values in jobs]
+    expected_es = [Translator.notification_requested_to_follow_static(Lang.es_ES, *values) for values in jobs]
+    before = _state(module)
+
+    t = Translator(Lang.es_ES)
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        for _ in range(10):
+            assert list(pool.map(lambda values: message.render(definitions, values), jobs)) == expected
+            assert list(pool.map(lambda values: t.notification_requested_to_follow(*values), jobs)) == expected_es
+
+    assert expected[2] == "@user2 and 2k other users have requested to follow you!"
+    assert _state(module) == before
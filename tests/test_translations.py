@@ -0,0 +1,42 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pyARB.localize
+
+ARBS = {"en_US": {"hello": "Hello"}, "es_ES": {"hello": "Hola"}, "pt_BR": {"hello": "Olá"}}
+
+
+def test_locales_load_once_on_first_use(generate, monkeypatch):
+    module = generate(ARBS)
+    reads = Counter()
+    read_arb = pyARB.localize.read_arb
+
+    def slow_read(path, locale):
+        reads[locale] += 1
+        # Keeps the first reader inside the lock while the other threads arrive
+        time.sleep(0.05)
+        return read_arb(path, locale)
+
+    monkeypatch.setattr(pyARB.localize, "read_arb", slow_read)
+    assert not module.TRANSLATIONS._tables
+    start = threading.Barrier(16)
+
+    def render(_):
+        start.wait()
+        return module.Translator("es_ES").hello()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        assert set(pool.map(render, range(16))) == {"Hola"}
+    # es_ES falls back to en_US, so the primary locale is read too, and both only once
+    assert reads == {"es_ES": 1, "en_US": 1}
+    assert list(module.TRANSLATIONS._tables) == [module.Lang.es_ES]
+
+
+def test_preload_loads_the_given_langs_now(generate):
+    module = generate(ARBS)
+    module.preload("pt_BR")
+    assert list(module.TRANSLATIONS._tables) == [module.Lang.pt_BR]
+    module.preload()
+    assert set(module.TRANSLATIONS._tables) == set(module.Lang)
@@ -0,0 +1,29 @@
+import os
+
+from pyARB import localization_generator
+
+
+def test_watch_picks_up_edits_made_while_generating(tmp_path, monkeypatch):
+    arb = tmp_path / "en_US.arb"
+    arb.write_text('{"hello": "Hello"}', encoding="utf-8")
+    runs = []
+
+    def generate(arb_location, locales, **options):
+        runs.append(arb.read_text(encoding="utf-8"))
+        if len(runs) == 1:
+            # A missing arb file is created by the run, and the primary one edited while it runs
+            (tmp_path / "es_ES.arb").write_text('{"hello": "Hello"}', encoding="utf-8")
+            arb.write_text('{"hello": "Hi"}', encoding="utf-8")
+            os.utime(arb, ns=(1, 1))
+
+    sleeps = []
+
+    def sleep(interval):
+        if len(sleeps) == 3:
+            raise KeyboardInterrupt
+        sleeps.append(interval)
+
+    monkeypatch.setattr(localization_generator, "generate_localizations", generate)
+    monkeypatch.setattr(localization_generator.time, "sleep", sleep)
+    localization_generator.watch_localizations(str(tmp_path), ["en_US", "es_ES"])
+    assert runs == ['{"hello": "Hello"}', '{"hello": "Hi"}']